@@ -15,8 +15,11 @@ from .base import (
     ExchangeOrderResponse,
     ExchangePosition,
     ExchangeTicker,
+    TickerArray,
     ExchangeBalance,
     ExchangeOrder,
+    DashboardSnapshot,
+    RawView,
     PositionSide,
     TradingType,
 )
@@ -39,8 +42,11 @@ __all__ = [
     "ExchangeOrderResponse",
     "ExchangePosition",
     "ExchangeTicker",
+    "TickerArray",
     "ExchangeBalance",
     "ExchangeOrder",
+    "DashboardSnapshot",
+    "RawView",
     "PositionSide",
     "TradingType",
 
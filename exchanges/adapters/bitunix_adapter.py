@@ -6,6 +6,7 @@ a unified interface that conforms to ExchangeInterface.
 """
 
 import threading
+from dataclasses import asdict
 from typing import List, Any, Callable, Tuple
 from ..base import ExchangeInterface, PositionSide, ExchangeOrderRequest
 from ..utils.logging import ExchangeLogger
@@ -30,13 +31,12 @@ class BitUnixAdapter(ExchangeInterface):
         """Initialize the adapter with a BitUnixExchange instance."""
         super().__init__()
         self._exchange = BitUnixExchange()
-        self._init_logger()
 
     def get_name(self) -> str:
         """Get the name of the exchange."""
         return "BitUnix"
 
-    def get_symbol_format(self, base_symbol: str) -> str:
+    def _get_symbol_format_impl(self, base_symbol: str) -> str:
         """
         Convert a base symbol to BitUnix format.
         E.g., 'BTC' -> 'BTCUSDT'
@@ -46,31 +46,6 @@ class BitUnixAdapter(ExchangeInterface):
             return base_symbol
         return f"{base_symbol}USDT"
 
-    def translate_side_to_exchange(self, side: str) -> str:
-        """
-        Translate standard side to BitUnix format.
-        BitUnix uses 'BUY' for long and 'SELL' for short.
-        """
-        if side == PositionSide.LONG:
-            return "BUY"
-        elif side == PositionSide.SHORT:
-            return "SELL"
-        else:
-            # If already in BitUnix format, return as-is
-            return side
-
-    def translate_side_from_exchange(self, exchange_side: str) -> str:
-        """
-        Translate BitUnix side to standard format.
-        """
-        if exchange_side.upper() == "BUY":
-            return PositionSide.LONG
-        elif exchange_side.upper() == "SELL":
-            return PositionSide.SHORT
-        else:
-            # Default to original if unknown
-            return exchange_side
-
     # Market Data Methods
     def fetchTickers(self, completion: Callable[[Tuple[str, Any]], None]):
         """Fetch all available tickers from BitUnix."""
@@ -80,6 +55,14 @@ class BitUnixAdapter(ExchangeInterface):
         """Subscribe to real-time ticker updates for a symbol."""
         self._exchange.subscribeToTicker(symbol)
 
+    def subscribeToTickers(self, symbols: List[str]):
+        """Subscribe to real-time ticker updates for several symbols at once."""
+        self._exchange.subscribeToTickers(symbols)
+
+    def _resubscribe_ticker(self, symbol: str):
+        """Revive a quiet ticker feed on the wrapped exchange."""
+        self._exchange._resubscribe_ticker(symbol)
+
     def lastTradePrice(self, symbol: str) -> float:
         """Get the last trade price for a symbol."""
         return self._exchange.lastTradePrice(symbol)
@@ -167,10 +150,10 @@ class BitUnixAdapter(ExchangeInterface):
             status, data = result
             if status == "success":
                 ExchangeLogger.log_order_placement(
-                    self.logger, request.__dict__, True, data.rawResponse if hasattr(
+                    self.logger, asdict(request), True, data.rawResponse if hasattr(
                         data, 'rawResponse') else data)
             else:
-                ExchangeLogger.log_order_placement(self.logger, request.__dict__, False, str(data))
+                ExchangeLogger.log_order_placement(self.logger, asdict(request), False, str(data))
             completion(result)
 
         self._exchange.placeOrder(request, logged_completion)
@@ -186,8 +169,7 @@ class BitUnixAdapter(ExchangeInterface):
             status, data = result
             ExchangeLogger.log_order_cancellation(
                 self.logger, orderID or clOrderID, symbol, status == "success", data)
-            if completion:
-                completion(result)
+            self._complete(completion, *result)
 
         self._exchange.cancelOrder(orderID, clOrderID, symbol, logged_completion)
 
@@ -235,6 +217,8 @@ class BitUnixAdapter(ExchangeInterface):
                     completion: Callable[[Tuple[str, Any]], None] = None):
         """Set leverage for a symbol on BitUnix."""
         if completion:
+            completion = self._invalidate_on_success(
+                completion, "fetchLeverageAndMarginMode", (symbol, marginCoin))
             self._exchange.setLeverage(symbol, leverage, marginCoin, completion)
 
     # Utility Methods
@@ -287,8 +271,20 @@ class BitUnixAdapter(ExchangeInterface):
 
     def validateAndAdjustPrice(self, symbol: str, price: float, side: str) -> float:
         """Validate and adjust price to meet BitUnix requirements."""
-        current_price = self.getCurrentPrice(symbol)
-
+        return self._adjust_price(symbol, price, side, self.getCurrentPrice(symbol),
+                                  self.get_price_precision(symbol))
+
+    def validateAndAdjustPrices(self, symbols: List[str], prices: List[float],
+                                sides: List[str]) -> List[float]:
+        """Validate a batch of prices, looking up each symbol's market data once."""
+        market = {symbol: (self.getCurrentPrice(symbol), self.get_price_precision(symbol))
+                  for symbol in set(symbols)}
+        return [self._adjust_price(symbol, price, side, *market[symbol])
+                for symbol, price, side in zip(symbols, prices, sides)]
+
+    def _adjust_price(self, symbol: str, price: float, side: str,
+                      current_price: float, precision: int) -> float:
+        """Apply BitUnix price bounds given the symbol's current price and precision."""
         # BitUnix has strict price requirements
         if side.upper() in ['BUY', 'LONG']:
             # For buy orders, price must be within a reasonable range of current price
@@ -309,7 +305,6 @@ class BitUnixAdapter(ExchangeInterface):
                 price = adjusted_price
 
         # Round to price precision
-        precision = self.get_price_precision(symbol)
         return round(price, precision)
 
     # Quantity Management Methods
@@ -6,6 +6,7 @@ a unified interface that conforms to ExchangeInterface.
 """
 
 import threading
+from dataclasses import asdict
 from typing import List, Any, Callable, Tuple
 from ..base import ExchangeInterface, PositionSide, ExchangeOrderRequest
 from ..utils.logging import ExchangeLogger
@@ -30,13 +31,12 @@ class LMEXAdapter(ExchangeInterface):
         """Initialize the adapter with an LMEXExchange instance."""
         super().__init__()
         self._exchange = LMEXExchange()
-        self._init_logger()
 
     def get_name(self) -> str:
         """Get the name of the exchange."""
         return "LMEX"
 
-    def get_symbol_format(self, base_symbol: str) -> str:
+    def _get_symbol_format_impl(self, base_symbol: str) -> str:
         """
         Convert a base symbol to LMEX format.
         E.g., 'BTC' -> 'BTC-PERP'
@@ -49,31 +49,6 @@ class LMEXAdapter(ExchangeInterface):
             base_symbol = base_symbol[:-4]
         return f"{base_symbol}-PERP"
 
-    def translate_side_to_exchange(self, side: str) -> str:
-        """
-        Translate standard side to LMEX format.
-        LMEX uses 'BUY' for long and 'SELL' for short.
-        """
-        if side == PositionSide.LONG:
-            return "BUY"
-        elif side == PositionSide.SHORT:
-            return "SELL"
-        else:
-            # If already in LMEX format, return as-is
-            return side
-
-    def translate_side_from_exchange(self, exchange_side: str) -> str:
-        """
-        Translate LMEX side to standard format.
-        """
-        if exchange_side.upper() == "BUY":
-            return PositionSide.LONG
-        elif exchange_side.upper() == "SELL":
-            return PositionSide.SHORT
-        else:
-            # Default to original if unknown
-            return exchange_side
-
     # Market Data Methods
     def fetchTickers(self, completion: Callable[[Tuple[str, Any]], None]):
         """Fetch all available tickers from LMEX."""
@@ -83,6 +58,10 @@ class LMEXAdapter(ExchangeInterface):
         """Subscribe to real-time ticker updates for a symbol."""
         self._exchange.subscribeToTicker(symbol)
 
+    def _resubscribe_ticker(self, symbol: str):
+        """LMEX prices are not streamed, so there is no ticker feed to revive."""
+        pass
+
     def lastTradePrice(self, symbol: str) -> float:
         """Get the last trade price for a symbol."""
         return self._exchange.lastTradePrice(symbol)
@@ -109,7 +88,7 @@ class LMEXAdapter(ExchangeInterface):
 
     def fetchAccountFeeInfo(self, completion: Callable[[Tuple[str, Any]], None]):
         """Fetch account fee information including VIP level from LMEX."""
-        self._exchange.fetchAccountFeeInfo(completion)
+        self._exchange.fetchAccountFeeInfo(self._with_fee_ppm(completion))
 
     # Position Methods
     def fetchPositions(self, completion: Callable[[Tuple[str, Any]], None]):
@@ -170,10 +149,10 @@ class LMEXAdapter(ExchangeInterface):
             status, data = result
             if status == "success":
                 ExchangeLogger.log_order_placement(
-                    self.logger, request.__dict__, True, data.rawResponse if hasattr(
+                    self.logger, asdict(request), True, data.rawResponse if hasattr(
                         data, 'rawResponse') else data)
             else:
-                ExchangeLogger.log_order_placement(self.logger, request.__dict__, False, str(data))
+                ExchangeLogger.log_order_placement(self.logger, asdict(request), False, str(data))
             completion(result)
 
         self._exchange.placeOrder(request, logged_completion)
@@ -189,8 +168,7 @@ class LMEXAdapter(ExchangeInterface):
             status, data = result
             ExchangeLogger.log_order_cancellation(
                 self.logger, orderID or clOrderID, symbol, status == "success", data)
-            if completion:
-                completion(result)
+            self._complete(completion, *result)
 
         self._exchange.cancelOrder(orderID, clOrderID, symbol, logged_completion)
 
@@ -240,6 +218,8 @@ class LMEXAdapter(ExchangeInterface):
         """Set leverage for a symbol on LMEX."""
         # LMEX doesn't use marginCoin parameter
         if completion:
+            completion = self._invalidate_on_success(
+                completion, "fetchLeverageAndMarginMode", (symbol, marginCoin))
             self._exchange.setLeverage(symbol, leverage, marginCoin, completion)
 
     # Utility Methods
@@ -311,7 +291,18 @@ class LMEXAdapter(ExchangeInterface):
         # LMEX uses contracts, not asset amount
         # Get dynamic contract size for this symbol
         contract_size = self._exchange.precision_manager.get_contract_size(symbol)
-
+        return self._to_contracts(qty, contract_size)
+
+    def normalizeQuantities(self, symbols: List[str], qtys: List[float],
+                            prices: List[float]) -> List[float]:
+        """Convert a batch of asset amounts, looking up each contract size once."""
+        precision_manager = self._exchange.precision_manager
+        sizes = {symbol: precision_manager.get_contract_size(symbol) for symbol in set(symbols)}
+        return [self._to_contracts(qty, sizes[symbol]) for symbol, qty in zip(symbols, qtys)]
+
+    @staticmethod
+    def _to_contracts(qty: float, contract_size: float) -> int:
+        """Convert an asset amount to a whole number of contracts."""
         # Convert asset amount to contracts
         contracts = qty / contract_size
 
@@ -5,12 +5,93 @@ This module defines the unified interface that all exchange adapters must implem
 It provides a consistent API for interacting with different exchanges.
 """
 
+import asyncio
+import functools
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Callable, Tuple, List
-from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import (
+    Optional, Dict, Any, Callable, Tuple, List, Iterator, AsyncIterator, Union,
+    TYPE_CHECKING, Protocol, runtime_checkable,
+)
+from array import array
+from dataclasses import dataclass, fields
+from enum import Enum, IntEnum
+
+from .utils.cache import TTLCache
+from .utils.codec import loads
+from .utils.http import create_session
+from .utils.logging import ExchangeLogger
+from .utils.rate_limit import TokenBucket
+
+if TYPE_CHECKING:
+    import logging
+    import requests
+    from .websocket_manager import WebSocketPool
+
+
+class RawView(Mapping):
+    """
+    Read-only view over a raw JSON response body.
+
+    The payload is kept as the compact bytes/str received from the exchange
+    and only decoded the first time a key is read, so response objects that
+    are never inspected do not keep a fully materialized dict alive.
+    """
+
+    __slots__ = ("_payload", "_decoded")
+
+    def __init__(self, payload: Union[bytes, str]):
+        self._payload = payload
+        self._decoded: Optional[Dict[str, Any]] = None
+
+    @property
+    def payload(self) -> Union[bytes, str]:
+        """The undecoded response body"""
+        return self._payload
+
+    def _data(self) -> Dict[str, Any]:
+        if self._decoded is None:
+            self._decoded = loads(self._payload)
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data())
+
+    def __len__(self) -> int:
+        return len(self._data())
+
+    def __repr__(self) -> str:
+        return f"RawView({self._payload!r})"
+
+
+def _slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+
+    Equivalent to @dataclass(slots=True), which needs Python 3.10. Field
+    defaults stay on the dataclass fields (used by the generated __init__,
+    __repr__ and replace()); the class attributes holding them are dropped
+    because they would clash with the slot descriptors. Instances have no
+    per-instance __dict__, which roughly halves their size and keeps
+    attribute access on the fast path.
+    """
+    names = tuple(f.name for f in fields(cls))
+    cls_dict = {k: v for k, v in cls.__dict__.items()
+                if k not in names and k not in ("__dict__", "__weakref__")}
+    cls_dict["__slots__"] = names
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
 
 
 # Data structures
+@_slotted
 @dataclass
 class ExchangeOrderRequest:
     """Unified order request structure"""
@@ -36,6 +117,7 @@ class ExchangeOrderRequest:
     tradingType: str = "PERP"  # "PERP" or "SPOT"
 
 
+@_slotted
 @dataclass
 class ExchangeOrderResponse:
     """Unified order response structure"""
@@ -49,21 +131,59 @@ class ExchangeOrderResponse:
     timeInForce: str
     createTime: int
     clientId: Optional[str] = None
-    rawResponse: Optional[Dict] = None
+    rawResponse: Optional[Mapping] = None  # dict or lazily decoded RawView
 
 
 class ExchangeTicker:
     """Unified ticker structure"""
 
-    def __init__(self, symbol: str):
+    __slots__ = ("symbol", "lastPrice", "bidPrice", "askPrice", "volume", "price")
+
+    def __init__(self, symbol: str, lastPrice: float = 0.0, bidPrice: float = 0.0,
+                 askPrice: float = 0.0, volume: float = 0.0):
         self.symbol = symbol
-        self.lastPrice: float = 0.0
-        self.bidPrice: float = 0.0
-        self.askPrice: float = 0.0
-        self.volume: float = 0.0
-        self.price: float = 0.0  # Alias for lastPrice
+        self.lastPrice: float = lastPrice
+        self.bidPrice: float = bidPrice
+        self.askPrice: float = askPrice
+        self.volume: float = volume
+        self.price: float = lastPrice  # Alias for lastPrice
+
+
+class TickerArray:
+    """
+    Column-oriented view of a ticker list.
+
+    Prices are held in contiguous array('d') columns, so scans over
+    hundreds of symbols (spreads, movers) walk flat memory instead of
+    chasing one object per ticker.
+    """
+
+    __slots__ = ("symbols", "last", "bid", "ask", "volume")
 
+    def __init__(self, symbols: List[str], last: array, bid: array, ask: array,
+                 volume: array):
+        self.symbols = symbols
+        self.last = last
+        self.bid = bid
+        self.ask = ask
+        self.volume = volume
 
+    @classmethod
+    def from_tickers(cls, tickers: List["ExchangeTicker"]) -> "TickerArray":
+        """Build the columns from a list of ExchangeTicker"""
+        return cls(
+            [t.symbol for t in tickers],
+            array("d", [t.lastPrice for t in tickers]),
+            array("d", [t.bidPrice for t in tickers]),
+            array("d", [t.askPrice for t in tickers]),
+            array("d", [t.volume for t in tickers]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
+@_slotted
 @dataclass
 class ExchangePosition:
     """Unified position structure"""
@@ -75,9 +195,10 @@ class ExchangePosition:
     pnlPercentage: float
     positionIdx: Optional[int] = None
     side: Optional[str] = None
-    raw_response: Optional[Dict] = None  # Raw data from exchange
+    raw_response: Optional[Mapping] = None  # Raw data from exchange (dict or RawView)
 
 
+@_slotted
 @dataclass
 class ExchangeBalance:
     """Unified balance structure"""
@@ -87,6 +208,7 @@ class ExchangeBalance:
     locked: float
 
 
+@_slotted
 @dataclass
 class ExchangeOrder:
     """Unified order structure"""
@@ -112,43 +234,52 @@ class ExchangeOrder:
     txType: Optional[str] = None  # "STOP", "TAKEPROFIT"
     # Store raw order type for debugging
     rawOrderType: Optional[str] = None
-    # Store raw response for additional fields
-    rawResponse: Optional[dict] = None
+    # Store raw response for additional fields (dict or RawView)
+    rawResponse: Optional[Mapping] = None
+
+
+@dataclass
+class DashboardSnapshot:
+    """Tickers, positions, balances and open orders fetched together"""
+    tickers: List[ExchangeTicker]
+    positions: List[ExchangePosition]
+    balances: List[ExchangeBalance]
+    orders: List[ExchangeOrder]
+    ts: float
 
 
 # Protocol/Interface definition
-class ExchangeProtocol(ABC):
+@runtime_checkable
+class ExchangeProtocol(Protocol):
     """
-    Abstract base class defining the interface for all exchange implementations.
+    Structural interface shared by all exchange clients.
+
+    This is a typing.Protocol, so exchange classes satisfy it by providing
+    the methods below - they do not need to inherit from it. Use it for
+    type hints; ExchangeInterface is the implementation base class.
     """
 
-    @abstractmethod
     def fetchTickers(self, completion: Callable[[Tuple[str, Any]], None]):
         """Fetch all tickers"""
-        pass
+        ...
 
-    @abstractmethod
     def placeOrder(self, request: ExchangeOrderRequest,
                    completion: Callable[[Tuple[str, Any]], None]):
         """Place an order"""
-        pass
+        ...
 
-    @abstractmethod
     def fetchBalance(self, completion: Callable[[Tuple[str, Any]], None]):
         """Fetch account balance"""
-        pass
+        ...
 
-    @abstractmethod
     def fetchPositions(self, completion: Callable[[Tuple[str, Any]], None]):
         """Fetch open positions"""
-        pass
+        ...
 
-    @abstractmethod
     def fetchOrders(self, completion: Callable[[Tuple[str, Any]], None]):
         """Fetch open orders"""
-        pass
+        ...
 
-    @abstractmethod
     def cancelOrder(
             self,
             orderID: str = None,
@@ -156,7 +287,7 @@ class ExchangeProtocol(ABC):
             symbol: str = None,
             completion=None):
         """Cancel an order"""
-        pass
+        ...
 
 
 # WebSocket Protocol definition
@@ -196,17 +327,20 @@ class WebSocketProtocol(ABC):
         pass
 
     @abstractmethod
-    def get_state(self) -> str:
+    def get_state(self) -> "WebSocketState":
         """Get connection state"""
         pass
 
 
 # Standard position side constants
-class PositionSide:
+class PositionSide(str, Enum):
     """Standard position side constants used across all exchanges"""
     LONG = "LONG"
     SHORT = "SHORT"
 
+    def __str__(self) -> str:
+        return self.value
+
 
 # Trading type constants
 class TradingType:
@@ -247,14 +381,19 @@ class WebSocketMessage:
 
 
 # WebSocket connection states
-class WebSocketState:
-    """WebSocket connection states"""
-    DISCONNECTED = "disconnected"
-    CONNECTING = "connecting"
-    CONNECTED = "connected"
-    AUTHENTICATED = "authenticated"
-    RECONNECTING = "reconnecting"
-    ERROR = "error"
+class WebSocketState(IntEnum):
+    """WebSocket connection states (use .name for logging)"""
+    DISCONNECTED = 0
+    CONNECTING = 1
+    CONNECTED = 2
+    AUTHENTICATED = 3
+    RECONNECTING = 4
+    ERROR = 5
+
+
+# Fee rates as integers: parts per million of notional (1 bp = 100 ppm).
+# BitUnix VIP tiers go down to 0.16 bp, so whole basis points are too coarse.
+FEE_PPM_SCALE = 1_000_000
 
 
 class ExchangeInterface(ABC):
@@ -266,20 +405,219 @@ class ExchangeInterface(ABC):
     Status is either "success" or "failure", and data is the result or exception.
     """
 
+    # Side translation tables used by translate_side_*; override per exchange
+    SIDE_TO_EXCHANGE: Dict[str, str] = {
+        PositionSide.LONG: "BUY",
+        PositionSide.SHORT: "SELL",
+    }
+    SIDE_FROM_EXCHANGE: Dict[str, str] = {  # upper-case keys; lookups ignore case
+        "BUY": PositionSide.LONG,
+        "SELL": PositionSide.SHORT,
+    }
+
+    # Upper bound on memoized get_symbol_format() results
+    SYMBOL_FORMAT_CACHE_SIZE: int = 4096
+
+    # Request rate limit applied to order entry (placeOrder/cancelOrder)
+    RATE_LIMIT_OPS_PER_SEC: float = 10
+    RATE_LIMIT_BURST: int = 20
+
+    # Lifetimes (seconds) of cached slow-changing account data
+    FEE_INFO_TTL: float = 3600
+    POSITION_TIERS_TTL: float = 86400
+    LEVERAGE_TTL: float = 3600
+
+    # Seconds after which a cached price triggers a background refresh; at
+    # most one refresh per symbol is started in each such window
+    PRICE_STALE_AFTER: float = 5.0
+
+    # Keep-alive connections held per host by the shared HTTP session
+    HTTP_POOL_SIZE: int = 32
+
+    # Bound per subclass in __init_subclass__
+    logger: "logging.Logger"
+
+    def __init_subclass__(cls, **kwargs):
+        """Bind the exchange logger once per class, e.g. BitUnixAdapter -> 'BitUnix'"""
+        super().__init_subclass__(**kwargs)
+        name = cls.__name__
+        for suffix in ("Adapter", "Exchange"):
+            if name.endswith(suffix) and name != suffix:
+                name = name[:-len(suffix)]
+                break
+        cls.logger = ExchangeLogger.get_logger(name)
+
+    def __init__(self):
+        self._session: Optional["requests.Session"] = None
+        self._symbol_format_cache: Dict[str, str] = {}
+        self._ttl_caches: Dict[str, TTLCache] = {}
+        self._price_cache: Dict[str, float] = {}
+        self._price_cache_ts: Dict[str, int] = {}  # time.monotonic_ns()
+        self._price_refreshing: set = set()
+        self._price_refresh_ts: Dict[str, int] = {}  # last refresh start, monotonic_ns
+        self._price_refresh_lock = threading.Lock()  # guards the two fields above
+        self._streamed_symbols: set = set()  # symbols with a ticker subscription
+        self._limiter = TokenBucket(
+            rate=self.RATE_LIMIT_OPS_PER_SEC, burst=self.RATE_LIMIT_BURST)
+
+    @property
+    def _http(self) -> "requests.Session":
+        """Shared keep-alive HTTP session, created on first use"""
+        if self._session is None:
+            self._session = create_session(self.HTTP_POOL_SIZE)
+        return self._session
+
+    def close(self):
+        """Close pooled HTTP connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _throttle(self, tokens: int = 1):
+        """
+        Wait for rate-limit budget before sending order traffic.
+
+        Batch endpoints should pass the number of orders in the batch so
+        one HTTP call is charged its full cost.
+        """
+        self._limiter.acquire(tokens)
+
+    @staticmethod
+    def _complete(completion: Optional[Callable[[Tuple[str, Any]], None]],
+                  status: str, data: Any):
+        """Report (status, data) to an optional completion callback"""
+        if completion is not None:
+            completion((status, data))
+
+    def _cached_fetch(self, name: str, key: Tuple, ttl: float,
+                      fetch: Callable[[Callable[[Tuple[str, Any]], None]], None],
+                      completion: Callable[[Tuple[str, Any]], None]):
+        """
+        Serve a callback-style fetch from the TTL cache named `name`.
+
+        On a miss `fetch` is called with a completion that stores
+        successful results before passing them on; failures are not cached.
+        """
+        cache = self._ttl_caches.get(name)
+        if cache is None:
+            cache = self._ttl_caches.setdefault(name, TTLCache(ttl))
+
+        hit, value = cache.get(key)
+        if hit:
+            completion(("success", value))
+            return
+
+        def store(result: Tuple[str, Any]):
+            if result[0] == "success":
+                cache.set(key, result[1])
+            completion(result)
+
+        fetch(store)
+
+    def invalidate_cache(self, name: str, key: Optional[Tuple] = None):
+        """Drop one entry, or the whole cache when key is None"""
+        cache = self._ttl_caches.get(name)
+        if cache is None:
+            return
+        if key is None:
+            cache.clear()
+        else:
+            cache.pop(key)
+
+    def _invalidate_on_success(self, completion: Optional[Callable[[Tuple[str, Any]], None]],
+                               name: str, key: Tuple) -> Callable[[Tuple[str, Any]], None]:
+        """Wrap a mutating call's completion so it invalidates a cached entry"""
+        def wrapped(result: Tuple[str, Any]):
+            if result[0] == "success":
+                self.invalidate_cache(name, key)
+            self._complete(completion, *result)
+        return wrapped
+
+    def cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """Hit/miss counters and hit rate for each TTL cache"""
+        return {
+            name: {"hits": cache.hits, "misses": cache.misses, "hit_rate": cache.hit_rate}
+            for name, cache in self._ttl_caches.items()
+        }
+
+    @staticmethod
+    def fee_rate_to_ppm(rate: float) -> int:
+        """Convert a decimal fee rate (0.0002) to integer parts per million (200)"""
+        return round(rate * FEE_PPM_SCALE)
+
+    @staticmethod
+    def fee_amount(notional: int, fee_ppm: int) -> int:
+        """
+        Exact fee for a fixed-point notional, in the notional's units.
+
+        E.g. with USDT held as integer micro-USDT:
+        fee_amount(1_000_000_000, 200) == 200_000 (0.2 USDT on 1000 USDT).
+        Rebates (negative rates) round toward negative infinity.
+        """
+        return notional * fee_ppm // FEE_PPM_SCALE
+
+    def _with_fee_ppm(self, completion: Callable[[Tuple[str, Any]], None]
+                      ) -> Callable[[Tuple[str, Any]], None]:
+        """Wrap a fetchAccountFeeInfo completion to add makerFeePpm/takerFeePpm"""
+        def wrapped(result: Tuple[str, Any]):
+            status, data = result
+            if status == "success" and isinstance(data, dict):
+                for key in ("makerFee", "takerFee"):
+                    if data.get(key) is not None:
+                        data[key + "Ppm"] = self.fee_rate_to_ppm(data[key])
+            completion(result)
+        return wrapped
+
+    def fetchAccountFeeInfoCached(self, completion: Callable[[Tuple[str, Any]], None]):
+        """fetchAccountFeeInfo() served from a cache for FEE_INFO_TTL seconds"""
+        self._cached_fetch("fetchAccountFeeInfo", (), self.FEE_INFO_TTL,
+                           self.fetchAccountFeeInfo, completion)
+
+    def fetchPositionTiersCached(self, symbol: str,
+                                 completion: Callable[[Tuple[str, Any]], None]):
+        """fetchPositionTiers() served from a cache for POSITION_TIERS_TTL seconds"""
+        self._cached_fetch("fetchPositionTiers", (symbol,), self.POSITION_TIERS_TTL,
+                           lambda done: self.fetchPositionTiers(symbol, done), completion)
+
+    def fetchLeverageAndMarginModeCached(self, symbol: str, marginCoin: str,
+                                         completion: Callable[[Tuple[str, Any]], None]):
+        """
+        fetchLeverageAndMarginMode() served from a cache for LEVERAGE_TTL seconds.
+
+        Entries are dropped when setLeverage() succeeds for the same symbol.
+        """
+        self._cached_fetch(
+            "fetchLeverageAndMarginMode", (symbol, marginCoin), self.LEVERAGE_TTL,
+            lambda done: self.fetchLeverageAndMarginMode(symbol, marginCoin, done),
+            completion)
+
     @abstractmethod
     def get_name(self) -> str:
         """Get the name of the exchange (e.g., 'BitUnix', 'LMEX')"""
         pass
 
-    @abstractmethod
     def get_symbol_format(self, base_symbol: str) -> str:
         """
         Convert a base symbol to exchange-specific format.
         E.g., 'BTCUSDT' for BitUnix, 'BTC-PERP' for LMEX
+
+        Results are memoized per instance, up to SYMBOL_FORMAT_CACHE_SIZE
+        symbols; exchanges implement _get_symbol_format_impl() instead of
+        overriding this method.
         """
-        pass
+        try:
+            return self._symbol_format_cache[base_symbol]
+        except KeyError:
+            formatted = sys.intern(self._get_symbol_format_impl(base_symbol))
+            if len(self._symbol_format_cache) < self.SYMBOL_FORMAT_CACHE_SIZE:
+                self._symbol_format_cache[sys.intern(base_symbol)] = formatted
+            return formatted
 
     @abstractmethod
+    def _get_symbol_format_impl(self, base_symbol: str) -> str:
+        """Uncached symbol conversion used by get_symbol_format()"""
+        pass
+
     def translate_side_to_exchange(self, side: str) -> str:
         """
         Translate standard side (PositionSide.LONG/SHORT) to exchange-specific format.
@@ -288,22 +626,23 @@ class ExchangeInterface(ABC):
             side: PositionSide.LONG or PositionSide.SHORT
 
         Returns:
-            Exchange-specific side string (e.g., 'BUY'/'SELL' for BitUnix)
+            Exchange-specific side string (e.g., 'BUY'/'SELL' for BitUnix).
+            Unknown values are assumed to already be in exchange format.
         """
-        pass
+        return self.SIDE_TO_EXCHANGE.get(side, side)
 
-    @abstractmethod
     def translate_side_from_exchange(self, exchange_side: str) -> str:
         """
         Translate exchange-specific side to standard format.
 
         Args:
-            exchange_side: Exchange-specific side (e.g., 'BUY', 'SELL')
+            exchange_side: Exchange-specific side (e.g., 'BUY', 'Sell'), any case
 
         Returns:
-            Standard side: PositionSide.LONG or PositionSide.SHORT
+            Standard side: PositionSide.LONG or PositionSide.SHORT.
+            Unknown values are returned unchanged.
         """
-        pass
+        return self.SIDE_FROM_EXCHANGE.get(exchange_side.upper(), exchange_side)
 
     # Market Data Methods
     @abstractmethod
@@ -329,6 +668,122 @@ class ExchangeInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def subscribeToTicker(self, symbol: str):
+        """
+        Subscribe to streaming ticker updates for a symbol.
+
+        Implementations feed each last-trade price into _update_price().
+        """
+        pass
+
+    def subscribeToTickers(self, symbols: List[str]):
+        """
+        Subscribe to streaming ticker updates for several symbols.
+
+        The default subscribes one symbol at a time; exchanges override
+        this to send a single subscribe frame for the whole list.
+        """
+        for symbol in symbols:
+            self.subscribeToTicker(symbol)
+
+    def _update_price(self, symbol: str, price: float):
+        """Record a streamed last-trade price for lastTradePrice()"""
+        symbol = sys.intern(symbol)
+        self._price_cache[symbol] = price
+        self._price_cache_ts[symbol] = time.monotonic_ns()
+
+    def _mark_streamed(self, symbols: List[str]):
+        """Record symbols whose prices arrive over a ticker subscription"""
+        self._streamed_symbols.update(symbols)
+
+    def _fresh_price(self, symbol: str, max_age: float) -> float:
+        """Cached price recorded within max_age seconds, else 0.0"""
+        price = self._price_cache.get(symbol)
+        if price is None:
+            return 0.0
+        if time.monotonic_ns() - self._price_cache_ts[symbol] > max_age * 1_000_000_000:
+            return 0.0
+        return price
+
+    def lastTradePrice(self, symbol: str) -> float:
+        """
+        Get the last cached trade price for a symbol, or 0.0 if none yet.
+
+        This never blocks on the network. A price older than
+        PRICE_STALE_AFTER is still returned, but a refresh is started in
+        the background (see _refresh_price).
+        """
+        price = self._price_cache.get(symbol)
+        if price is None:
+            return 0.0
+        age_ns = time.monotonic_ns() - self._price_cache_ts[symbol]
+        if age_ns > self.PRICE_STALE_AFTER * 1_000_000_000:
+            self._refresh_price(symbol)
+        return price
+
+    def getCurrentPrice(self, symbol: str) -> float:
+        """Get current market price for symbol in USD/USDT"""
+        return self.lastTradePrice(symbol)
+
+    def _refresh_price(self, symbol: str):
+        """
+        Refresh a stale price on a background thread, at most once per
+        PRICE_STALE_AFTER per symbol. A subscribed symbol whose feed went
+        quiet is resubscribed; any other symbol is re-fetched over REST,
+        so REST-only clients never open a WebSocket here.
+        """
+        now = time.monotonic_ns()
+        # lastTradePrice runs on many threads; check-and-mark must be atomic
+        with self._price_refresh_lock:
+            if symbol in self._price_refreshing:
+                return
+            if now - self._price_refresh_ts.get(symbol, 0) < self.PRICE_STALE_AFTER * 1_000_000_000:
+                return
+            self._price_refreshing.add(symbol)
+            self._price_refresh_ts[symbol] = now
+
+        def refresh():
+            try:
+                if symbol in self._streamed_symbols:
+                    self._resubscribe_ticker(symbol)
+                else:
+                    self._fetch_price(symbol)
+            except Exception as e:
+                self.logger.warning(f"Price refresh for {symbol} failed: {e}")
+            finally:
+                with self._price_refresh_lock:
+                    self._price_refreshing.discard(symbol)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    @abstractmethod
+    def _resubscribe_ticker(self, symbol: str):
+        """
+        Revive a subscribed ticker feed that has gone quiet.
+
+        subscribeToTicker() does not resend a channel that is already
+        tracked, so implementations unsubscribe and subscribe again
+        (e.g. through the WebSocket manager's resubscribe()).
+        """
+        pass
+
+    def _fetch_price(self, symbol: str):
+        """
+        Refresh the cached price of symbol over REST. The default takes
+        one fetchTickers call and records every price it returns.
+        """
+        result = []
+        self.fetchTickers(result.append)
+        if not result:
+            return
+        status, data = result[0]
+        if status != "success":
+            raise data if isinstance(data, BaseException) else Exception(str(data))
+        for ticker in data:
+            if ticker.lastPrice > 0:
+                self._update_price(ticker.symbol, ticker.lastPrice)
+
     # Trading Methods
     @abstractmethod
     def placeOrder(self, request: ExchangeOrderRequest,
@@ -343,6 +798,44 @@ class ExchangeInterface(ABC):
         """
         pass
 
+    def placeOrders(self, requests: List[ExchangeOrderRequest],
+                    completion: Callable[[Tuple[str, Any]], None]):
+        """
+        Place several orders.
+
+        Reports success with one entry per request, in input order: the
+        ExchangeOrderResponse, or the Exception for an order that failed.
+        The default calls placeOrder() for each request; exchanges with a
+        batch order endpoint override this to make one request per symbol.
+
+        Args:
+            requests: Order requests
+            completion: Callback function that receives (status, data)
+        """
+        if not requests:
+            completion(("success", []))
+            return
+
+        results: List[Any] = [None] * len(requests)
+        remaining = [len(requests)]
+        lock = threading.Lock()
+
+        def make_callback(index: int):
+            def callback(result: Tuple[str, Any]):
+                status, data = result
+                if status != "success" and not isinstance(data, BaseException):
+                    data = Exception(str(data))
+                with lock:
+                    results[index] = data
+                    remaining[0] -= 1
+                    done = remaining[0] == 0
+                if done:
+                    completion(("success", results))
+            return callback
+
+        for index, request in enumerate(requests):
+            self.placeOrder(request, make_callback(index))
+
     @abstractmethod
     def cancelOrder(self,
                     orderID: Optional[str] = None,
@@ -360,6 +853,54 @@ class ExchangeInterface(ABC):
         """
         pass
 
+    def cancelOrders(self,
+                     symbol: str,
+                     orderIDs: List[str] = (),
+                     clOrderIDs: List[str] = (),
+                     completion: Optional[Callable[[Tuple[str, Any]], None]] = None):
+        """
+        Cancel several orders on one symbol.
+
+        The default issues one cancelOrder() per ID and reports success
+        with the list of per-order results, or the first failure. Exchanges
+        with a batch cancel endpoint override this to make one request.
+
+        Args:
+            symbol: Trading symbol
+            orderIDs: Server-assigned order IDs
+            clOrderIDs: Client-assigned order IDs
+            completion: Callback function that receives (status, data)
+        """
+        targets = ([{"orderID": orderID} for orderID in orderIDs] +
+                   [{"clOrderID": clOrderID} for clOrderID in clOrderIDs])
+        if not targets:
+            self._complete(completion, "success", [])
+            return
+
+        results: List[Any] = [None] * len(targets)
+        remaining = [len(targets)]
+        failure: List[Any] = []
+        lock = threading.Lock()
+
+        def make_callback(index: int):
+            def callback(result: Tuple[str, Any]):
+                status, data = result
+                with lock:
+                    results[index] = data
+                    if status != "success" and not failure:
+                        failure.append(data)
+                    remaining[0] -= 1
+                    done = remaining[0] == 0
+                if done:
+                    if failure:
+                        self._complete(completion, "failure", failure[0])
+                    else:
+                        self._complete(completion, "success", results)
+            return callback
+
+        for index, ids in enumerate(targets):
+            self.cancelOrder(symbol=symbol, completion=make_callback(index), **ids)
+
     @abstractmethod
     def fetchOrders(self, completion: Callable[[Tuple[str, Any]], None]):
         """
@@ -405,6 +946,24 @@ class ExchangeInterface(ABC):
         """
         pass
 
+    # Batch Price/Quantity Methods
+    #
+    # Available on exchanges that implement validateAndAdjustPrice() and
+    # normalizeQuantity(). Subclasses override these to hoist per-symbol
+    # lookups (current price, precision, contract size) out of the loop
+    # when placing many grid levels on the same symbols.
+    def validateAndAdjustPrices(self, symbols: List[str], prices: List[float],
+                                sides: List[str]) -> List[float]:
+        """Batch form of validateAndAdjustPrice()"""
+        return [self.validateAndAdjustPrice(symbol, price, side)
+                for symbol, price, side in zip(symbols, prices, sides)]
+
+    def normalizeQuantities(self, symbols: List[str], qtys: List[float],
+                            prices: List[float]) -> List[float]:
+        """Batch form of normalizeQuantity()"""
+        return [self.normalizeQuantity(symbol, qty, price)
+                for symbol, qty, price in zip(symbols, qtys, prices)]
+
     # Position Mode Methods (for futures/derivatives)
     def fetchPositionMode(self, completion: Callable[[Tuple[str, Any]], None]):
         """
@@ -438,7 +997,8 @@ class ExchangeInterface(ABC):
     def connectWebSocket(self,
                          on_message: Callable[[WebSocketMessage], None],
                          on_state_change: Callable[[WebSocketState], None],
-                         on_error: Callable[[Exception], None]) -> bool:
+                         on_error: Callable[[Exception], None],
+                         pool: Optional["WebSocketPool"] = None) -> bool:
         """
         Connect to the exchange WebSocket.
 
@@ -446,6 +1006,8 @@ class ExchangeInterface(ABC):
             on_message: Callback for incoming messages
             on_state_change: Callback for connection state changes
             on_error: Callback for errors
+            pool: Optional pool of pre-warmed connections to draw from
+                  instead of opening a new connection
 
         Returns:
             True if connection initiated successfully
@@ -492,3 +1054,217 @@ class ExchangeInterface(ABC):
     def isWebSocketConnected(self) -> bool:
         """Check if WebSocket is connected and ready"""
         pass
+
+    # Async Methods
+    #
+    # Coroutine counterparts of the callback methods above. Each one runs the
+    # callback-style call in the event loop's default executor and returns
+    # the payload directly, raising the exception on failure, so callers
+    # can await several requests at once with asyncio.gather().
+    @staticmethod
+    def install_fast_loop() -> bool:
+        """
+        Use uvloop's event loop for asyncio when it is installed.
+
+        Call once at startup, before any event loop is created. Returns
+        True if uvloop was installed, False if the stdlib loop is kept.
+        """
+        try:
+            import uvloop
+        except ImportError:  # uvloop is an optional speed-up (the 'fast' extra)
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+
+    @staticmethod
+    def run(main: Any) -> Any:
+        """Run a coroutine on the fastest available event loop"""
+        ExchangeInterface.install_fast_loop()
+        return asyncio.run(main)
+
+    async def _await_completion(self, method: Callable, *args, **kwargs) -> Any:
+        """Await a callback-style exchange method and return its payload"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(result: Tuple[str, Any]):
+            status, data = result
+            if future.done():
+                return
+            if status == "success":
+                future.set_result(data)
+            elif isinstance(data, BaseException):
+                future.set_exception(data)
+            else:
+                future.set_exception(Exception(str(data)))
+
+        def completion(result: Tuple[str, Any]):
+            loop.call_soon_threadsafe(resolve, result)
+
+        await loop.run_in_executor(
+            None, functools.partial(method, *args, completion=completion, **kwargs))
+        return await future
+
+    async def fetchTickersAsync(self) -> List[ExchangeTicker]:
+        """Fetch ticker information for all symbols"""
+        return await self._await_completion(self.fetchTickers)
+
+    async def fetchSymbolInfoAsync(self, symbol: str) -> Any:
+        """Fetch detailed information for a specific symbol"""
+        return await self._await_completion(self.fetchSymbolInfo, symbol)
+
+    async def placeOrderAsync(self, request: ExchangeOrderRequest) -> ExchangeOrderResponse:
+        """Place an order on the exchange"""
+        return await self._await_completion(self.placeOrder, request)
+
+    async def placeOrdersAsync(self, requests: List[ExchangeOrderRequest]) -> List[Any]:
+        """Place several orders; failed entries hold their Exception"""
+        return await self._await_completion(self.placeOrders, requests)
+
+    async def cancelOrderAsync(self,
+                               orderID: Optional[str] = None,
+                               clOrderID: Optional[str] = None,
+                               symbol: Optional[str] = None) -> Any:
+        """Cancel an order by orderID or clOrderID"""
+        return await self._await_completion(
+            self.cancelOrder, orderID=orderID, clOrderID=clOrderID, symbol=symbol)
+
+    async def cancelOrdersAsync(self,
+                                symbol: str,
+                                orderIDs: List[str] = (),
+                                clOrderIDs: List[str] = ()) -> Any:
+        """Cancel several orders on one symbol"""
+        return await self._await_completion(
+            self.cancelOrders, symbol, orderIDs=orderIDs, clOrderIDs=clOrderIDs)
+
+    async def fetchOrdersAsync(self) -> List[ExchangeOrder]:
+        """Fetch all open orders"""
+        return await self._await_completion(self.fetchOrders)
+
+    async def fetchBalanceAsync(self) -> List[ExchangeBalance]:
+        """Fetch account balance information"""
+        return await self._await_completion(self.fetchBalance)
+
+    async def fetchPositionsAsync(self) -> List[ExchangePosition]:
+        """Fetch all open positions"""
+        return await self._await_completion(self.fetchPositions)
+
+    async def fetchAccountEquityAsync(self) -> float:
+        """Fetch total account equity value"""
+        return await self._await_completion(self.fetchAccountEquity)
+
+    async def prefetch_metadata(self, symbols: List[str], marginCoin: str = "USDT"):
+        """
+        Warm the TTL caches for the given symbols at startup.
+
+        Symbols are base symbols; their exchange formats and precompiled
+        order formatters are resolved first. Fee info, and each symbol's
+        position tiers and leverage settings, are then fetched concurrently
+        so the first order on a symbol does not stall on them; later
+        *Cached calls are served from memory.
+        Failures are ignored here and retried on first real use.
+        """
+        symbols = [self.get_symbol_format(symbol) for symbol in symbols]
+        precision_manager = getattr(self, "precision_manager", None)
+        if precision_manager is not None:
+            for symbol in symbols:
+                try:
+                    precision_manager.get_order_formatters(symbol)
+                except Exception as e:
+                    self.logger.debug("Precision prefetch for %s failed: %s", symbol, e)
+        await asyncio.gather(
+            self._await_completion(self.fetchAccountFeeInfoCached),
+            *(self._prefetch_symbol(symbol, marginCoin) for symbol in symbols),
+            return_exceptions=True,
+        )
+
+    async def _prefetch_symbol(self, symbol: str, marginCoin: str):
+        """Fetch one symbol's slow-changing metadata into the TTL caches"""
+        await asyncio.gather(
+            self._await_completion(self.fetchPositionTiersCached, symbol),
+            self._await_completion(self.fetchLeverageAndMarginModeCached, symbol, marginCoin),
+            return_exceptions=True,
+        )
+
+    async def fetchDashboardSnapshotAsync(self) -> DashboardSnapshot:
+        """Fetch tickers, positions, balances and open orders concurrently
+
+        The four requests are in flight at the same time, so a dashboard
+        refresh costs one round-trip instead of four. Exchanges with a
+        combined endpoint can override this to make a single request.
+        """
+        tickers, positions, balances, orders = await asyncio.gather(
+            self.fetchTickersAsync(),
+            self.fetchPositionsAsync(),
+            self.fetchBalanceAsync(),
+            self.fetchOrdersAsync(),
+        )
+        return DashboardSnapshot(tickers, positions, balances, orders, time.time())
+
+    # Optional exchange methods - only available where the exchange
+    # implements the callback version
+    async def fetchHistoryOrdersAsync(self, **kwargs) -> Any:
+        """Fetch order history"""
+        return await self._await_completion(self.fetchHistoryOrders, **kwargs)
+
+    async def fetchHistoryTradesAsync(self, **kwargs) -> Any:
+        """Fetch trade history"""
+        return await self._await_completion(self.fetchHistoryTrades, **kwargs)
+
+    async def iterHistoryOrders(self, page_size: int = 100, **kwargs) -> AsyncIterator[Any]:
+        """Stream order history one page at a time, newest first"""
+        async for row in self._iter_pages(self.fetchHistoryOrders, page_size, **kwargs):
+            yield row
+
+    async def iterHistoryTrades(self, page_size: int = 100, **kwargs) -> AsyncIterator[Any]:
+        """Stream trade history one page at a time, newest first"""
+        async for row in self._iter_pages(self.fetchHistoryTrades, page_size, **kwargs):
+            yield row
+
+    async def _iter_pages(self, method: Callable, page_size: int, **kwargs) -> AsyncIterator[Any]:
+        """
+        Page through a history endpoint that accepts skip/limit.
+
+        The next page is requested before the current one is yielded, so
+        the HTTP call overlaps with the consumer, and at most two pages are
+        held in memory. Paging stops at the first short page.
+        """
+        def request(skip: int) -> "asyncio.Future":
+            return asyncio.ensure_future(
+                self._await_completion(method, skip=skip, limit=page_size, **kwargs))
+
+        skip = 0
+        pending: Optional[asyncio.Future] = request(skip)
+        try:
+            while pending is not None:
+                page = await pending or []
+                pending = None
+                if len(page) >= page_size:
+                    skip += len(page)
+                    pending = request(skip)
+                for row in page:
+                    yield row
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def fetchLeverageAndMarginModeAsync(self, symbol: str, marginCoin: str) -> Any:
+        """Fetch the current leverage and margin mode for a symbol"""
+        return await self._await_completion(
+            self.fetchLeverageAndMarginMode, symbol, marginCoin)
+
+    async def setLeverageAsync(self, symbol: str, leverage: int, **kwargs) -> Any:
+        """Set leverage for a trading pair"""
+        return await self._await_completion(self.setLeverage, symbol, leverage, **kwargs)
+
+    async def fetchAccountFeeInfoAsync(self) -> Dict[str, Any]:
+        """Fetch the account's VIP level and fee rates"""
+        return await self._await_completion(self.fetchAccountFeeInfo)
+
+    async def fetchPositionTiersAsync(self, symbol: str) -> Any:
+        """Fetch position tier information for a symbol"""
+        return await self._await_completion(self.fetchPositionTiers, symbol)
+
+    async def fetchAccountRiskLimitAsync(self, symbol: str) -> Any:
+        """Fetch the account's current risk limit setting for a symbol"""
+        return await self._await_completion(self.fetchAccountRiskLimit, symbol)
@@ -1,7 +1,6 @@
 """BitUnix Exchange Implementation"""
 
 from .base import (
-    ExchangeProtocol,
     ExchangeOrderRequest,
     ExchangeOrderResponse,
     ExchangeTicker,
@@ -9,7 +8,7 @@ from .base import (
     ExchangeBalance,
     ExchangeOrder,
     ExchangeInterface,
-    PositionSide,
+    RawView,
     TradingType,
     WebSocketState,
     WebSocketMessage,
@@ -19,20 +18,28 @@ from .base import (
 from .utils.precision import SymbolPrecisionManager
 from .utils.api_keys import APIKeyStorage
 from .utils.logging import ExchangeLogger
-from .websocket_manager import BaseWebSocketManager, ReconnectConfig
+from .utils.codec import dumps, loads
+from .websocket_manager import BaseWebSocketManager, ReconnectConfig, WebSocketPool
 
-import requests
-from typing import Optional, Type, Dict, Any, List, Callable, Tuple, Set
-import json
+from typing import TYPE_CHECKING, Optional, Type, Dict, Any, List, Callable, Tuple, Set
 import hashlib
+import sys
+import threading
 import time
 import uuid
 import hmac
+import secrets
+import ssl
 import urllib.parse
 import logging
 from dotenv import load_dotenv
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
+
+if TYPE_CHECKING:
+    import requests
 
 # Load environment variables
 load_dotenv()
@@ -55,6 +62,33 @@ class ExchangeWebSocketManagerProtocol:
 logger = ExchangeLogger.get_logger("BitUnix")
 
 
+# Fields an open-order row must carry to be reported by fetchOrders
+_ORDER_REQUIRED_FIELDS = itemgetter("orderId", "symbol", "side", "orderType", "qty", "status")
+
+# Numeric fields summed per position when deriving a balance from positions
+_POSITION_BALANCE_FIELDS = itemgetter("margin", "unrealizedPNL", "entryValue")
+
+
+def _fget(d: Dict[str, Any], key: str) -> float:
+    """Read a numeric field as float, treating missing or malformed values as 0.0"""
+    try:
+        return float(d[key])
+    except (KeyError, ValueError, TypeError):
+        return 0.0
+
+# hashlib.sha256 is OpenSSL's implementation (SHA-NI where the CPU has it)
+_sha256 = hashlib.sha256
+logger.debug("BitUnix: signing with hashlib sha256 from %s", ssl.OPENSSL_VERSION)
+
+
+def _sign_bitunix(msg: bytes, secret: bytes) -> str:
+    """
+    BitUnix double SHA-256 signature: sha256(hex(sha256(msg)) + secret).
+    BitUnix does not accept HMAC, so this is the one-shot form of its own scheme.
+    """
+    return _sha256(_sha256(msg).hexdigest().encode("ascii") + secret).hexdigest()
+
+
 class BitUnixWebSocketManager(BaseWebSocketManager):
     """
     BitUnix WebSocket manager implementation.
@@ -97,6 +131,7 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
         
         # Cache for latest values
         self._ticker_cache: Dict[str, Dict[str, Any]] = {}
+        self._price_listeners: List[Callable[[str, float], None]] = []
         self._order_cache: Dict[str, Dict[str, Any]] = {}
         self._position_cache: Dict[str, Dict[str, Any]] = {}
         self._balance_cache: Dict[str, Any] = {}
@@ -122,6 +157,10 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
             "ch": "ticker"
         }])
     
+    def subscribe_tickers(self, symbols: List[str]) -> bool:
+        """Subscribe to ticker updates for several symbols in one request"""
+        return self.subscribe([{"symbol": symbol, "ch": "ticker"} for symbol in symbols])
+    
     def subscribe_orderbook(self, symbol: str, depth: int = 20) -> bool:
         """Subscribe to order book updates"""
         return self.subscribe([{
@@ -158,6 +197,11 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
             return False
         return self.subscribe([{"ch": "balance"}])
     
+    def add_price_listener(self, listener: Callable[[str, float], None]):
+        """Register a callback invoked with (symbol, last price) on each ticker update"""
+        if listener not in self._price_listeners:
+            self._price_listeners.append(listener)
+    
     def get_cached_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached ticker data for a symbol"""
         return self._ticker_cache.get(symbol)
@@ -181,13 +225,18 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
         # Call parent disconnect
         super().disconnect()
     
+    def _on_close(self, ws, code: int, message: str, custom_callback: Optional[Callable] = None):
+        """Handle close; nothing stays subscribed on a dropped socket"""
+        self._active_subscriptions.clear()
+        super()._on_close(ws, code, message, custom_callback)
+    
     def _authenticate(self, ws):
         """Authenticate for private channels"""
         if not self.api_key or not self.api_secret:
             return
         
         # Generate authentication parameters
-        timestamp = int(time.time() * 1000)
+        timestamp = time.time_ns() // 1_000_000
         nonce = self._generate_nonce()
         
         # Create signature
@@ -209,21 +258,12 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
     
     def _generate_nonce(self) -> str:
         """Generate a 32-character random nonce"""
-        import random
-        import string
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=32))
+        return secrets.token_hex(16)
     
     def _create_signature(self, timestamp: int, nonce: str) -> str:
         """Create authentication signature"""
-        # Step 1: Create first digest
-        first_message = f"{nonce}{timestamp}{self.api_key}"
-        first_digest = hashlib.sha256(first_message.encode()).hexdigest()
-        
-        # Step 2: Create final signature
-        final_message = f"{first_digest}{self.api_secret}"
-        final_signature = hashlib.sha256(final_message.encode()).hexdigest()
-        
-        return final_signature
+        return _sign_bitunix(f"{nonce}{timestamp}{self.api_key}".encode(),
+                             self.api_secret.encode())
     
     def _send_subscription_request(self, channels: List[Dict[str, Any]], subscribe: bool) -> bool:
         """Send subscription/unsubscription request"""
@@ -239,10 +279,10 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
                     filtered_channels.append(channel)
                     self._active_subscriptions.add(sub_key)
                 else:
-                    logger.debug(f"BitUnix: Skipping duplicate subscription for {sub_key}")
+                    logger.debug("BitUnix: Skipping duplicate subscription for %s", sub_key)
             
             if not filtered_channels:
-                logger.debug(f"BitUnix: All {len(channels)} channels already subscribed")
+                logger.debug("BitUnix: All %s channels already subscribed", len(channels))
                 return True
             channels = filtered_channels
         else:
@@ -266,7 +306,7 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
     def _parse_timestamp(self, ts_value: Any) -> int:
         """Parse timestamp from various formats to milliseconds"""
         if ts_value is None:
-            return int(time.time() * 1000)
+            return time.time_ns() // 1_000_000
         
         # If already an integer, return it
         if isinstance(ts_value, int):
@@ -295,10 +335,10 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
                         return int(dt.timestamp() * 1000)
                     except ValueError:
                         logger.warning(f"BitUnix: Unable to parse timestamp: {ts_value}")
-                        return int(time.time() * 1000)
+                        return time.time_ns() // 1_000_000
         
         # Default case
-        return int(time.time() * 1000)
+        return time.time_ns() // 1_000_000
     
     def _process_message(self, message: Dict[str, Any]):
         """Process raw message from WebSocket"""
@@ -311,7 +351,7 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
             # Alternative format
             self._handle_channel_message(message)
         else:
-            logger.debug(f"BitUnix: Unhandled message format: {message}")
+            logger.debug("BitUnix: Unhandled message format: %s", message)
     
     def _handle_operation_response(self, message: Dict[str, Any]):
         """Handle operation responses (login, subscribe, etc.)"""
@@ -369,6 +409,9 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
         """Handle channel data messages"""
         channel = message.get("ch")
         symbol = message.get("symbol")
+        if symbol:
+            # Canonical instance so cache keys compare by identity
+            symbol = sys.intern(symbol)
         data = message.get("data")
         timestamp = self._parse_timestamp(message.get("ts"))
         
@@ -403,6 +446,8 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
         ticker.askPrice = float(data.get("a1", 0)) if "a1" in data else ticker.lastPrice
         ticker.volume = float(data.get("b", 0))
         ticker.price = ticker.lastPrice
+        for listener in self._price_listeners:
+            listener(symbol, ticker.lastPrice)
         
         # Send unified message
         unified_msg = self._create_unified_message(WebSocketChannels.TICKER, symbol, ticker)
@@ -548,6 +593,12 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
             self.connect_public()
         self.subscribe_ticker(symbol)
     
+    def subscribeToTickers(self, symbols: list[str]):
+        """Batched form of subscribeToTicker"""
+        if not self.is_connected():
+            self.connect_public()
+        self.subscribe_tickers(symbols)
+    
     def lastTradePrice(self, symbol: str) -> float:
         """Get the last trade price for a symbol from cache"""
         ticker = self._ticker_cache.get(symbol, {})
@@ -561,15 +612,100 @@ class BitUnixWebSocketManager(BaseWebSocketManager):
         for symbol in symbols:
             logger.info(f"BitUnix: Subscribing to orders for {symbol}")
 
-class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
+class BitUnixExchange(ExchangeInterface):
     """
-    A BitUnix-specific implementation of ExchangeProtocol (Python version).
+    A BitUnix-specific implementation of ExchangeInterface (Python version).
     """
     
+    # Seconds a cached price is served by lastTradePrice before a REST re-fetch
+    PRICE_TTL: float = 2.0
+
+    # BitUnix futures fee schedule by VIP level, matched against recent trade fees
+    _VIP_FEE_SCHEDULE = {
+        0: {"maker": 0.0002, "taker": 0.0006},    # 0.02% / 0.06%
+        1: {"maker": 0.00016, "taker": 0.0005},   # 0.016% / 0.05%
+        2: {"maker": 0.00014, "taker": 0.00045},  # 0.014% / 0.045%
+        3: {"maker": 0.00012, "taker": 0.0004},   # 0.012% / 0.04%
+        4: {"maker": 0.0001, "taker": 0.00035},   # 0.01% / 0.035%
+        5: {"maker": 0.00006, "taker": 0.00032},  # 0.006% / 0.032%
+        6: {"maker": 0.00004, "taker": 0.0003},   # 0.004% / 0.03%
+        7: {"maker": 0.00002, "taker": 0.00028},  # 0.002% / 0.028%
+        8: {"maker": 0.0, "taker": 0.00025},      # 0% / 0.025%
+        9: {"maker": -0.00002, "taker": 0.00022}, # -0.002% / 0.022%
+    }
+
+    # setLeverage candidates as (url, method, use alternate body); the public
+    # change_leverage endpoint first, then guesses based on BitUnix API patterns
+    _LEVERAGE_ENDPOINTS = (
+        ("https://fapi.bitunix.com/api/v1/futures/account/change_leverage", "POST", False),
+    ) + tuple(
+        (url, method, alt_body)
+        for url in (
+            "https://fapi.bitunix.com/api/v1/futures/account/adjust_leverage",
+            "https://fapi.bitunix.com/api/v1/futures/account/update_leverage",
+            "https://fapi.bitunix.com/api/v1/futures/account/set_leverage",
+            "https://fapi.bitunix.com/api/v1/futures/account/modify_leverage",
+            "https://fapi.bitunix.com/api/v1/futures/leverage/change",
+            "https://fapi.bitunix.com/api/v1/futures/leverage/update",
+        )
+        for method in ("POST", "PUT")
+        for alt_body in (False, True)
+    )
+
+    # fetchBalance probes these in order; "{TS}" is replaced with the request time
+    _BALANCE_ENDPOINTS = (
+        # Method 1: Try account endpoint with no params (got "Network Error" before)
+        {
+            "url": "https://fapi.bitunix.com/api/v1/futures/account",
+            "queryParams": "",
+            "query_string": "",
+            "include_language": False,
+            "special_parsing": "account_balance"
+        },
+        # Method 2: Try account endpoint with marginCoin parameter (BitUnix signature format)
+        {
+            "url": "https://fapi.bitunix.com/api/v1/futures/account",
+            "queryParams": "marginCoinUSDT",  # BitUnix format: name1value1name2value2
+            "query_string": "?marginCoin=USDT",
+            "include_language": False,
+            "special_parsing": "account_balance"
+        },
+        # Method 3: Try account endpoint with sorted parameters (BitUnix format)
+        {
+            "url": "https://fapi.bitunix.com/api/v1/futures/account",
+            "queryParams": "recvWindow5000timestamp{TS}",  # BitUnix format
+            "query_string": "?recvWindow=5000&timestamp={TS}",
+            "include_language": False,
+            "special_parsing": "account_balance"
+        },
+        # Method 4: Try account endpoint with exact documented parameters (BitUnix format)
+        {
+            "url": "https://fapi.bitunix.com/api/v1/futures/account",
+            "queryParams": "marginCoinUSDTrecvWindow5000",  # BitUnix format: sorted by key
+            "query_string": "?marginCoin=USDT&recvWindow=5000",
+            "include_language": False,
+            "special_parsing": "account_balance"
+        },
+        # Method 5: FALLBACK - extract margin from positions (this only shows ~397, not full 3280)
+        {
+            "url": "https://fapi.bitunix.com/api/v1/futures/position/get_pending_positions",
+            "queryParams": "",
+            "query_string": "",
+            "include_language": False,
+            "extract_balance_from_positions": True
+        }
+    )
+
     def __init__(self):
+        super().__init__()
         self.precision_manager = SymbolPrecisionManager.get_instance("BitUnix")
         self.base_url = "https://api.bitunix.com"
         self._ws_manager: Optional[BitUnixWebSocketManager] = None
+        self._ws_pool: Optional[WebSocketPool] = None
+        self._secret_bytes: Dict[str, bytes] = {}  # secretKey -> encoded, for _sign()
+        self._price_locks: Dict[str, threading.Lock] = {}  # symbol -> cold-start fetch lock
+        self._balance_method_idx: Optional[int] = None  # last working _BALANCE_ENDPOINTS entry
+        self._leverage_endpoint_idx: Optional[int] = None  # last working _LEVERAGE_ENDPOINTS entry
         self._api_key: Optional[str] = None
         self._api_secret: Optional[str] = None
 
@@ -586,63 +722,100 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
     def subscribeToTicker(self, symbol: str):
         """
         Subscribe to ticker updates for a given symbol.
+        Streamed prices are recorded for lastTradePrice().
         """
-        self.webSocketManager.subscribeToTicker(symbol)
+        manager = self.webSocketManager
+        manager.add_price_listener(self._update_price)
+        self._mark_streamed([symbol])
+        manager.subscribeToTicker(symbol)
 
-    def lastTradePrice(self, symbol: str) -> float:
+    def subscribeToTickers(self, symbols: list[str]):
+        """
+        Subscribe to ticker updates for several symbols with one subscribe frame.
+        """
+        manager = self.webSocketManager
+        manager.add_price_listener(self._update_price)
+        self._mark_streamed(symbols)
+        manager.subscribeToTickers(symbols)
+
+    def _resubscribe_ticker(self, symbol: str):
+        """Re-send the ticker subscription for a symbol whose feed went quiet"""
+        self.webSocketManager.resubscribe([{"symbol": symbol, "ch": "ticker"}])
+
+    def _fetch_price(self, symbol: str):
+        """Refresh one cached price with a single-symbol ticker request"""
+        self._fetchTickerSync(symbol)
+
+    def lastTradePrice(self, symbol: str, allow_full_scan: bool = False) -> float:
         """
         Retrieve the last trade price for a given symbol.
+        Served from the price cache while it is younger than PRICE_TTL;
+        otherwise re-fetched with a single-symbol ticker request.
+        A successful ticker response is final, even at 0.0. Only if the
+        ticker request fails and allow_full_scan is set does this download
+        the full ticker list.
         """
-        # First try to get from WebSocket manager cache
-        cached_price = self.webSocketManager.lastTradePrice(symbol)
+        cached_price = self._fresh_price(symbol, self.PRICE_TTL)
         if cached_price > 0:
             return cached_price
-        
-        # If no cached price, fetch current ticker
-        ticker_data = None
-        ticker_received = threading.Event()
-        
-        def ticker_callback(result):
-            nonlocal ticker_data
-            status, data = result
-            if status == "success":
-                ticker_data = data
-            ticker_received.set()
-        
-        # Fetch ticker for this specific symbol
-        self.fetchTicker(symbol, ticker_callback)
-        
-        if ticker_received.wait(timeout=5):
-            if ticker_data and hasattr(ticker_data, 'lastPrice'):
-                return float(ticker_data.lastPrice)
-        
-        # If still no price, try from all tickers
-        all_tickers = None
-        all_tickers_received = threading.Event()
-        
-        def all_tickers_callback(result):
-            nonlocal all_tickers
-            status, data = result
-            if status == "success":
-                all_tickers = data
-            all_tickers_received.set()
-        
-        self.fetchTickers(all_tickers_callback)
-        
-        if all_tickers_received.wait(timeout=5):
-            if all_tickers:
-                for ticker in all_tickers:
-                    if ticker.symbol == symbol:
-                        # Return the last price
-                        if hasattr(ticker, 'lastPrice'):
-                            return float(ticker.lastPrice)
-                        elif hasattr(ticker, 'price'):
-                            return float(ticker.price)
-        
-        # Return 0 if no price found
-        print(f"WARNING: Could not fetch real price for {symbol}")
+
+        # A subscribed symbol with an expired price means its feed went quiet
+        if symbol in self._streamed_symbols:
+            self._refresh_price(symbol)
+
+        # One fetch per symbol at a time; concurrent callers wait for it
+        with self._price_locks.setdefault(symbol, threading.Lock()):
+            cached_price = self._fresh_price(symbol, self.PRICE_TTL)
+            if cached_price > 0:
+                return cached_price
+
+            try:
+                price = self._fetchTickerSync(symbol).lastPrice
+            except Exception as e:
+                logger.debug("BitUnixExchange ticker request for %s failed: %s", symbol, e)
+                if allow_full_scan:
+                    price = self.lastTradePrices([symbol])[symbol]
+                    if price > 0:
+                        return price
+            else:
+                if price > 0:
+                    return price
+
+        logger.warning(f"BitUnix: Could not fetch real price for {symbol}")
         return 0.0
 
+    def lastTradePrices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Retrieve last trade prices for several symbols.
+        Cached prices younger than PRICE_TTL are used; the rest are filled
+        from a single fetchTickers call rather than one request per symbol.
+        """
+        prices = {symbol: self._fresh_price(symbol, self.PRICE_TTL) for symbol in symbols}
+        if all(price > 0 for price in prices.values()):
+            return prices
+
+        fetched = self.refreshAllPrices()
+        for symbol, price in prices.items():
+            if price <= 0:
+                prices[symbol] = fetched.get(symbol, 0.0)
+        return prices
+
+    def refreshAllPrices(self) -> Dict[str, float]:
+        """
+        Fetch every ticker in one request and refresh the price cache with it.
+        Call once per polling cycle so lastTradePrice() for any symbol is a
+        local lookup. Returns symbol -> last price ({} if the request fails).
+        """
+        result = []
+        self.fetchTickers(result.append)
+        status, tickers = result[0]
+        if status != "success":
+            logger.warning(f"BitUnix: Could not refresh prices: {tickers}")
+            return {}
+
+        # fetchTickers has already refreshed the cache
+        return {ticker.symbol: ticker.lastPrice for ticker in tickers if ticker.lastPrice > 0}
+
     # MARK: - Additional WebSocket
     def subscribeToOrders(self, symbols: list[str]):
         """
@@ -655,30 +828,39 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         """
         Fetch ticker information for a specific symbol from BitUnix via REST API.
         """
-        url = f"https://fapi.bitunix.com/api/v1/futures/market/ticker?symbol={symbol}"
-        
         try:
-            response = requests.get(url)
-            
-            if response.status_code != 200:
-                raise Exception(f"Non-200 status code: {response.status_code}")
-            
-            data = response.json()
-            if data.get('code') == 0 and data.get('data'):
-                ticker_data = data['data']
-                # Create an ExchangeTicker with the price info
-                ticker = ExchangeTicker(symbol)
-                ticker.lastPrice = float(ticker_data.get('lastPrice', 0))
-                ticker.bidPrice = float(ticker_data.get('bestBid', 0))
-                ticker.askPrice = float(ticker_data.get('bestAsk', 0))
-                ticker.volume = float(ticker_data.get('volume', 0))
-                completion(("success", ticker))
-            else:
-                raise Exception(f"API error: {data}")
-                
+            ticker = self._fetchTickerSync(symbol)
         except Exception as e:
             completion(("failure", e))
-    
+            return
+        completion(("success", ticker))
+
+    def _fetchTickerSync(self, symbol: str) -> ExchangeTicker:
+        """
+        Blocking single-symbol ticker request; raises on any failure.
+        """
+        url = f"https://fapi.bitunix.com/api/v1/futures/market/ticker?symbol={symbol}"
+        response = self._http.get(url)
+
+        if response.status_code != 200:
+            raise Exception(f"Non-200 status code: {response.status_code}")
+
+        data = loads(response.content)
+        if data.get('code') != 0 or not data.get('data'):
+            raise Exception(f"API error: {data}")
+
+        ticker_data = data['data']
+        ticker = ExchangeTicker(
+            symbol,
+            lastPrice=float(ticker_data.get('lastPrice', 0)),
+            bidPrice=float(ticker_data.get('bestBid', 0)),
+            askPrice=float(ticker_data.get('bestAsk', 0)),
+            volume=float(ticker_data.get('volume', 0)),
+        )
+        if ticker.lastPrice > 0:
+            self._update_price(symbol, ticker.lastPrice)
+        return ticker
+
     def fetchSymbolInfo(self, symbol: str, completion):
         """
         Fetch detailed information for a specific symbol.
@@ -724,17 +906,17 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         url = "https://fapi.bitunix.com/api/v1/futures/market/tickers"
 
         # DEBUG: Print request info
-        print(f"DEBUG: BitUnixExchange fetchTickers request URL: {url}")
+        logger.debug("BitUnixExchange fetchTickers request URL: %s", url)
 
         try:
-            response = requests.get(url)
+            response = self._http.get(url)
             # DEBUG: Print response info
-            print(f"DEBUG: BitUnixExchange fetchTickers response statusCode: {response.status_code}")
+            logger.debug("BitUnixExchange fetchTickers response statusCode: %s", response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Non-200 status code: {response.status_code}")
 
-            data = response.json()
+            data = loads(response.content)
             # 
             # Example response format:
             # {
@@ -750,22 +932,24 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             #   "msg": "Success"
             # }
             arr = data.get("data", [])
-            tickers = []
-            for item in arr:
-                symbol = item.get("symbol")
-                if symbol:
-                    ticker = ExchangeTicker(symbol)
-                    # Add price data to ticker
-                    ticker.lastPrice = float(item.get("lastPrice", 0))
-                    ticker.bidPrice = float(item.get("bestBid", 0))
-                    ticker.askPrice = float(item.get("bestAsk", 0))
-                    ticker.volume = float(item.get("volume", 0))
-                    ticker.price = float(item.get("lastPrice", 0))  # Alias
-                    tickers.append(ticker)
+            tickers = [
+                ExchangeTicker(
+                    sys.intern(item["symbol"]),
+                    lastPrice=float(item.get("lastPrice", 0)),
+                    bidPrice=float(item.get("bestBid", 0)),
+                    askPrice=float(item.get("bestAsk", 0)),
+                    volume=float(item.get("volume", 0)),
+                )
+                for item in arr if item.get("symbol")
+            ]
+            # Any full ticker download also refreshes lastTradePrice()
+            for ticker in tickers:
+                if ticker.lastPrice > 0:
+                    self._update_price(ticker.symbol, ticker.lastPrice)
             completion(("success", tickers))
 
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange fetchTickers error: {str(e)}")
+            logger.debug("BitUnixExchange fetchTickers error: %s", e)
             completion(("failure", e))
 
     def fetchPositions(self, completion):
@@ -791,76 +975,51 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         secretKey = keys["secretKey"]
 
         # We'll do a GET with signing using the doc approach (Double SHA-256).
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         queryParams = ""
         body = ""
 
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
 
-        headers = {
-            "api-key": apiKey,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "sign": sign,
-            "Content-Type": "application/json"
-        }
-
-        print(f"DEBUG: BitUnixExchange fetchPositions request URL: {url}")
-        print(f"DEBUG: BitUnixExchange fetchPositions headers: {headers}")
+        logger.debug("BitUnixExchange fetchPositions request URL: %s", url)
 
         try:
-            response = requests.get(url, headers=headers)
-            print(f"DEBUG: BitUnixExchange fetchPositions response statusCode: {response.status_code}")
+            response = self._http.get(url, headers=headers)
+            logger.debug("BitUnixExchange fetchPositions response statusCode: %s", response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Non-200 status code: {response.status_code}")
 
-            data = response.text
-            print(f"DEBUG: BitUnixExchange fetchPositions raw response: {data}")
-
-            json_data = json.loads(data)
-            arr = json_data.get("data", [])
+            json_data = loads(response.content)
+            arr = json_data.get("data") or []
 
+            # Single pass: one try per row, and pnl% from entryValue directly
+            # since entryPrice * qty == entryValue.
             positions = []
+            append = positions.append
             for item in arr:
                 symbol = item.get("symbol")
-                qtyStr = item.get("qty")
                 side = item.get("side")
-                entryValueStr = item.get("entryValue")
-
-                if not (symbol and qtyStr and side and entryValueStr):
+                if not (symbol and side):
                     # If any critical field is missing, skip
                     continue
-
                 try:
-                    qty = float(qtyStr)
-                    entryValue = float(entryValueStr)
-                except ValueError:
+                    qty = float(item["qty"])
+                    entryValue = float(item["entryValue"])
+                except (KeyError, TypeError, ValueError):
                     # If conversion fails, skip
                     continue
-
-                markPrice = 0.0 if qty == 0 else (entryValue / qty)
-                entryPrice = markPrice
-                unrealizedPNLStr = item.get("unrealizedPNL", "0")
                 try:
-                    unrealizedPNL = float(unrealizedPNLStr)
+                    unrealizedPNL = float(item.get("unrealizedPNL") or 0)
                 except ValueError:
                     unrealizedPNL = 0.0
 
-                pnlPercentage = 0.0
-                if entryPrice != 0 and qty != 0:
-                    pnlPercentage = (unrealizedPNL / (entryPrice * qty)) * 100
-
-                size = -qty if side.upper() == "SHORT" else qty
-                positions.append(
+                markPrice = entryValue / qty if qty else 0.0
+                pnlPercentage = unrealizedPNL / entryValue * 100 if qty and entryValue else 0.0
+                append(
                     ExchangePosition(
-                        symbol=symbol,
-                        size=size,
-                        entryPrice=entryPrice,
+                        symbol=sys.intern(symbol),
+                        size=-qty if side.upper() == "SHORT" else qty,
+                        entryPrice=markPrice,
                         markPrice=markPrice,
                         pnl=unrealizedPNL,
                         pnlPercentage=pnlPercentage,
@@ -871,7 +1030,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             completion(("success", positions))
 
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange fetchPositions error: {str(e)}")
+            logger.debug("BitUnixExchange fetchPositions error: %s", e)
             completion(("failure", e))
 
     def placeOrder(self, request: ExchangeOrderRequest, completion):
@@ -894,15 +1053,67 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         apiKey = keys["apiKey"]
         secretKey = keys["secretKey"]
 
+        payload, actual_qty = self._orderPayload(request)
+
+        bodyStr = dumps(payload)
+
+        # Wait for order-entry budget before signing so the timestamp is fresh
+        self._throttle()
+
+        queryParams = ""
+
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, bodyStr)
+
+        logger.debug("BitUnixExchange placeOrder URL: %s", url)
+        logger.debug("BitUnixExchange placeOrder body: %s", bodyStr)
+
+        try:
+            response = self._http.post(url, headers=headers, data=bodyStr)
+            logger.debug("BitUnixExchange placeOrder response statusCode: %s", response.status_code)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("BitUnixExchange placeOrder raw response: %s", response.text)
+
+            # Add API error code handling
+            json_data = loads(response.content)
+            if json_data.get('code', 0) != 0:
+                error_msg = json_data.get('msg', 'Unknown error')
+                raise Exception(f"API Error {json_data.get('code')}: {error_msg}")
+
+            # Parse the response and create ExchangeOrderResponse
+            order_data = json_data.get('data') or {}
+            
+            # Create the order response with proper fields
+            orderResponse = ExchangeOrderResponse(
+                orderId=order_data.get('orderId', ''),
+                symbol=request.symbol,
+                side=request.side,
+                orderType=request.orderType,
+                qty=actual_qty,  # Use the adjusted quantity
+                price=request.price,
+                status='NEW',  # BitUnix doesn't return status in place order response
+                timeInForce=request.timeInForce,
+                createTime=time.time_ns() // 1_000_000,
+                clientId=order_data.get('clientId'),
+                rawResponse=RawView(response.content)  # Decoded only if read
+            )
+            completion(("success", orderResponse))
+        except Exception as e:
+            logger.debug("BitUnixExchange placeOrder error: %s", e)
+            completion(("failure", e))
+
+    def _orderPayload(self, request: ExchangeOrderRequest) -> Tuple[Dict[str, Any], float]:
+        """
+        Build the place_order body for a request.
+        Returns the payload and the quantity actually sent (raised to the minimum volume).
+        """
         # Get symbol precision info
         symbol = request.symbol
-        price_precision = self.precision_manager.get_price_precision(symbol)
-        quantity_precision = self.precision_manager.get_quantity_precision(symbol)
-        min_volume = self.precision_manager.get_min_trade_volume(symbol)
+        price_fmt, qty_fmt, min_volume = self.precision_manager.get_order_formatters(symbol)
         
         # Ensure quantity meets minimum requirements
         if request.qty < min_volume:
-            print(f"DEBUG: Adjusting quantity from {request.qty} to minimum {min_volume} for {symbol}")
+            logger.debug("Adjusting quantity from %s to minimum %s for %s", request.qty, min_volume, symbol)
             actual_qty = min_volume
         else:
             actual_qty = request.qty
@@ -917,11 +1128,11 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         payload = {
             "symbol": symbol,
             "side": side,  # Using translated side
-            "qty": f"{actual_qty:.{quantity_precision}f}",
+            "qty": qty_fmt(actual_qty),
             "orderType": request.orderType.upper(),
         }
         if request.price is not None:
-            payload["price"] = f"{request.price:.{price_precision}f}"
+            payload["price"] = price_fmt(request.price)
         
         # Additional params in Swift code
         # For BitUnix, tradeSide and reduceOnly are independent
@@ -942,70 +1153,109 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             payload["clientId"] = request.orderLinkId
 
         if request.stopLoss is not None:
-            payload["slPrice"] = f"{request.stopLoss:.{price_precision}f}"
+            payload["slPrice"] = price_fmt(request.stopLoss)
             payload["slStopType"] = "LAST_PRICE"
         if request.takeProfit is not None:
-            payload["tpPrice"] = f"{request.takeProfit:.{price_precision}f}"
+            payload["tpPrice"] = price_fmt(request.takeProfit)
             payload["tpStopType"] = "LAST_PRICE"
 
-        bodyStr = json.dumps(payload)
+        return payload, actual_qty
 
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
-        queryParams = ""
+    def placeOrders(self, requests: list[ExchangeOrderRequest], completion):
+        """
+        Place several orders via BitUnix REST API, one batch_order request per symbol.
+        According to docs: POST /api/v1/futures/trade/batch_order
+        Requires API keys (private request).
+        
+        completion: A callback with a Result-like signature:
+                    success -> list with an ExchangeOrderResponse or Exception per request,
+                               in input order; a repeated orderLinkId is not sent
+                               and gets an Exception
+                    failure -> Exception
+        """
+        url = "https://fapi.bitunix.com/api/v1/futures/trade/batch_order"
+        keys = APIKeyStorage.shared().getKeys("BitUnix")
 
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{bodyStr}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
+        if not keys or not keys.get("apiKey") or not keys.get("secretKey"):
+            completion(("failure", Exception("No BitUnix credentials found")))
+            return
 
-        headers = {
-            "api-key": apiKey,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "sign": sign,
-            "Content-Type": "application/json"
-        }
+        apiKey = keys["apiKey"]
+        secretKey = keys["secretKey"]
 
-        print(f"DEBUG: BitUnixExchange placeOrder URL: {url}")
-        print(f"DEBUG: BitUnixExchange placeOrder headers: {headers}")
-        print(f"DEBUG: BitUnixExchange placeOrder body: {bodyStr}")
+        results: list = [None] * len(requests)
+        by_symbol: Dict[str, list] = {}
+        seen_ids: set = set()
+        for index, request in enumerate(requests):
+            # Results are matched back by clientId, so a repeated one is never sent
+            if request.orderLinkId is not None:
+                if request.orderLinkId in seen_ids:
+                    results[index] = Exception(
+                        f"Duplicate orderLinkId {request.orderLinkId!r} in batch")
+                    continue
+                seen_ids.add(request.orderLinkId)
+            by_symbol.setdefault(request.symbol, []).append(index)
 
-        try:
-            response = requests.post(url, headers=headers, data=bodyStr)
-            print(f"DEBUG: BitUnixExchange placeOrder response statusCode: {response.status_code}")
-            
-            responseStr = response.text
-            print(f"DEBUG: BitUnixExchange placeOrder raw response: {responseStr}")
+        for symbol, indexes in by_symbol.items():
+            # clientId correlates each result back to its request
+            pending = {}
+            orderList = []
+            for index in indexes:
+                payload, actual_qty = self._orderPayload(requests[index])
+                del payload["symbol"]
+                clientId = payload.setdefault("clientId", uuid.uuid4().hex)
+                pending[clientId] = (index, actual_qty)
+                orderList.append(payload)
 
-            # Add API error code handling
-            json_data = json.loads(responseStr)
-            if json_data.get('code', 0) != 0:
-                error_msg = json_data.get('msg', 'Unknown error')
-                raise Exception(f"API Error {json_data.get('code')}: {error_msg}")
+            bodyStr = dumps({"symbol": symbol, "orderList": orderList})
 
-            # Parse the response and create ExchangeOrderResponse
-            response_data = json.loads(responseStr)
-            order_data = response_data.get('data', {})
-            
-            # Create the order response with proper fields
-            orderResponse = ExchangeOrderResponse(
-                orderId=order_data.get('orderId', ''),
-                symbol=request.symbol,
-                side=request.side,
-                orderType=request.orderType,
-                qty=actual_qty,  # Use the adjusted quantity
-                price=request.price,
-                status='NEW',  # BitUnix doesn't return status in place order response
-                timeInForce=request.timeInForce,
-                createTime=int(time.time() * 1000),
-                clientId=order_data.get('clientId'),
-                rawResponse=response_data
-            )
-            completion(("success", orderResponse))
-        except Exception as e:
-            print(f"DEBUG: BitUnixExchange placeOrder error: {str(e)}")
-            completion(("failure", e))
+            # Wait for order-entry budget before signing; one token per order
+            self._throttle(len(orderList))
+
+            queryParams = ""
+
+            headers = self._signedHeaders(apiKey, secretKey, queryParams, bodyStr)
+
+            try:
+                response = self._http.post(url, headers=headers, data=bodyStr)
+
+                json_data = loads(response.content)
+                if json_data.get('code', 0) != 0:
+                    error_msg = json_data.get('msg', 'Unknown error')
+                    raise Exception(f"API Error {json_data.get('code')}: {error_msg}")
+
+                data = json_data.get('data') or {}
+                for item in data.get('successList') or []:
+                    index, actual_qty = pending.pop(item.get('clientId'), (None, None))
+                    if index is None:
+                        continue
+                    request = requests[index]
+                    results[index] = ExchangeOrderResponse(
+                        orderId=item.get('orderId', ''),
+                        symbol=symbol,
+                        side=request.side,
+                        orderType=request.orderType,
+                        qty=actual_qty,
+                        price=request.price,
+                        status='NEW',
+                        timeInForce=request.timeInForce,
+                        createTime=time.time_ns() // 1_000_000,
+                        clientId=item.get('clientId'),
+                        rawResponse=item
+                    )
+                for item in data.get('failureList') or []:
+                    index, _ = pending.pop(item.get('clientId'), (None, None))
+                    if index is not None:
+                        results[index] = Exception(
+                            f"API Error {item.get('errorCode')}: {item.get('errorMsg', 'Unknown error')}")
+                for index, _ in pending.values():
+                    results[index] = Exception("Order missing from batch response")
+            except Exception as e:
+                logger.error(f"BitUnix: batch place order for {symbol} failed: {e}")
+                for index, _ in pending.values():
+                    results[index] = e
+
+        completion(("success", results))
 
     def cancelOrder(self, orderID: str = None, clOrderID: str = None, symbol: str = None, completion=None):
         """
@@ -1020,79 +1270,88 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             completion: Callback with (status, data)
         """
         if not symbol:
-            if completion:
-                completion(("failure", Exception("symbol is required for cancel order")))
+            self._complete(completion, "failure", Exception("symbol is required for cancel order"))
             return
-            
+
+        # BitUnix cancel_orders endpoint requires orderList array
+        if orderID:
+            self._cancelOrderList(symbol, [{"orderId": orderID}], completion)
+        elif clOrderID:
+            self._cancelOrderList(symbol, [{"clientId": clOrderID}], completion)
+        else:
+            self._complete(completion, "failure",
+                           Exception("Either orderID or clOrderID must be provided"))
+
+    def cancelOrders(self, symbol: str, orderIDs: list[str] = (), clOrderIDs: list[str] = (),
+                     completion=None):
+        """
+        Cancel several orders on one symbol with a single cancel_orders request.
+        
+        Args:
+            symbol: Trading symbol (required)
+            orderIDs: Exchange-assigned order IDs
+            clOrderIDs: Client-assigned order IDs (clientId in BitUnix)
+            completion: Callback with (status, data)
+        """
+        if not symbol:
+            self._complete(completion, "failure", Exception("symbol is required for cancel order"))
+            return
+
+        orderList = ([{"orderId": orderID} for orderID in orderIDs] +
+                     [{"clientId": clOrderID} for clOrderID in clOrderIDs])
+        if not orderList:
+            self._complete(completion, "success", [])
+            return
+
+        self._cancelOrderList(symbol, orderList, completion)
+
+    def _cancelOrderList(self, symbol: str, orderList: list[dict], completion=None):
+        """POST an orderList to the cancel_orders endpoint"""
         url = "https://fapi.bitunix.com/api/v1/futures/trade/cancel_orders"
         keys = APIKeyStorage.shared().getKeys("BitUnix")
 
         if not keys or not keys.get("apiKey") or not keys.get("secretKey"):
-            if completion:
-                completion(("failure", Exception("No BitUnix credentials found")))
+            self._complete(completion, "failure", Exception("No BitUnix credentials found"))
             return
 
         apiKey = keys["apiKey"]
         secretKey = keys["secretKey"]
 
-        # BitUnix cancel_orders endpoint requires orderList array
-        orderItem = {}
-        if orderID:
-            orderItem["orderId"] = orderID
-        elif clOrderID:
-            orderItem["clientId"] = clOrderID
-        else:
-            if completion:
-                completion(("failure", Exception("Either orderID or clOrderID must be provided")))
-            return
-
         payload = {
             "symbol": symbol,
-            "orderList": [orderItem]
+            "orderList": orderList
         }
 
-        bodyStr = json.dumps(payload)
+        bodyStr = dumps(payload)
+
+        # Wait for order-entry budget before signing so the timestamp is fresh;
+        # a batch is charged one token per order
+        self._throttle(len(orderList))
 
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         queryParams = ""
 
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{bodyStr}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, bodyStr)
 
-        headers = {
-            "api-key": apiKey,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "sign": sign,
-            "Content-Type": "application/json"
-        }
-
-        print(f"DEBUG: BitUnixExchange cancelOrder URL: {url}")
-        print(f"DEBUG: BitUnixExchange cancelOrder headers: {headers}")
-        print(f"DEBUG: BitUnixExchange cancelOrder body: {bodyStr}")
+        logger.debug("BitUnixExchange cancelOrder URL: %s", url)
+        logger.debug("BitUnixExchange cancelOrder body: %s", bodyStr)
 
         try:
-            response = requests.post(url, headers=headers, data=bodyStr)
-            print(f"DEBUG: BitUnixExchange cancelOrder response statusCode: {response.status_code}")
+            response = self._http.post(url, headers=headers, data=bodyStr)
+            logger.debug("BitUnixExchange cancelOrder response statusCode: %s", response.status_code)
             
-            responseStr = response.text
-            print(f"DEBUG: BitUnixExchange cancelOrder raw response: {responseStr}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("BitUnixExchange cancelOrder raw response: %s", response.text)
 
             # Add API error code handling
-            json_data = json.loads(responseStr)
+            json_data = loads(response.content)
             if json_data.get('code', 0) != 0:
                 error_msg = json_data.get('msg', 'Unknown error')
                 raise Exception(f"API Error {json_data.get('code')}: {error_msg}")
 
-            if completion:
-                completion(("success", json_data))
+            self._complete(completion, "success", json_data)
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange cancelOrder error: {str(e)}")
-            if completion:
-                completion(("failure", e))
+            logger.debug("BitUnixExchange cancelOrder error: %s", e)
+            self._complete(completion, "failure", e)
 
     def fetchAccountEquity(self, completion):
         """
@@ -1116,31 +1375,18 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         url = "https://fapi.bitunix.com/api/v1/futures/account?marginCoin=USDT"
         queryParams = "marginCoinUSDT"  # BitUnix format: name1value1name2value2
         
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         body = ""
 
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-
-        headers = {
-            "api-key": apiKey,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "sign": sign,
-            "Content-Type": "application/json"
-        }
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
 
         try:
-            response = requests.get(url, headers=headers)
+            response = self._http.get(url, headers=headers)
             
             if response.status_code != 200:
                 completion(("failure", Exception(f"HTTP error: {response.status_code}")))
                 return
 
-            json_data = json.loads(response.text)
+            json_data = loads(response.content)
             
             if json_data.get('code', 0) == 0:
                 data_obj = json_data.get("data", {})
@@ -1155,55 +1401,35 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                     marginCoin = item.get("marginCoin", "USDT")
                     
                     if marginCoin == "USDT":
-                        # Debug output disabled - set debug=True to enable
-                        debug = False
-                        if debug:
-                            print(f"[DEBUG] Raw API response for USDT:")
-                            for key, value in item.items():
-                                print(f"  {key}: {value}")
-                        
-                        # Parse the required fields from API response
-                        available = float(item.get("available", "0"))  # Available for new trades
-                        frozen = float(item.get("frozen", "0"))  # Margin locked in open orders
-                        margin = float(item.get("margin", "0"))  # Position Margin
-                        crossUnrealizedPNL = float(item.get("crossUnrealizedPNL", "0"))  # Unrealized PnL
-                        
-                        # Also check other possible fields
-                        equity = float(item.get("equity", "0"))
-                        accountEquity = float(item.get("accountEquity", "0"))
-                        balance = float(item.get("balance", "0"))
-                        
-                        if debug:
-                            print(f"\n[DEBUG] Parsed values:")
-                            print(f"  available: {available}")
-                            print(f"  frozen: {frozen}")
-                            print(f"  margin: {margin}")
-                            print(f"  crossUnrealizedPNL: {crossUnrealizedPNL}")
-                            print(f"  equity (if exists): {equity}")
-                            print(f"  accountEquity (if exists): {accountEquity}")
-                            print(f"  balance (if exists): {balance}")
-                        
-                        # If there's a direct equity field, use it
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Raw API response for USDT: %s", item)
+
+                        # Prefer a direct equity field; only parse what is needed
+                        equity = _fget(item, "equity")
                         if equity > 0:
-                            if debug:
-                                print(f"\n[DEBUG] Using direct equity field: {equity}")
+                            logger.debug("Using direct equity field: %s", equity)
                             completion(("success", equity))
                             return
-                        elif accountEquity > 0:
-                            if debug:
-                                print(f"\n[DEBUG] Using accountEquity field: {accountEquity}")
+
+                        accountEquity = _fget(item, "accountEquity")
+                        if accountEquity > 0:
+                            logger.debug("Using accountEquity field: %s", accountEquity)
                             completion(("success", accountEquity))
                             return
-                        else:
-                            # Calculate equity = available + frozen + margin + unrealizedPnL
-                            # frozen = margin locked in open limit orders
-                            # margin = margin used by open positions
-                            total_equity = available + frozen + margin + crossUnrealizedPNL
-                            if debug:
-                                print(f"\n[DEBUG] Calculated equity: {total_equity}")
-                                print(f"  Formula: available ({available}) + frozen ({frozen}) + margin ({margin}) + PnL ({crossUnrealizedPNL})")
-                            completion(("success", total_equity))
-                            return
+
+                        # Calculate equity = available + frozen + margin + unrealizedPnL
+                        # frozen = margin locked in open limit orders
+                        # margin = margin used by open positions
+                        available = _fget(item, "available")  # Available for new trades
+                        frozen = _fget(item, "frozen")  # Margin locked in open orders
+                        margin = _fget(item, "margin")  # Position Margin
+                        crossUnrealizedPNL = _fget(item, "crossUnrealizedPNL")  # Unrealized PnL
+                        total_equity = available + frozen + margin + crossUnrealizedPNL
+                        logger.debug("Calculated equity: %s = available (%s) + frozen (%s) + margin "
+                                     "(%s) + PnL (%s)",
+                                     total_equity, available, frozen, margin, crossUnrealizedPNL)
+                        completion(("success", total_equity))
+                        return
                 
                 # If no USDT balance found
                 completion(("success", 0.0))
@@ -1235,247 +1461,198 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         apiKey = keys["apiKey"]
         secretKey = keys["secretKey"]
 
-        # Try the documented account endpoint with different signature approaches for total account value (~3280)
-        balance_endpoints = [
-            # Method 1: Try account endpoint with no params (got "Network Error" before)
-            {
-                "url": "https://fapi.bitunix.com/api/v1/futures/account",
-                "queryParams": "",
-                "query_string": "",
-                "include_language": False,
-                "special_parsing": "account_balance"
-            },
-            # Method 2: Try account endpoint with marginCoin parameter (BitUnix signature format)
-            {
-                "url": "https://fapi.bitunix.com/api/v1/futures/account",
-                "queryParams": "marginCoinUSDT",  # BitUnix format: name1value1name2value2
-                "query_string": "?marginCoin=USDT",
-                "include_language": False,
-                "special_parsing": "account_balance"
-            },
-            # Method 3: Try account endpoint with sorted parameters (BitUnix format)
-            {
-                "url": "https://fapi.bitunix.com/api/v1/futures/account",
-                "queryParams": "recvWindow5000timestamp" + str(int(time.time() * 1000)),  # BitUnix format
-                "query_string": "?recvWindow=5000&timestamp=" + str(int(time.time() * 1000)),
-                "include_language": False,
-                "special_parsing": "account_balance",
-                "use_timestamp_in_params": True
-            },
-            # Method 4: Try account endpoint with exact documented parameters (BitUnix format)
-            {
-                "url": "https://fapi.bitunix.com/api/v1/futures/account",
-                "queryParams": "marginCoinUSDTrecvWindow5000",  # BitUnix format: sorted by key
-                "query_string": "?marginCoin=USDT&recvWindow=5000",
-                "include_language": False,
-                "special_parsing": "account_balance"
-            },
-            # Method 5: FALLBACK - extract margin from positions (this only shows ~397, not full 3280)
-            {
-                "url": "https://fapi.bitunix.com/api/v1/futures/position/get_pending_positions",
-                "queryParams": "",
-                "query_string": "",
-                "include_language": False,
-                "extract_balance_from_positions": True
-            }
-        ]
-
-        for i, endpoint_config in enumerate(balance_endpoints):
-            print(f"\n=== TRYING BALANCE METHOD {i+1} ===")
-            
-            # Handle special timestamp in params case
-            if endpoint_config.get("use_timestamp_in_params"):
-                current_timestamp = str(int(time.time() * 1000))
-                # Replace the timestamp in both BitUnix format params and URL query string
-                queryParams = endpoint_config["queryParams"].replace("timestamp" + str(int(time.time() * 1000)), f"timestamp{current_timestamp}")
-                query_string = endpoint_config["query_string"].replace("timestamp=" + str(int(time.time() * 1000)), f"timestamp={current_timestamp}")
-                url = endpoint_config["url"] + query_string
-            else:
-                url = endpoint_config["url"] + endpoint_config["query_string"]
-                queryParams = endpoint_config["queryParams"]
-            
-            # Use exact same signature method as working endpoints
-            nonce = str(uuid.uuid4())[:8]
-            timestamp = str(int(time.time() * 1000))
-            body = ""
-
-            # Follow official documentation: nonce + timestamp + api-key + queryParams + body
-            digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-            digest = self.sha256Hex(digestInput)
-            signInput = f"{digest}{secretKey}"
-            sign = self.sha256Hex(signInput)
-
-            headers = {
-                "api-key": apiKey,
-                "nonce": nonce,
-                "timestamp": timestamp,
-                "sign": sign,
-                "Content-Type": "application/json"
-            }
-            
-            # Add language header only if specified
-            if endpoint_config["include_language"]:
-                headers["language"] = "en-US"
+        # Try the method that worked last time first, then the rest in order
+        order = list(range(len(self._BALANCE_ENDPOINTS)))
+        if self._balance_method_idx is not None:
+            order.remove(self._balance_method_idx)
+            order.insert(0, self._balance_method_idx)
+
+        # On a cold start the account probes go out together; results are
+        # still taken in priority order, and the positions fallback only
+        # runs if every account probe fails.
+        probes = {}
+        if self._balance_method_idx is None:
+            indices = [i for i, cfg in enumerate(self._BALANCE_ENDPOINTS)
+                       if not cfg.get("extract_balance_from_positions")]
+            pool = ThreadPoolExecutor(max_workers=len(indices))
+            probes = {i: pool.submit(self._balanceProbe, i, apiKey, secretKey) for i in indices}
+            pool.shutdown(wait=False)
+
+        for i in order:
+            endpoint_config = self._BALANCE_ENDPOINTS[i]
+            probe = probes.get(i)
+            json_data = probe.result() if probe else self._balanceProbe(i, apiKey, secretKey)
+            if json_data is None:
+                continue
 
-            print(f"DEBUG: Method {i+1} URL: {url}")
-            print(f"DEBUG: Method {i+1} queryParams: '{queryParams}'")
-            print(f"DEBUG: Method {i+1} digestInput: '{digestInput}'")
-            print(f"DEBUG: Method {i+1} headers: {headers}")
+            logger.debug("Balance method %s succeeded", i+1)
+            self._balance_method_idx = i
 
             try:
-                response = requests.get(url, headers=headers)
-                print(f"DEBUG: Method {i+1} response statusCode: {response.status_code}")
-
-                if response.status_code != 200:
-                    print(f"DEBUG: Method {i+1} failed with non-200 status: {response.status_code}")
-                    continue
-
-                data = response.text
-                print(f"DEBUG: Method {i+1} raw response: {data}")
-
-                json_data = json.loads(data)
-                
-                # Check for API success
-                if json_data.get('code', 0) == 0:
-                    print(f"✅ SUCCESS with method {i+1}!")
+                # Special handling for account balance parsing
+                if endpoint_config.get("special_parsing") == "account_balance":
+                    logger.debug("Using special account balance parsing")
+                    data_obj = json_data.get("data", {})
                     
-                    # Special handling for account balance parsing
-                    if endpoint_config.get("special_parsing") == "account_balance":
-                        print(f"  DEBUG: Using special account balance parsing")
-                        data_obj = json_data.get("data", {})
-                        
-                        # Handle both single object and array responses
-                        if isinstance(data_obj, list):
-                            arr = data_obj
-                        else:
-                            arr = [data_obj] if data_obj else []
-
-                        balances = []
-                        for item in arr:
-                            print(f"  DEBUG: Account balance item: {item}")
-                            
-                            marginCoin = item.get("marginCoin", "USDT")
-                            
-                            # Parse all balance fields from account response
-                            availableStr = item.get("available", "0")
-                            frozenStr = item.get("frozen", "0") 
-                            marginStr = item.get("margin", "0")
-                            bonusStr = item.get("bonus", "0")
-                            crossUnrealizedPNLStr = item.get("crossUnrealizedPNL", "0")
-                            
-                            try:
-                                available = float(availableStr)
-                                frozen = float(frozenStr)
-                                margin = float(marginStr)
-                                bonus = float(bonusStr)
-                                crossUnrealizedPNL = float(crossUnrealizedPNLStr)
-                                
-                                # Calculate total account value
-                                # Total equity = available + frozen + margin + bonus + crossUnrealizedPNL
-                                # 'frozen' is funds locked in orders
-                                # 'margin' is funds locked in positions
-                                total_balance = available + frozen + margin + bonus + crossUnrealizedPNL
-                                
-                                print(f"  DEBUG: Parsed balance components:")
-                                print(f"    Available: {available}")
-                                print(f"    Frozen (in orders): {frozen}")
-                                print(f"    Margin (in positions): {margin}")
-                                print(f"    Bonus: {bonus}")
-                                print(f"    CrossUnrealizedPNL: {crossUnrealizedPNL}")
-                                print(f"    TOTAL EQUITY: {total_balance}")
-                                
-                            except (ValueError, TypeError) as e:
-                                print(f"  DEBUG: Error parsing balance values: {e}")
-                                continue
-
-                            if total_balance > 0:
-                                balances.append(
-                                    ExchangeBalance(
-                                        asset=marginCoin,
-                                        balance=total_balance,      # Total account equity
-                                        available=available,        # Available for new trades
-                                        locked=frozen + margin      # Frozen in orders + margin in positions
-                                    )
-                                )
+                    # Handle both single object and array responses
+                    if isinstance(data_obj, list):
+                        arr = data_obj
+                    else:
+                        arr = [data_obj] if data_obj else []
 
-                        completion(("success", balances))
-                        return
-                    elif endpoint_config.get("extract_balance_from_positions"):
-                        # Extract comprehensive balance info from positions data
-                        print(f"  DEBUG: Using positions-based balance extraction with enhanced calculation")
-                        data_obj = json_data.get("data", [])
-                        balances = []
-                        
-                        # Calculate comprehensive balance information from positions
-                        total_margin = 0
-                        total_unrealized_pnl = 0
-                        total_entry_value = 0
-                        margin_coin = "USDT"
+                    balances = []
+                    for item in arr:
+                        logger.debug("Account balance item: %s", item)
                         
-                        print(f"  DEBUG: Processing {len(data_obj)} positions for balance calculation:")
+                        marginCoin = item.get("marginCoin", "USDT")
                         
-                        for position in data_obj:
-                            symbol = position.get("symbol", "")
-                            margin_str = position.get("margin", "0")
-                            unrealized_pnl_str = position.get("unrealizedPNL", "0")
-                            entry_value_str = position.get("entryValue", "0")
-                            
-                            try:
-                                margin = float(margin_str)
-                                unrealized_pnl = float(unrealized_pnl_str)
-                                entry_value = float(entry_value_str)
-                                
-                                total_margin += margin
-                                total_unrealized_pnl += unrealized_pnl
-                                total_entry_value += entry_value
-                                
-                                print(f"    {symbol}: margin={margin}, pnl={unrealized_pnl}, entry_value={entry_value}")
-                                
-                            except ValueError:
-                                continue
-                        
-                        print(f"  DEBUG: Balance calculation summary:")
-                        print(f"    Total margin in use: ${total_margin:.2f}")
-                        print(f"    Total unrealized P&L: ${total_unrealized_pnl:.2f}")
-                        print(f"    Total entry value: ${total_entry_value:.2f}")
-                        
-                        # Create balance entry with available information
-                        # Note: This only shows margin in use, not total account balance
-                        effective_balance = total_margin + total_unrealized_pnl
-                        
-                        print(f"    Effective balance (margin + PnL): ${effective_balance:.2f}")
-                        print(f"  WARNING: This shows only futures margin usage, not total account balance (~$3280)")
-                        print(f"  NOTE: Total account balance requires different API permissions or endpoint access")
-                        
-                        if total_margin > 0:
+                        # Parse all balance fields from account response
+                        available = _fget(item, "available")
+                        frozen = _fget(item, "frozen")
+                        margin = _fget(item, "margin")
+                        bonus = _fget(item, "bonus")
+                        crossUnrealizedPNL = _fget(item, "crossUnrealizedPNL")
+
+                        # Calculate total account value
+                        # Total equity = available + frozen + margin + bonus + crossUnrealizedPNL
+                        # 'frozen' is funds locked in orders
+                        # 'margin' is funds locked in positions
+                        total_balance = available + frozen + margin + bonus + crossUnrealizedPNL
+
+                        logger.debug("Parsed balance components: available=%s, frozen=%s, margin=%s, "
+                                     "bonus=%s, crossUnrealizedPNL=%s, total equity=%s",
+                                     available, frozen, margin, bonus, crossUnrealizedPNL, total_balance)
+
+                        if total_balance > 0:
                             balances.append(
                                 ExchangeBalance(
-                                    asset=margin_coin,
-                                    balance=effective_balance,  # Margin + unrealized PnL
-                                    available=0,  # Cannot determine from positions
-                                    locked=total_margin       # Margin locked in positions
+                                    asset=marginCoin,
+                                    balance=total_balance,      # Total account equity
+                                    available=available,        # Available for new trades
+                                    locked=frozen + margin      # Frozen in orders + margin in positions
                                 )
                             )
-                        
-                        completion(("success", balances))
-                        return
-                    else:
-                        # Unknown parsing method
-                        print(f"  DEBUG: Unknown parsing method")
-                        completion(("success", []))
-                        return
-                else:
-                    error_msg = json_data.get('msg', 'Unknown error')
-                    print(f"DEBUG: Method {i+1} failed with API error {json_data.get('code')}: {error_msg}")
-                    continue
 
+                    completion(("success", balances))
+                    return
+                elif endpoint_config.get("extract_balance_from_positions"):
+                    # Extract comprehensive balance info from positions data
+                    logger.debug("Using positions-based balance extraction with enhanced calculation")
+                    data_obj = json_data.get("data", [])
+                    balances = []
+                    
+                    # Calculate comprehensive balance information from positions
+                    total_margin = 0
+                    total_unrealized_pnl = 0
+                    total_entry_value = 0
+                    margin_coin = "USDT"
+                    
+                    logger.debug("Processing %s positions for balance calculation:", len(data_obj))
+                    
+                    for position in data_obj:
+                        try:
+                            margin_str, unrealized_pnl_str, entry_value_str = _POSITION_BALANCE_FIELDS(position)
+                            margin = float(margin_str)
+                            unrealized_pnl = float(unrealized_pnl_str)
+                            entry_value = float(entry_value_str)
+                        except (KeyError, ValueError, TypeError):
+                            # Slow path for rows with missing or malformed fields
+                            margin = _fget(position, "margin")
+                            unrealized_pnl = _fget(position, "unrealizedPNL")
+                            entry_value = _fget(position, "entryValue")
+
+                        total_margin += margin
+                        total_unrealized_pnl += unrealized_pnl
+                        total_entry_value += entry_value
+
+                        logger.debug("%s: margin=%s, pnl=%s, entry_value=%s",
+                                     position.get('symbol', ''), margin, unrealized_pnl, entry_value)
+                    
+                    logger.debug("Balance calculation summary: margin in use $%.2f, unrealized P&L "
+                                 "$%.2f, entry value $%.2f",
+                                 total_margin, total_unrealized_pnl, total_entry_value)
+                    
+                    # Create balance entry with available information
+                    # Note: This only shows margin in use, not total account balance
+                    effective_balance = total_margin + total_unrealized_pnl
+                    
+                    logger.debug("Effective balance (margin + PnL): $%.2f", effective_balance)
+                    logger.warning("Balance shows only futures margin usage, not total account balance; "
+                                   "that requires different API permissions or endpoint access")
+                    
+                    if total_margin > 0:
+                        balances.append(
+                            ExchangeBalance(
+                                asset=margin_coin,
+                                balance=effective_balance,  # Margin + unrealized PnL
+                                available=0,  # Cannot determine from positions
+                                locked=total_margin       # Margin locked in positions
+                            )
+                        )
+                    
+                    completion(("success", balances))
+                    return
+                else:
+                    # Unknown parsing method
+                    logger.debug("Unknown parsing method")
+                    completion(("success", []))
+                    return
             except Exception as e:
-                print(f"DEBUG: Method {i+1} failed with exception: {str(e)}")
+                logger.debug("Method %s failed with exception: %s", i+1, e)
                 continue
         
         # If all methods failed
+        self._balance_method_idx = None
         completion(("failure", Exception("All balance endpoint methods failed")))
 
+    def _balanceProbe(self, i: int, apiKey: str, secretKey: str) -> Optional[Dict[str, Any]]:
+        """
+        Send balance method i from _BALANCE_ENDPOINTS.
+        Returns the decoded response on API success, None on any failure.
+        """
+        endpoint_config = self._BALANCE_ENDPOINTS[i]
+        logger.debug("TRYING BALANCE METHOD %s", i+1)
+
+        queryParams = endpoint_config["queryParams"]
+        query_string = endpoint_config["query_string"]
+        if "{TS}" in queryParams:
+            current_timestamp = str(time.time_ns() // 1_000_000)
+            queryParams = queryParams.replace("{TS}", current_timestamp)
+            query_string = query_string.replace("{TS}", current_timestamp)
+        url = endpoint_config["url"] + query_string
+
+        # Follow official documentation: nonce + timestamp + api-key + queryParams + body
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, "")
+
+        # Add language header only if specified
+        if endpoint_config["include_language"]:
+            headers["language"] = "en-US"
+
+        logger.debug("Method %s URL: %s", i+1, url)
+        logger.debug("Method %s queryParams: '%s'", i+1, queryParams)
+
+        try:
+            response = self._http.get(url, headers=headers)
+            logger.debug("Method %s response statusCode: %s", i+1, response.status_code)
+
+            if response.status_code != 200:
+                logger.debug("Method %s failed with non-200 status: %s", i+1, response.status_code)
+                return None
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Method %s raw response: %s", i+1, response.text)
+
+            json_data = loads(response.content)
+        except Exception as e:
+            logger.debug("Method %s failed with exception: %s", i+1, e)
+            return None
+
+        if json_data.get('code', 0) != 0:
+            error_msg = json_data.get('msg', 'Unknown error')
+            logger.debug("Method %s failed with API error %s: %s", i+1, json_data.get('code'), error_msg)
+            return None
+        return json_data
+
     def fetchOrders(self, completion):
         """
         Fetch open orders via BitUnix REST API.
@@ -1499,68 +1676,46 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         secretKey = keys["secretKey"]
 
         # We'll do a GET with signing using the doc approach (Double SHA-256).
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         queryParams = ""
         body = ""
 
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
 
-        headers = {
-            "api-key": apiKey,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "sign": sign,
-            "Content-Type": "application/json"
-        }
-
-        print(f"DEBUG: BitUnixExchange fetchOrders request URL: {url}")
-        print(f"DEBUG: BitUnixExchange fetchOrders headers: {headers}")
+        logger.debug("BitUnixExchange fetchOrders request URL: %s", url)
 
         try:
-            response = requests.get(url, headers=headers)
-            print(f"DEBUG: BitUnixExchange fetchOrders response statusCode: {response.status_code}")
+            response = self._http.get(url, headers=headers)
+            logger.debug("BitUnixExchange fetchOrders response statusCode: %s", response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Non-200 status code: {response.status_code}")
 
-            data = response.text
-            print(f"DEBUG: BitUnixExchange fetchOrders raw response: {data}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("BitUnixExchange fetchOrders raw response: %s", response.text)
 
-            json_data = json.loads(data)
+            json_data = loads(response.content)
             data_obj = json_data.get("data", {})
             arr = data_obj.get("orderList", [])
 
             orders = []
+            append = orders.append
             for item in arr:
-                orderId = item.get("orderId")
-                symbol = item.get("symbol")
-                side = item.get("side")
-                orderType = item.get("orderType")
-                qtyStr = item.get("qty")
-                priceStr = item.get("price")
-                status = item.get("status")
-                timeInForce = item.get("timeInForce", "GTC")
-                createTime = item.get("createTime", 0)
-                clientId = item.get("clientId")
-                stopPriceStr = item.get("stopPrice")
-                executedQtyStr = item.get("executedQty", "0")
-
-                if not all([orderId, symbol, side, orderType, qtyStr, status]):
+                try:
+                    orderId, symbol, side, orderType, qtyStr, status = _ORDER_REQUIRED_FIELDS(item)
+                except KeyError:
+                    continue
+                if not (orderId and symbol and side and orderType and qtyStr and status):
                     continue
 
+                priceStr = item.get("price")
                 try:
                     qty = float(qtyStr)
                     price = float(priceStr) if priceStr else None
-                    stopPrice = float(stopPriceStr) if stopPriceStr else None
-                    executedQty = float(executedQtyStr)
-                except ValueError:
+                    executedQty = float(item.get("executedQty", "0"))
+                except (TypeError, ValueError):
                     continue
 
-                orders.append(
+                append(
                     ExchangeOrder(
                         orderId=orderId,
                         symbol=symbol,
@@ -1569,9 +1724,9 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                         qty=qty,
                         price=price,
                         status=status,
-                        timeInForce=timeInForce,
-                        createTime=createTime,
-                        clientId=clientId,
+                        timeInForce=item.get("timeInForce", "GTC"),
+                        createTime=item.get("createTime", 0),
+                        clientId=item.get("clientId"),
                         executedQty=executedQty
                     )
                 )
@@ -1579,10 +1734,32 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             completion(("success", orders))
 
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange fetchOrders error: {str(e)}")
+            logger.debug("BitUnixExchange fetchOrders error: %s", e)
             completion(("failure", e))
 
-    def fetchHistoryOrders(self, symbol: str = None, startTime: int = None, endTime: int = None, limit: int = 50, completion=None):
+    # History query keys in lexical order, the order BitUnix signs them in
+    _HISTORY_QUERY_KEYS = ("endTime", "limit", "orderId", "skip", "startTime", "symbol")
+
+    @classmethod
+    def _historyQuery(cls, params: Dict[str, str]) -> Tuple[str, str]:
+        """
+        Build the URL query string and the signature queryParams
+        ("name1value1name2value2") for history params in one pass.
+        Values are percent-encoded in the URL but signed raw.
+        """
+        url_parts = []
+        sig_parts = []
+        for key in cls._HISTORY_QUERY_KEYS:
+            value = params.get(key)
+            if value is not None:
+                value = str(value)
+                url_parts.append(f"{key}={urllib.parse.quote(value, safe='')}")
+                sig_parts.append(f"{key}{value}")
+        if not url_parts:
+            return "", ""
+        return "?" + "&".join(url_parts), "".join(sig_parts)
+
+    def fetchHistoryOrders(self, symbol: str = None, startTime: int = None, endTime: int = None, limit: int = 50, skip: int = 0, completion=None):
         """
         Fetch order history to determine how positions were closed.
         This is crucial for detecting stop loss, take profit, or manual closures.
@@ -1592,6 +1769,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             startTime: Unix timestamp in milliseconds (optional)
             endTime: Unix timestamp in milliseconds (optional) 
             limit: Max results (default 50, max 100)
+            skip: Number of records to skip, for paging (optional)
             completion: Callback function
         """
         url = "https://fapi.bitunix.com/api/v1/futures/trade/get_history_orders"
@@ -1614,53 +1792,30 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             params["endTime"] = str(endTime)
         if limit:
             params["limit"] = str(limit)
+        if skip:
+            params["skip"] = str(skip)
 
-        # Convert params to query string for URL (standard format)
-        queryString = ""
-        if params:
-            url_params = "&".join([f"{k}={v}" for k, v in params.items()])
-            queryString = "?" + url_params
-
-        # Convert params to signature format: sorted by key, format "name1value1name2value2"
-        queryParams = ""
-        if params:
-            sorted_params = sorted(params.items())
-            queryParams = "".join([f"{k}{v}" for k, v in sorted_params])
+        queryString, queryParams = self._historyQuery(params)
 
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         body = ""
 
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-
-        headers = {
-            "api-key": apiKey,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "sign": sign,
-            "Content-Type": "application/json"
-        }
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
 
         full_url = url + queryString
-        print(f"DEBUG: BitUnixExchange fetchHistoryOrders URL: {full_url}")
-        print(f"DEBUG: BitUnixExchange fetchHistoryOrders queryParams for signature: '{queryParams}'")
-        print(f"DEBUG: BitUnixExchange fetchHistoryOrders digestInput: '{digestInput}'")
-        print(f"DEBUG: BitUnixExchange fetchHistoryOrders headers: {headers}")
+        logger.debug("BitUnixExchange fetchHistoryOrders URL: %s", full_url)
+        logger.debug("BitUnixExchange fetchHistoryOrders queryParams for signature: '%s'", queryParams)
 
         try:
-            response = requests.get(full_url, headers=headers)
-            print(f"DEBUG: BitUnixExchange fetchHistoryOrders response statusCode: {response.status_code}")
+            response = self._http.get(full_url, headers=headers)
+            logger.debug("BitUnixExchange fetchHistoryOrders response statusCode: %s", response.status_code)
             
-            responseStr = response.text
-            print(f"DEBUG: BitUnixExchange fetchHistoryOrders raw response: {responseStr}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("BitUnixExchange fetchHistoryOrders raw response: %s", response.text)
 
             if response.status_code != 200:
-                raise Exception(f"HTTP {response.status_code}: {responseStr}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-            json_data = json.loads(responseStr)
+            json_data = loads(response.content)
             if json_data.get('code', 0) != 0:
                 error_msg = json_data.get('msg', 'Unknown error')
                 raise Exception(f"API Error {json_data.get('code')}: {error_msg}")
@@ -1670,10 +1825,10 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             completion(("success", order_list))
 
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange fetchHistoryOrders error: {str(e)}")
+            logger.debug("BitUnixExchange fetchHistoryOrders error: %s", e)
             completion(("failure", e))
 
-    def fetchHistoryTrades(self, symbol: str = None, orderId: str = None, startTime: int = None, endTime: int = None, limit: int = 50, completion=None):
+    def fetchHistoryTrades(self, symbol: str = None, orderId: str = None, startTime: int = None, endTime: int = None, limit: int = 50, skip: int = 0, completion=None):
         """
         Fetch trade history to see actual order executions.
         
@@ -1683,6 +1838,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             startTime: Unix timestamp in milliseconds (optional)
             endTime: Unix timestamp in milliseconds (optional)
             limit: Max results (default 50, max 100)
+            skip: Number of records to skip, for paging (optional)
             completion: Callback function
         """
         url = "https://fapi.bitunix.com/api/v1/futures/trade/get_history_trades"
@@ -1707,53 +1863,30 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             params["endTime"] = str(endTime)
         if limit:
             params["limit"] = str(limit)
+        if skip:
+            params["skip"] = str(skip)
 
-        # Convert params to query string for URL (standard format)
-        queryString = ""
-        if params:
-            url_params = "&".join([f"{k}={v}" for k, v in params.items()])
-            queryString = "?" + url_params
+        queryString, queryParams = self._historyQuery(params)
 
-        # Convert params to signature format: sorted by key, format "name1value1name2value2"
-        queryParams = ""
-        if params:
-            sorted_params = sorted(params.items())
-            queryParams = "".join([f"{k}{v}" for k, v in sorted_params])
-
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         body = ""
 
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-
-        headers = {
-            "api-key": apiKey,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "sign": sign,
-            "Content-Type": "application/json"
-        }
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
 
         full_url = url + queryString
-        print(f"DEBUG: BitUnixExchange fetchHistoryTrades URL: {full_url}")
-        print(f"DEBUG: BitUnixExchange fetchHistoryTrades queryParams for signature: '{queryParams}'")
-        print(f"DEBUG: BitUnixExchange fetchHistoryTrades digestInput: '{digestInput}'")
-        print(f"DEBUG: BitUnixExchange fetchHistoryTrades headers: {headers}")
+        logger.debug("BitUnixExchange fetchHistoryTrades URL: %s", full_url)
+        logger.debug("BitUnixExchange fetchHistoryTrades queryParams for signature: '%s'", queryParams)
 
         try:
-            response = requests.get(full_url, headers=headers)
-            print(f"DEBUG: BitUnixExchange fetchHistoryTrades response statusCode: {response.status_code}")
+            response = self._http.get(full_url, headers=headers)
+            logger.debug("BitUnixExchange fetchHistoryTrades response statusCode: %s", response.status_code)
             
-            responseStr = response.text
-            print(f"DEBUG: BitUnixExchange fetchHistoryTrades raw response: {responseStr}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("BitUnixExchange fetchHistoryTrades raw response: %s", response.text)
 
             if response.status_code != 200:
-                raise Exception(f"HTTP {response.status_code}: {responseStr}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-            json_data = json.loads(responseStr)
+            json_data = loads(response.content)
             if json_data.get('code', 0) != 0:
                 error_msg = json_data.get('msg', 'Unknown error')
                 raise Exception(f"API Error {json_data.get('code')}: {error_msg}")
@@ -1763,7 +1896,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             completion(("success", trade_list))
 
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange fetchHistoryTrades error: {str(e)}")
+            logger.debug("BitUnixExchange fetchHistoryTrades error: %s", e)
             completion(("failure", e))
 
     def fetchLeverageAndMarginMode(self, symbol: str, marginCoin: str, completion):
@@ -1786,37 +1919,25 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         secretKey = keys["secretKey"]
         
         # Generate signature for GET request with query params
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         queryParams = f"marginCoin{marginCoin}symbol{symbol}"  # Alphabetically sorted
         body = ""
         
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-        
-        headers = {
-            "api-key": apiKey,
-            "sign": sign,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "Content-Type": "application/json"
-        }
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
         
-        print(f"DEBUG: BitUnixExchange fetchLeverageAndMarginMode request URL: {url}")
+        logger.debug("BitUnixExchange fetchLeverageAndMarginMode request URL: %s", url)
         
         try:
-            response = requests.get(url, headers=headers)
-            print(f"DEBUG: BitUnixExchange fetchLeverageAndMarginMode response statusCode: {response.status_code}")
+            response = self._http.get(url, headers=headers)
+            logger.debug("BitUnixExchange fetchLeverageAndMarginMode response statusCode: %s",
+                         response.status_code)
             
-            responseStr = response.text
-            print(f"DEBUG: BitUnixExchange fetchLeverageAndMarginMode raw response: {responseStr}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("BitUnixExchange fetchLeverageAndMarginMode raw response: %s", response.text)
             
             if response.status_code != 200:
-                raise Exception(f"HTTP {response.status_code}: {responseStr}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
             
-            json_data = json.loads(responseStr)
+            json_data = loads(response.content)
             
             if json_data.get('code', 0) == 0:
                 completion(("success", json_data.get("data", {})))
@@ -1825,9 +1946,16 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                 completion(("failure", Exception(f"API Error {json_data.get('code')}: {error_msg}")))
                 
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange fetchLeverageAndMarginMode error: {str(e)}")
+            logger.debug("BitUnixExchange fetchLeverageAndMarginMode error: %s", e)
             completion(("failure", e))
 
+    def _leverageProbe(self, symbol: str, marginCoin: str) -> Optional[Dict[str, Any]]:
+        """Cached leverage and margin mode for symbol, or None when the lookup fails"""
+        result = []
+        self.fetchLeverageAndMarginModeCached(symbol, marginCoin, result.append)
+        status, data = result[0]
+        return data if status == "success" else None
+
     def fetchAccountRiskLimit(self, symbol: str, completion):
         """
         Fetch the account's current risk limit setting for a symbol.
@@ -1849,38 +1977,25 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         secretKey = keys["secretKey"]
         
         # Generate signature for GET request (no query params for open positions)
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         queryParams = ""  # No query params for this endpoint
         body = ""
         
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-        
-        headers = {
-            "api-key": apiKey,
-            "sign": sign,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "Content-Type": "application/json"
-        }
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
         
-        print(f"DEBUG: BitUnixExchange fetchAccountRiskLimit request URL: {url}")
-        print(f"DEBUG: BitUnixExchange fetchAccountRiskLimit headers: {headers}")
+        logger.debug("BitUnixExchange fetchAccountRiskLimit request URL: %s", url)
         
         try:
-            response = requests.get(url, headers=headers)
-            print(f"DEBUG: BitUnixExchange fetchAccountRiskLimit response statusCode: {response.status_code}")
+            response = self._http.get(url, headers=headers)
+            logger.debug("BitUnixExchange fetchAccountRiskLimit response statusCode: %s",
+                         response.status_code)
             
-            responseStr = response.text
-            print(f"DEBUG: BitUnixExchange fetchAccountRiskLimit raw response: {responseStr}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("BitUnixExchange fetchAccountRiskLimit raw response: %s", response.text)
             
             if response.status_code != 200:
-                raise Exception(f"HTTP {response.status_code}: {responseStr}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
             
-            json_data = json.loads(responseStr)
+            json_data = loads(response.content)
             
             # Check if we got positions data
             if json_data.get('code', 0) == 0:
@@ -1904,21 +2019,9 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                         break
                 
                 # If we didn't find the symbol in open positions, try to get leverage info
+                # (cached per symbol, so repeated calls skip the round-trip). Assume USDT.
                 if not symbol_risk_info:
-                    # Try to fetch leverage and margin mode for this symbol
-                    leverage_info = None
-                    leverage_error = None
-                    
-                    def leverage_callback(result):
-                        nonlocal leverage_info, leverage_error
-                        status, data = result
-                        if status == "success":
-                            leverage_info = data
-                        else:
-                            leverage_error = data
-                    
-                    # Assume USDT as margin coin for now
-                    self.fetchLeverageAndMarginMode(symbol, "USDT", leverage_callback)
+                    leverage_info = self._leverageProbe(symbol, "USDT")
                     
                     if leverage_info and 'leverage' in leverage_info:
                         # We have leverage info, return it
@@ -1945,7 +2048,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             completion(("failure", Exception(f"API Error {json_data.get('code')}: {error_msg}")))
             
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange fetchAccountRiskLimit error: {str(e)}")
+            logger.debug("BitUnixExchange fetchAccountRiskLimit error: %s", e)
             completion(("failure", e))
 
     def setLeverage(self, symbol: str, leverage: int, marginCoin: str = "USDT", completion=None):
@@ -1960,13 +2063,13 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         """
         # Based on BitUnix API patterns (change_margin_mode exists)
         # The most likely endpoint is change_leverage
+        completion = self._invalidate_on_success(
+            completion, "fetchLeverageAndMarginMode", (symbol, marginCoin))
         
-        url = "https://fapi.bitunix.com/api/v1/futures/account/change_leverage"
         keys = APIKeyStorage.shared().getKeys("BitUnix")
         
         if not keys or not keys.get("apiKey") or not keys.get("secretKey"):
-            if completion:
-                completion(("failure", Exception("API keys not configured")))
+            self._complete(completion, "failure", Exception("API keys not configured"))
             return
         
         apiKey = keys["apiKey"]
@@ -1986,112 +2089,89 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             "marginCoin": marginCoin,
             "side": "BOTH"  # Some APIs require side specification
         }
+        bodies = (dumps(request_body), dumps(alt_request_body))
         
-        # Generate signature for POST request
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
-        queryParams = ""  # No query params for POST
-        body = json.dumps(request_body)
-        
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-        
-        headers = {
-            "api-key": apiKey,
-            "sign": sign,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "Content-Type": "application/json"
-        }
-        
-        print(f"DEBUG: BitUnixExchange setLeverage request URL: {url}")
-        print(f"DEBUG: BitUnixExchange setLeverage body: {body}")
+        # Use the endpoint that worked last time, else change_leverage
+        first = self._leverage_endpoint_idx or 0
         
         try:
-            response = requests.post(url, headers=headers, data=body)
-            print(f"DEBUG: BitUnixExchange setLeverage response statusCode: {response.status_code}")
-            
-            responseStr = response.text
-            print(f"DEBUG: BitUnixExchange setLeverage raw response: {responseStr}")
+            response = self._leverageAttempt(first, apiKey, secretKey, bodies)
             
             # Handle common error codes
             if response.status_code == 404:
-                # Try alternative endpoints based on BitUnix API patterns
-                alternative_endpoints = [
-                    "https://fapi.bitunix.com/api/v1/futures/account/adjust_leverage",
-                    "https://fapi.bitunix.com/api/v1/futures/account/update_leverage",
-                    "https://fapi.bitunix.com/api/v1/futures/account/set_leverage",
-                    "https://fapi.bitunix.com/api/v1/futures/account/modify_leverage",
-                    "https://fapi.bitunix.com/api/v1/futures/leverage/change",
-                    "https://fapi.bitunix.com/api/v1/futures/leverage/update"
-                ]
-                
-                print(f"DEBUG: First endpoint returned 404, trying alternatives...")
-                
-                # Try each alternative endpoint with different methods and body formats
-                for alt_url in alternative_endpoints:
-                    # Try both POST and PUT methods
-                    for method in ['POST', 'PUT']:
-                        # Try both body formats
-                        for body_data in [body, json.dumps(alt_request_body)]:
-                            print(f"DEBUG: Trying {method} {alt_url} with body: {body_data[:100]}...")
-                            
-                            try:
-                                if method == 'POST':
-                                    alt_response = requests.post(alt_url, headers=headers, data=body_data)
-                                else:
-                                    alt_response = requests.put(alt_url, headers=headers, data=body_data)
-                                    
-                                print(f"DEBUG: Response status: {alt_response.status_code}")
-                                
-                                if alt_response.status_code != 404:
-                                    # Found a working endpoint
-                                    responseStr = alt_response.text
-                                    print(f"DEBUG: Response: {responseStr}")
-                                    
-                                    if alt_response.status_code == 200:
-                                        json_data = json.loads(responseStr)
-                                        if json_data.get('code', 0) == 0:
-                                            print(f"DEBUG: Success with {method} {alt_url}")
-                                            if completion:
-                                                completion(("success", json_data.get("data", {})))
-                                            return
-                                        else:
-                                            error_msg = json_data.get('msg', 'Unknown error')
-                                            print(f"DEBUG: API Error: {error_msg}")
-                                    elif alt_response.status_code == 400:
-                                        # Bad request might mean wrong parameters
-                                        print(f"DEBUG: Bad request - might need different parameters")
-                                
-                            except Exception as e:
-                                print(f"DEBUG: Error trying {method} {alt_url}: {e}")
-                                continue
-                
-                # None of the endpoints worked
-                error_msg = "No working leverage endpoint found. The set leverage API may require special permissions or may not be publicly available."
-                if completion:
-                    completion(("failure", Exception(error_msg)))
-                return
+                self._leverage_endpoint_idx = None
+                logger.debug("Leverage endpoint returned 404, trying alternatives...")
+                response = self._discoverLeverageEndpoint(apiKey, secretKey, bodies, skip=first)
+                if response is None:
+                    # None of the endpoints worked
+                    error_msg = "No working leverage endpoint found. The set leverage API may require special permissions or may not be publicly available."
+                    self._complete(completion, "failure", Exception(error_msg))
+                    return
             
             if response.status_code != 200:
-                raise Exception(f"HTTP {response.status_code}: {responseStr}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
             
-            json_data = json.loads(responseStr)
+            json_data = loads(response.content)
             
             if json_data.get('code', 0) == 0:
-                if completion:
-                    completion(("success", json_data.get("data", {})))
+                if self._leverage_endpoint_idx is None:
+                    self._leverage_endpoint_idx = first
+                self._complete(completion, "success", json_data.get("data", {}))
             else:
                 error_msg = json_data.get('msg', 'Unknown error')
-                if completion:
-                    completion(("failure", Exception(f"API Error {json_data.get('code')}: {error_msg}")))
+                self._complete(completion, "failure", Exception(f"API Error {json_data.get('code')}: {error_msg}"))
                 
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange setLeverage error: {str(e)}")
-            if completion:
-                completion(("failure", e))
+            logger.debug("BitUnixExchange setLeverage error: %s", e)
+            self._complete(completion, "failure", e)
+
+    def _leverageAttempt(self, i: int, apiKey: str, secretKey: str,
+                         bodies: Tuple[str, str]) -> "requests.Response":
+        """
+        Send leverage candidate i from _LEVERAGE_ENDPOINTS, signed over the
+        body shape it uses.
+        """
+        url, method, alt_body = self._LEVERAGE_ENDPOINTS[i]
+        body = bodies[alt_body]
+        headers = self._signedHeaders(apiKey, secretKey, "", body)
+        
+        logger.debug("BitUnixExchange setLeverage %s %s body: %s", method, url, body)
+        
+        if method == "POST":
+            response = self._http.post(url, headers=headers, data=body)
+        else:
+            response = self._http.put(url, headers=headers, data=body)
+        
+        logger.debug("BitUnixExchange setLeverage %s %s response statusCode: %s",
+                     method, url, response.status_code)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("BitUnixExchange setLeverage raw response: %s", response.text)
+        return response
+
+    def _discoverLeverageEndpoint(self, apiKey: str, secretKey: str, bodies: Tuple[str, str],
+                                  skip: int) -> Optional["requests.Response"]:
+        """
+        Try the other leverage candidates one at a time, in
+        _LEVERAGE_ENDPOINTS order, and remember the first the API accepts.
+        Every candidate changes leverage, so they are never sent
+        concurrently and probing stops at the first success.
+        Returns that response, or None if no candidate works.
+        """
+        for i in range(len(self._LEVERAGE_ENDPOINTS)):
+            if i == skip:
+                continue
+            try:
+                response = self._leverageAttempt(i, apiKey, secretKey, bodies)
+                if response.status_code != 200:
+                    continue
+                if loads(response.content).get('code', 0) == 0:
+                    url, method, _ = self._LEVERAGE_ENDPOINTS[i]
+                    logger.debug("Success with %s %s", method, url)
+                    self._leverage_endpoint_idx = i
+                    return response
+            except Exception as e:
+                logger.debug("Leverage candidate %s failed: %s", i, e)
+        return None
 
     def fetchAccountFeeInfo(self, completion):
         """
@@ -2100,8 +2180,11 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         
         completion: A callback with a Result-like signature:
                     success -> dict containing VIP level and fee rates
+                               (makerFee/takerFee as decimals, plus integer
+                               makerFeePpm/takerFeePpm)
                     failure -> Exception
         """
+        completion = self._with_fee_ppm(completion)
         keys = APIKeyStorage.shared().getKeys("BitUnix")
         
         if not keys or not keys.get("apiKey") or not keys.get("secretKey"):
@@ -2121,28 +2204,14 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             if status == "success" and isinstance(data, list):
                 trades = data
                 
-                # BitUnix fee schedule
-                fee_schedule = {
-                    0: {"maker": 0.0002, "taker": 0.0006},    # 0.02% / 0.06%
-                    1: {"maker": 0.00016, "taker": 0.0005},   # 0.016% / 0.05%
-                    2: {"maker": 0.00014, "taker": 0.00045},  # 0.014% / 0.045%
-                    3: {"maker": 0.00012, "taker": 0.0004},   # 0.012% / 0.04%
-                    4: {"maker": 0.0001, "taker": 0.00035},   # 0.01% / 0.035%
-                    5: {"maker": 0.00006, "taker": 0.00032},  # 0.006% / 0.032%
-                    6: {"maker": 0.00004, "taker": 0.0003},   # 0.004% / 0.03%
-                    7: {"maker": 0.00002, "taker": 0.00028},  # 0.002% / 0.028%
-                    8: {"maker": 0.0, "taker": 0.00025},      # 0% / 0.025%
-                    9: {"maker": -0.00002, "taker": 0.00022}, # -0.002% / 0.022%
-                }
-                
                 # Analyze fees
                 maker_fees = []
                 taker_fees = []
                 
                 for trade in trades[:50]:  # Analyze up to 50 recent trades
-                    qty = float(trade.get('qty', 0))
-                    price = float(trade.get('price', 0))
-                    fee = float(trade.get('fee', 0))
+                    qty = _fget(trade, 'qty')
+                    price = _fget(trade, 'price')
+                    fee = _fget(trade, 'fee')
                     role_type = trade.get('roleType', 'UNKNOWN')
                     
                     if qty > 0 and price > 0 and fee > 0:
@@ -2165,17 +2234,20 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                 
                 # Debug output
                 if maker_fees or taker_fees:
-                    print(f"[FEE INFO] Analyzed {len(trades)} trades:")
+                    logger.debug("Analyzed %s trades:", len(trades))
                     if avg_maker:
-                        print(f"[FEE INFO]   Average MAKER fee: {avg_maker:.6f} ({avg_maker*100:.4f}%) from {len(maker_fees)} trades")
+                        logger.debug("Average MAKER fee: %.6f (%.4f%%) from %s trades",
+                                     avg_maker, avg_maker*100, len(maker_fees))
                     if avg_taker:
-                        print(f"[FEE INFO]   Average TAKER fee: {avg_taker:.6f} ({avg_taker*100:.4f}%) from {len(taker_fees)} trades")
+                        logger.debug("Average TAKER fee: %.6f (%.4f%%) from %s trades",
+                                     avg_taker, avg_taker*100, len(taker_fees))
                 
                 # Match to VIP tier
                 best_match = None
                 best_score = float('inf')
                 
-                for vip_level, fees in fee_schedule.items():
+                debug = (maker_fees or taker_fees) and logger.isEnabledFor(logging.DEBUG)
+                for vip_level, fees in self._VIP_FEE_SCHEDULE.items():
                     score = 0
                     if avg_maker is not None:
                         score += abs(fees['maker'] - avg_maker)
@@ -2183,8 +2255,11 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                         score += abs(fees['taker'] - avg_taker)
                     
                     # Debug each VIP level scoring
-                    if maker_fees or taker_fees:
-                        print(f"[FEE INFO]   VIP {vip_level} score: {score:.8f} (maker diff: {abs(fees['maker'] - avg_maker) if avg_maker else 'N/A'}, taker diff: {abs(fees['taker'] - avg_taker) if avg_taker else 'N/A'})")
+                    if debug:
+                        logger.debug("VIP %s score: %.8f (maker diff: %s, taker diff: %s)",
+                                     vip_level, score,
+                                     abs(fees['maker'] - avg_maker) if avg_maker else 'N/A',
+                                     abs(fees['taker'] - avg_taker) if avg_taker else 'N/A')
                     
                     if score < best_score:
                         best_score = score
@@ -2194,7 +2269,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                     vip_level, fees = best_match
                     # Check if we have high confidence (very close match)
                     if best_score < 0.00005:  # Within 0.005% total deviation
-                        print(f"[FEE INFO] Detected VIP Level {vip_level} from trade history (Maker: {fees['maker']:.4%}, Taker: {fees['taker']:.4%})")
+                        logger.info(f"Detected VIP Level {vip_level} from trade history (Maker: {fees['maker']:.4%}, Taker: {fees['taker']:.4%})")
                         completion(("success", {
                             "vipLevel": vip_level,
                             "makerFee": fees['maker'],
@@ -2204,9 +2279,9 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                         return
                     # If we have some trades but not perfect match, still use it with warning
                     elif (maker_fees or taker_fees) and best_score < 0.0002:
-                        print(f"[FEE INFO] Likely VIP Level {vip_level} from trade history (confidence: medium)")
-                        print(f"[FEE INFO] Detected rates - Maker: {avg_maker:.4%}, Taker: {avg_taker:.4%}")
-                        print(f"[FEE INFO] Expected rates - Maker: {fees['maker']:.4%}, Taker: {fees['taker']:.4%}")
+                        logger.info(f"Likely VIP Level {vip_level} from trade history (confidence: medium)")
+                        logger.info(f"Detected rates - Maker: {avg_maker:.4%}, Taker: {avg_taker:.4%}")
+                        logger.info(f"Expected rates - Maker: {fees['maker']:.4%}, Taker: {fees['taker']:.4%}")
                         completion(("success", {
                             "vipLevel": vip_level,
                             "makerFee": fees['maker'],
@@ -2219,7 +2294,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             self._fetchAccountFeeInfoFallback(completion)
         
         # Get recent trades (last 7 days)
-        end_time = int(time.time() * 1000)
+        end_time = time.time_ns() // 1_000_000
         start_time = end_time - (7 * 24 * 60 * 60 * 1000)
         
         self.fetchHistoryTrades(
@@ -2239,26 +2314,13 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         secretKey = keys["secretKey"]
         
         # Generate signature
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         queryParams = "marginCoinUSDT"
         body = ""
         
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-        
-        headers = {
-            "api-key": apiKey,
-            "sign": sign,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "Content-Type": "application/json"
-        }
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self._http.get(url, headers=headers)
             
             if response.status_code == 200:
                 # Account endpoint doesn't return VIP info, default to VIP 0
@@ -2277,7 +2339,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                 }))
                 
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange fetchAccountFeeInfo fallback error: {str(e)}")
+            logger.debug("BitUnixExchange fetchAccountFeeInfo fallback error: %s", e)
             completion(("success", {
                 "vipLevel": 0,
                 "makerFee": 0.0002,
@@ -2305,38 +2367,25 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         secretKey = keys["secretKey"]
         
         # Generate signature for GET request
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         queryParams = f"symbol{symbol}"  # Format for signature: namevalue
         body = ""
         
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-        
-        headers = {
-            "api-key": apiKey,
-            "sign": sign,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "language": "en-US",
-            "Content-Type": "application/json"
-        }
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
+        headers["language"] = "en-US"
         
-        print(f"DEBUG: BitUnixExchange fetchPositionTiers request URL: {url}")
+        logger.debug("BitUnixExchange fetchPositionTiers request URL: %s", url)
         
         try:
-            response = requests.get(url, headers=headers)
-            print(f"DEBUG: BitUnixExchange fetchPositionTiers response statusCode: {response.status_code}")
+            response = self._http.get(url, headers=headers)
+            logger.debug("BitUnixExchange fetchPositionTiers response statusCode: %s", response.status_code)
             
-            responseStr = response.text
-            print(f"DEBUG: BitUnixExchange fetchPositionTiers raw response: {responseStr}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("BitUnixExchange fetchPositionTiers raw response: %s", response.text)
             
             if response.status_code != 200:
-                raise Exception(f"Non-200 status code: {response.status_code}, response: {responseStr}")
+                raise Exception(f"Non-200 status code: {response.status_code}, response: {response.text}")
             
-            data = response.json()
+            data = loads(response.content)
             
             if data.get("code") != 0:
                 error_msg = data.get("msg", "Unknown error")
@@ -2346,7 +2395,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
             completion(("success", tiers))
             
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange fetchPositionTiers error: {str(e)}")
+            logger.debug("BitUnixExchange fetchPositionTiers error: %s", e)
             completion(("failure", e))
 
     # WebSocket Interface Methods
@@ -2354,28 +2403,11 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         """Get the name of the exchange"""
         return "BitUnix"
     
-    def get_symbol_format(self, base_symbol: str) -> str:
+    def _get_symbol_format_impl(self, base_symbol: str) -> str:
         """Convert a base symbol to exchange-specific format"""
         # BitUnix uses format like BTCUSDT
         return base_symbol
     
-    def translate_side_to_exchange(self, side: str) -> str:
-        """Translate standard side to exchange-specific format"""
-        # BitUnix uses BUY/SELL
-        if side == PositionSide.LONG:
-            return "BUY"
-        elif side == PositionSide.SHORT:
-            return "SELL"
-        return side
-    
-    def translate_side_from_exchange(self, exchange_side: str) -> str:
-        """Translate exchange-specific side to standard format"""
-        if exchange_side == "BUY":
-            return PositionSide.LONG
-        elif exchange_side == "SELL":
-            return PositionSide.SHORT
-        return exchange_side
-    
     def fetchAccountEquity(self, completion: Callable[[Tuple[str, Any]], None]):
         """Fetch total account equity value"""
         def balance_callback(status_data):
@@ -2396,8 +2428,22 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
     def connectWebSocket(self, 
                         on_message: Callable[[WebSocketMessage], None],
                         on_state_change: Callable[[WebSocketState], None],
-                        on_error: Callable[[Exception], None]) -> bool:
+                        on_error: Callable[[Exception], None],
+                        pool: Optional[WebSocketPool] = None) -> bool:
         """Connect to the exchange WebSocket"""
+        # Draw a pre-warmed connection from the pool when one is given
+        if pool is not None:
+            manager = pool.acquire()
+            if manager is not None:
+                manager.on_message = on_message
+                manager.on_error = on_error
+                manager.on_state_change = on_state_change
+                self._ws_manager = manager
+                self._ws_pool = pool
+                on_state_change(manager.get_state())
+                return True
+            logger.warning("BitUnix: WebSocket pool exhausted, opening a new connection")
+
         # Always create WebSocket manager first
         self._ws_manager = BitUnixWebSocketManager(
             on_message=on_message,
@@ -2411,7 +2457,12 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
     
     def disconnectWebSocket(self):
         """Disconnect from the WebSocket"""
-        if self._ws_manager:
+        if self._ws_manager and self._ws_pool:
+            # Hand pooled connections back instead of tearing them down
+            self._ws_pool.release(self._ws_manager)
+            self._ws_manager = None
+            self._ws_pool = None
+        elif self._ws_manager:
             self._ws_manager.disconnect()
     
     def subscribeWebSocket(self, subscriptions: List[WebSocketSubscription]) -> bool:
@@ -2491,11 +2542,38 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         return self._ws_manager.is_connected() if self._ws_manager else False
     
     # Helper for double sha256
+    def _sign(self, nonce: str, timestamp: str, apiKey: str, queryParams: str, body: str,
+              secretKey: str) -> str:
+        """
+        BitUnix double SHA-256 signature:
+        sha256(sha256(nonce + timestamp + apiKey + queryParams + body) + secretKey)
+        """
+        secret = self._secret_bytes.get(secretKey)
+        if secret is None:
+            secret = self._secret_bytes[secretKey] = secretKey.encode()
+        return _sign_bitunix(f"{nonce}{timestamp}{apiKey}{queryParams}{body}".encode(), secret)
+
+    def _signedHeaders(self, apiKey: str, secretKey: str, queryParams: str = "",
+                       body: str = "") -> Dict[str, str]:
+        """
+        Auth headers for a private request, with a fresh nonce and timestamp
+        signed over queryParams and body.
+        """
+        nonce = secrets.token_hex(4)
+        timestamp = str(time.time_ns() // 1_000_000)
+        return {
+            "api-key": apiKey,
+            "nonce": nonce,
+            "timestamp": timestamp,
+            "sign": self._sign(nonce, timestamp, apiKey, queryParams, body, secretKey),
+            "Content-Type": "application/json"
+        }
+
     def sha256Hex(self, input_str: str) -> str:
         """
         Generates a SHA-256 hex digest of the input string.
         """
-        return hashlib.sha256(input_str.encode('utf-8')).hexdigest()
+        return _sha256(input_str.encode('utf-8')).hexdigest()
     
     def fetchPositionMode(self, completion):
         """
@@ -2531,27 +2609,13 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         secretKey = keys["secretKey"]
         
         # Generate signature for GET request
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         queryParams = ""  # No query params
         body = ""
         
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-        
-        headers = {
-            "api-key": apiKey,
-            "sign": sign,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "Content-Type": "application/json"
-        }
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
         
         try:
-            response = requests.get(url, headers=headers)
-            responseStr = response.text
+            response = self._http.get(url, headers=headers)
             
             if response.status_code != 200:
                 # Fallback to checking positions
@@ -2570,7 +2634,7 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                 self.fetchPositions(pos_callback)
                 return
             
-            json_data = json.loads(responseStr)
+            json_data = loads(response.content)
             
             if json_data.get('code', 0) == 0:
                 # Extract position mode from account data
@@ -2624,42 +2688,28 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
         secretKey = keys["secretKey"]
         
         # BitUnix expects "positionMode" parameter with "ONE_WAY" or "HEDGE" value
-        body = json.dumps({
+        body = dumps({
             "positionMode": mode.upper()
         })
         
         # Generate signature for POST request
-        nonce = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time() * 1000))
         queryParams = ""  # No query params
         
-        digestInput = f"{nonce}{timestamp}{apiKey}{queryParams}{body}"
-        digest = self.sha256Hex(digestInput)
-        signInput = f"{digest}{secretKey}"
-        sign = self.sha256Hex(signInput)
-        
-        headers = {
-            "api-key": apiKey,
-            "sign": sign,
-            "nonce": nonce,
-            "timestamp": timestamp,
-            "Content-Type": "application/json"
-        }
+        headers = self._signedHeaders(apiKey, secretKey, queryParams, body)
         
-        print(f"DEBUG: BitUnixExchange setPositionMode URL: {url}")
-        print(f"DEBUG: BitUnixExchange setPositionMode body: {body}")
+        logger.debug("BitUnixExchange setPositionMode URL: %s", url)
+        logger.debug("BitUnixExchange setPositionMode body: %s", body)
         
         try:
-            response = requests.post(url, headers=headers, data=body)
-            responseStr = response.text
-            
-            print(f"DEBUG: BitUnixExchange setPositionMode response statusCode: {response.status_code}")
-            print(f"DEBUG: BitUnixExchange setPositionMode raw response: {responseStr}")
+            response = self._http.post(url, headers=headers, data=body)
+            logger.debug("BitUnixExchange setPositionMode response statusCode: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("BitUnixExchange setPositionMode raw response: %s", response.text)
             
             if response.status_code != 200:
-                raise Exception(f"HTTP {response.status_code}: {responseStr}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
             
-            json_data = json.loads(responseStr)
+            json_data = loads(response.content)
             
             if json_data.get('code', 0) == 0:
                 completion(("success", {"positionMode": mode, "message": "Position mode changed successfully"}))
@@ -2668,5 +2718,5 @@ class BitUnixExchange(ExchangeProtocol, ExchangeInterface):
                 completion(("failure", Exception(f"API Error {json_data.get('code')}: {error_msg}")))
                 
         except Exception as e:
-            print(f"DEBUG: BitUnixExchange setPositionMode error: {str(e)}")
+            logger.debug("BitUnixExchange setPositionMode error: %s", e)
             completion(("failure", e))
\ No newline at end of file
@@ -1,7 +1,6 @@
 """LMEX Exchange Implementation"""
 
 from .base import (
-    ExchangeProtocol,
     ExchangeOrderRequest,
     ExchangeOrderResponse,
     ExchangeTicker,
@@ -61,7 +60,7 @@ class LMEXWebSocketManager(ExchangeWebSocketManagerProtocol):
 
     def subscribeToTicker(self, symbol: str):
         _logger.debug(
-            "Subscribing to ticker for {symbol} (WebSocket not actually implemented).")
+            "Subscribing to ticker for %s (WebSocket not actually implemented).", symbol)
 
     def lastTradePrice(self, symbol: str) -> float:
         """Get the last trade price for a symbol - fetch from market data."""
@@ -71,12 +70,12 @@ class LMEXWebSocketManager(ExchangeWebSocketManagerProtocol):
 
     def subscribeToOrders(self, symbols: list[str]):
         _logger.debug(
-            "Subscribing to orders for symbols {symbols} (WebSocket not actually implemented).")
+            "Subscribing to orders for symbols %s (WebSocket not actually implemented).", symbols)
 
 
-class LMEXExchange(ExchangeProtocol):
+class LMEXExchange:
     """
-    An LMEX-specific implementation of ExchangeProtocol (Python version).
+    An LMEX-specific client satisfying ExchangeProtocol (Python version).
     """
 
     def __init__(self):
@@ -140,7 +139,7 @@ class LMEXExchange(ExchangeProtocol):
                                     return float(last_price)
 
         # Return 0 if no price found
-        _logger.warning("Could not fetch real price for {symbol}")
+        _logger.warning("Could not fetch real price for %s", symbol)
         return 0.0
 
     def subscribeToOrders(self, symbols: list[str]):
@@ -188,7 +187,7 @@ class LMEXExchange(ExchangeProtocol):
             raise Exception("LMEX API key not found")
 
         # Generate nonce (timestamp in milliseconds)
-        nonce = str(int(time.time() * 1000))
+        nonce = str(time.time_ns() // 1_000_000)
 
         # Generate signature
         signature = self._generate_signature(path, nonce, body)
@@ -241,7 +240,7 @@ class LMEXExchange(ExchangeProtocol):
 
             # Calculate time range for the requested number of candles
             import time
-            end_time = int(time.time() * 1000)  # Current time in milliseconds
+            end_time = time.time_ns() // 1_000_000  # Current time in milliseconds
 
             # Calculate start time based on timeframe and limit
             minutes_per_candle = int(resolution)
@@ -371,13 +370,13 @@ class LMEXExchange(ExchangeProtocol):
         url = f"{self.base_url}{path}"
 
         # DEBUG: Print request info
-        _logger.debug("LMEXExchange fetchTickers request URL: {url}")
+        _logger.debug("LMEXExchange fetchTickers request URL: %s", url)
 
         try:
             response = requests.get(url)
             # DEBUG: Print response info
             _logger.debug(
-                "LMEXExchange fetchTickers response statusCode: {response.status_code}")
+                "LMEXExchange fetchTickers response statusCode: %s", response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Non-200 status code: {response.status_code}")
@@ -416,6 +415,7 @@ class LMEXExchange(ExchangeProtocol):
                                 market.get('maxOrderSize', 1000000))
                             cache_entry['tick_size'] = float(
                                 market.get('minPriceIncrement', 0.01))
+                            self.precision_manager.invalidate_symbol(symbol)
 
                 # Save updated cache after fetching tickers
                 if hasattr(self, 'precision_manager'):
@@ -425,7 +425,7 @@ class LMEXExchange(ExchangeProtocol):
                 raise Exception("Unexpected response format")
 
         except Exception as e:
-            _logger.debug("LMEXExchange fetchTickers error: {str(e)}")
+            _logger.debug("LMEXExchange fetchTickers error: %s", e)
             completion(("failure", e))
 
     def fetchPositions(self, completion):
@@ -445,19 +445,19 @@ class LMEXExchange(ExchangeProtocol):
             completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange fetchPositions request URL: {url}")
+        _logger.debug("LMEXExchange fetchPositions request URL: %s", url)
 
         try:
             response = requests.get(url, headers=headers)
             _logger.debug(
-                "LMEXExchange fetchPositions response statusCode: {response.status_code}")
+                "LMEXExchange fetchPositions response statusCode: %s", response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Non-200 status code: {response.status_code}")
 
             data = response.json()
             _logger.debug(
-                "LMEXExchange fetchPositions raw response: {json.dumps(data)}")
+                "LMEXExchange fetchPositions raw response: %s", data)
 
             positions = []
 
@@ -521,12 +521,12 @@ class LMEXExchange(ExchangeProtocol):
                     )
 
             _logger.debug(
-                "[LMEX] Positions response parsed {len(positions)} positions")
+                "[LMEX] Positions response parsed %s positions", len(positions))
 
             completion(("success", positions))
 
         except Exception as e:
-            _logger.debug("LMEXExchange fetchPositions error: {str(e)}")
+            _logger.debug("LMEXExchange fetchPositions error: %s", e)
             completion(("failure", e))
 
     def fetchPositionMode(self, symbol: str, completion):
@@ -549,24 +549,24 @@ class LMEXExchange(ExchangeProtocol):
             completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange fetchPositionMode URL: {url}")
+        _logger.debug("LMEXExchange fetchPositionMode URL: %s", url)
 
         try:
             response = requests.get(url, headers=headers)
             _logger.debug(
-                "LMEXExchange fetchPositionMode response statusCode: {response.status_code}")
+                "LMEXExchange fetchPositionMode response statusCode: %s", response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Non-200 status code: {response.status_code}")
 
             data = response.json()
             _logger.debug(
-                "LMEXExchange fetchPositionMode response: {json.dumps(data)}")
+                "LMEXExchange fetchPositionMode response: %s", data)
 
             completion(("success", data))
 
         except Exception as e:
-            _logger.debug("LMEXExchange fetchPositionMode error: {str(e)}")
+            _logger.debug("LMEXExchange fetchPositionMode error: %s", e)
             completion(("failure", e))
 
     def setPositionMode(self, symbol: str, position_mode: str, completion):
@@ -599,18 +599,18 @@ class LMEXExchange(ExchangeProtocol):
             return
 
         _logger.debug(
-            "LMEXExchange setPositionMode: {symbol} -> {position_mode}")
-        _logger.debug("LMEXExchange setPositionMode URL: {url}")
-        _logger.debug("LMEXExchange setPositionMode body: {body_str}")
+            "LMEXExchange setPositionMode: %s -> %s", symbol, position_mode)
+        _logger.debug("LMEXExchange setPositionMode URL: %s", url)
+        _logger.debug("LMEXExchange setPositionMode body: %s", body_str)
 
         try:
             response = requests.post(url, headers=headers, data=body_str)
             _logger.debug(
-                "LMEXExchange setPositionMode response statusCode: {response.status_code}")
+                "LMEXExchange setPositionMode response statusCode: %s", response.status_code)
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange setPositionMode response: {response_str}")
+                "LMEXExchange setPositionMode response: %s", response_str)
 
             if response.status_code != 200:
                 try:
@@ -628,7 +628,7 @@ class LMEXExchange(ExchangeProtocol):
             completion(("success", data))
 
         except Exception as e:
-            _logger.debug("LMEXExchange setPositionMode error: {str(e)}")
+            _logger.debug("LMEXExchange setPositionMode error: %s", e)
             completion(("failure", e))
 
     def initializeHedgeMode(self, symbols: list = None):
@@ -645,7 +645,7 @@ class LMEXExchange(ExchangeProtocol):
             symbols = ["BTC-PERP", "ETH-PERP", "SOL-PERP"]
 
         _logger.debug(
-            "[LMEX] Initializing HEDGE mode for {len(symbols)} symbols")
+            "[LMEX] Initializing HEDGE mode for %s symbols", len(symbols))
 
         success_count = 0
         failure_count = 0
@@ -666,14 +666,14 @@ class LMEXExchange(ExchangeProtocol):
                 if 'result' in result_container:
                     status, data = result_container['result']
                     if status == "success":
-                        _logger.debug("[LMEX] ✓ {symbol} set to HEDGE mode")
+                        _logger.debug("[LMEX] ✓ %s set to HEDGE mode", symbol)
                         success_count += 1
                     else:
                         _logger.debug(
-                            "[LMEX] ✗ {symbol} failed to set HEDGE mode: {data}")
+                            "[LMEX] ✗ %s failed to set HEDGE mode: %s", symbol, data)
                         failure_count += 1
                 else:
-                    _logger.debug("[LMEX] ✗ {symbol} no response received")
+                    _logger.debug("[LMEX] ✗ %s no response received", symbol)
                     failure_count += 1
 
             except Exception:
@@ -721,7 +721,7 @@ class LMEXExchange(ExchangeProtocol):
                             # If mode setting failed, pass through the original
                             # error
                             _logger.debug(
-                                "[LMEX] Failed to set position mode: {mode_data}")
+                                "[LMEX] Failed to set position mode: %s", mode_data)
                             _logger.debug(
                                 "[LMEX] Cannot retry order - position mode switch failed")
                             completion(result)
@@ -806,20 +806,20 @@ class LMEXExchange(ExchangeProtocol):
             payload["stopLossPrice"] = float(
                 round(request.stopLoss, price_precision))
             payload["stopLossTrigger"] = "markPrice"  # Default trigger type
-            _logger.debug("[LMEX] Adding Stop Loss at ${request.stopLoss}")
+            _logger.debug("[LMEX] Adding Stop Loss at $%s", request.stopLoss)
 
         if request.takeProfit is not None:
             # Ensure takeProfitPrice is sent as a float/double
             payload["takeProfitPrice"] = float(
                 round(request.takeProfit, price_precision))
             payload["takeProfitTrigger"] = "markPrice"  # Default trigger type
-            _logger.debug("[LMEX] Adding Take Profit at ${request.takeProfit}")
+            _logger.debug("[LMEX] Adding Take Profit at $%s", request.takeProfit)
 
         body_str = json.dumps(payload)
 
         # Log the complete payload for debugging
         _logger.debug(
-            "[LMEX] Complete order payload: {json.dumps(payload, indent=2)}")
+            "[LMEX] Complete order payload: %s", body_str)
 
         try:
             headers = self._get_auth_headers(path, body_str)
@@ -827,18 +827,17 @@ class LMEXExchange(ExchangeProtocol):
             completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange placeOrder URL: {url}")
-        _logger.debug("LMEXExchange placeOrder headers: {headers}")
-        _logger.debug("LMEXExchange placeOrder body: {body_str}")
+        _logger.debug("LMEXExchange placeOrder URL: %s", url)
+        _logger.debug("LMEXExchange placeOrder body: %s", body_str)
 
         try:
             response = requests.post(url, headers=headers, data=body_str)
             _logger.debug(
-                "LMEXExchange placeOrder response statusCode: {response.status_code}")
+                "LMEXExchange placeOrder response statusCode: %s", response.status_code)
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange placeOrder raw response: {response_str}")
+                "LMEXExchange placeOrder raw response: %s", response_str)
 
             # Check response status
             if response.status_code != 200:
@@ -860,7 +859,7 @@ class LMEXExchange(ExchangeProtocol):
 
             # Log the raw API response for debugging
             _logger.debug(
-                "[LMEX] Order API Response: {json.dumps(json_data, indent=2)}")
+                "[LMEX] Order API Response: %s", json_data)
 
             # LMEX returns a list with one order object
             if isinstance(json_data, list) and len(json_data) > 0:
@@ -887,7 +886,7 @@ class LMEXExchange(ExchangeProtocol):
             orderResponse = ExchangeOrderResponse(order_data)
             completion(("success", orderResponse))
         except Exception as e:
-            _logger.debug("LMEXExchange placeOrder error: {str(e)}")
+            _logger.debug("LMEXExchange placeOrder error: %s", e)
             completion(("failure", e))
 
     def fetchAccountEquity(self, completion):
@@ -928,7 +927,7 @@ class LMEXExchange(ExchangeProtocol):
                 # Use totalValue which represents the total account value
                 total_equity = float(wallet_data.get("totalValue", 0))
 
-                _logger.debug("LMEX Account Equity: {total_equity}")
+                _logger.debug("LMEX Account Equity: %s", total_equity)
             elif isinstance(json_data, dict):
                 # Fallback for dict format
                 total_equity = float(json_data.get("totalEquity", 0))
@@ -957,19 +956,19 @@ class LMEXExchange(ExchangeProtocol):
             completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange fetchBalance request URL: {url}")
+        _logger.debug("LMEXExchange fetchBalance request URL: %s", url)
 
         try:
             response = requests.get(url, headers=headers)
             _logger.debug(
-                "LMEXExchange fetchBalance response statusCode: {response.status_code}")
+                "LMEXExchange fetchBalance response statusCode: %s", response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Non-200 status code: {response.status_code}")
 
             data = response.json()
             _logger.debug(
-                "LMEXExchange fetchBalance raw response: {json.dumps(data)}")
+                "LMEXExchange fetchBalance raw response: %s", data)
 
             balances = []
 
@@ -1016,7 +1015,7 @@ class LMEXExchange(ExchangeProtocol):
             completion(("success", balances))
 
         except Exception as e:
-            _logger.debug("LMEXExchange fetchBalance error: {str(e)}")
+            _logger.debug("LMEXExchange fetchBalance error: %s", e)
             completion(("failure", e))
 
     def fetchOrders(self, completion):
@@ -1036,19 +1035,19 @@ class LMEXExchange(ExchangeProtocol):
             completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange fetchOrders request URL: {url}")
+        _logger.debug("LMEXExchange fetchOrders request URL: %s", url)
 
         try:
             response = requests.get(url, headers=headers)
             _logger.debug(
-                "LMEXExchange fetchOrders response statusCode: {response.status_code}")
+                "LMEXExchange fetchOrders response statusCode: %s", response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Non-200 status code: {response.status_code}")
 
             data = response.json()
             _logger.debug(
-                "LMEXExchange fetchOrders raw response: {json.dumps(data)}")
+                "LMEXExchange fetchOrders raw response: %s", data)
 
             orders = []
 
@@ -1194,7 +1193,7 @@ class LMEXExchange(ExchangeProtocol):
             completion(("success", orders))
 
         except Exception as e:
-            _logger.debug("LMEXExchange fetchOrders error: {str(e)}")
+            _logger.debug("LMEXExchange fetchOrders error: %s", e)
             completion(("failure", e))
 
     def fetchHistoryOrders(
@@ -1239,16 +1238,16 @@ class LMEXExchange(ExchangeProtocol):
             completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange fetchHistoryOrders URL: {url}")
+        _logger.debug("LMEXExchange fetchHistoryOrders URL: %s", url)
 
         try:
             response = requests.get(url, headers=headers)
             _logger.debug(
-                "LMEXExchange fetchHistoryOrders response statusCode: {response.status_code}")
+                "LMEXExchange fetchHistoryOrders response statusCode: %s", response.status_code)
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange fetchHistoryOrders raw response: {response_str}")
+                "LMEXExchange fetchHistoryOrders raw response: %s", response_str)
 
             if response.status_code != 200:
                 raise Exception(f"HTTP {response.status_code}: {response_str}")
@@ -1257,7 +1256,7 @@ class LMEXExchange(ExchangeProtocol):
             completion(("success", json_data))
 
         except Exception as e:
-            _logger.debug("LMEXExchange fetchHistoryOrders error: {str(e)}")
+            _logger.debug("LMEXExchange fetchHistoryOrders error: %s", e)
             completion(("failure", e))
 
     def fetchHistoryTrades(
@@ -1302,16 +1301,16 @@ class LMEXExchange(ExchangeProtocol):
             completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange fetchHistoryTrades URL: {url}")
+        _logger.debug("LMEXExchange fetchHistoryTrades URL: %s", url)
 
         try:
             response = requests.get(url, headers=headers)
             _logger.debug(
-                "LMEXExchange fetchHistoryTrades response statusCode: {response.status_code}")
+                "LMEXExchange fetchHistoryTrades response statusCode: %s", response.status_code)
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange fetchHistoryTrades raw response: {response_str}")
+                "LMEXExchange fetchHistoryTrades raw response: %s", response_str)
 
             if response.status_code != 200:
                 raise Exception(f"HTTP {response.status_code}: {response_str}")
@@ -1320,7 +1319,7 @@ class LMEXExchange(ExchangeProtocol):
             completion(("success", json_data))
 
         except Exception as e:
-            _logger.debug("LMEXExchange fetchHistoryTrades error: {str(e)}")
+            _logger.debug("LMEXExchange fetchHistoryTrades error: %s", e)
             completion(("failure", e))
 
     def fetchLeverageAndMarginMode(
@@ -1347,7 +1346,7 @@ class LMEXExchange(ExchangeProtocol):
             return
 
         _logger.debug(
-            "LMEXExchange fetchLeverageAndMarginMode request URL: {url}")
+            "LMEXExchange fetchLeverageAndMarginMode request URL: %s", url)
 
         try:
             response = requests.get(url, headers=headers)
@@ -1357,7 +1356,7 @@ class LMEXExchange(ExchangeProtocol):
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange fetchLeverageAndMarginMode raw response: {response_str}")
+                "LMEXExchange fetchLeverageAndMarginMode raw response: %s", response_str)
 
             if response.status_code != 200:
                 raise Exception(f"HTTP {response.status_code}: {response_str}")
@@ -1383,7 +1382,7 @@ class LMEXExchange(ExchangeProtocol):
 
         except Exception as e:
             _logger.debug(
-                "LMEXExchange fetchLeverageAndMarginMode error: {str(e)}")
+                "LMEXExchange fetchLeverageAndMarginMode error: %s", e)
             completion(("failure", e))
 
     def fetchAccountRiskLimit(self, symbol: str, completion):
@@ -1405,16 +1404,16 @@ class LMEXExchange(ExchangeProtocol):
             completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange fetchAccountRiskLimit request URL: {url}")
+        _logger.debug("LMEXExchange fetchAccountRiskLimit request URL: %s", url)
 
         try:
             response = requests.get(url, headers=headers)
             _logger.debug(
-                "LMEXExchange fetchAccountRiskLimit response statusCode: {response.status_code}")
+                "LMEXExchange fetchAccountRiskLimit response statusCode: %s", response.status_code)
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange fetchAccountRiskLimit raw response: {response_str}")
+                "LMEXExchange fetchAccountRiskLimit raw response: %s", response_str)
 
             if response.status_code != 200:
                 raise Exception(f"HTTP {response.status_code}: {response_str}")
@@ -1423,7 +1422,7 @@ class LMEXExchange(ExchangeProtocol):
             completion(("success", json_data))
 
         except Exception as e:
-            _logger.debug("LMEXExchange fetchAccountRiskLimit error: {str(e)}")
+            _logger.debug("LMEXExchange fetchAccountRiskLimit error: %s", e)
             completion(("failure", e))
 
     def setLeverage(
@@ -1457,17 +1456,17 @@ class LMEXExchange(ExchangeProtocol):
                 completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange setLeverage request URL: {url}")
-        _logger.debug("LMEXExchange setLeverage body: {body_str}")
+        _logger.debug("LMEXExchange setLeverage request URL: %s", url)
+        _logger.debug("LMEXExchange setLeverage body: %s", body_str)
 
         try:
             response = requests.post(url, headers=headers, data=body_str)
             _logger.debug(
-                "LMEXExchange setLeverage response statusCode: {response.status_code}")
+                "LMEXExchange setLeverage response statusCode: %s", response.status_code)
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange setLeverage raw response: {response_str}")
+                "LMEXExchange setLeverage raw response: %s", response_str)
 
             if response.status_code != 200:
                 raise Exception(f"HTTP {response.status_code}: {response_str}")
@@ -1478,7 +1477,7 @@ class LMEXExchange(ExchangeProtocol):
                 completion(("success", json_data))
 
         except Exception as e:
-            _logger.debug("LMEXExchange setLeverage error: {str(e)}")
+            _logger.debug("LMEXExchange setLeverage error: %s", e)
             if completion:
                 completion(("failure", e))
 
@@ -1505,16 +1504,16 @@ class LMEXExchange(ExchangeProtocol):
             }))
             return
 
-        _logger.debug("LMEXExchange fetchAccountFeeInfo request URL: {url}")
+        _logger.debug("LMEXExchange fetchAccountFeeInfo request URL: %s", url)
 
         try:
             response = requests.get(url, headers=headers)
             _logger.debug(
-                "LMEXExchange fetchAccountFeeInfo response statusCode: {response.status_code}")
+                "LMEXExchange fetchAccountFeeInfo response statusCode: %s", response.status_code)
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange fetchAccountFeeInfo raw response: {response_str}")
+                "LMEXExchange fetchAccountFeeInfo raw response: %s", response_str)
 
             if response.status_code != 200:
                 # Default fees on error
@@ -1575,7 +1574,7 @@ class LMEXExchange(ExchangeProtocol):
         query_string = f"?symbol={symbol}"
         url = f"{self.base_url}{auth_path}{query_string}"
 
-        _logger.debug("LMEXExchange fetchPositionTiers request URL: {url}")
+        _logger.debug("LMEXExchange fetchPositionTiers request URL: %s", url)
 
         try:
             headers = self._get_auth_headers(auth_path)
@@ -1586,11 +1585,11 @@ class LMEXExchange(ExchangeProtocol):
         try:
             response = requests.get(url, headers=headers)
             _logger.debug(
-                "LMEXExchange fetchPositionTiers response statusCode: {response.status_code}")
+                "LMEXExchange fetchPositionTiers response statusCode: %s", response.status_code)
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange fetchPositionTiers raw response: {response_str}")
+                "LMEXExchange fetchPositionTiers raw response: %s", response_str)
 
             if response.status_code != 200:
                 raise Exception(
@@ -1630,7 +1629,7 @@ class LMEXExchange(ExchangeProtocol):
                 completion(("success", tiers))
 
         except Exception as e:
-            _logger.debug("LMEXExchange fetchPositionTiers error: {str(e)}")
+            _logger.debug("LMEXExchange fetchPositionTiers error: %s", e)
             completion(("failure", e))
 
     def cancelOrder(
@@ -1680,17 +1679,17 @@ class LMEXExchange(ExchangeProtocol):
                 completion(("failure", e))
             return
 
-        _logger.debug("LMEXExchange cancelOrder URL: {url}")
+        _logger.debug("LMEXExchange cancelOrder URL: %s", url)
 
         try:
             # LMEX uses DELETE method for canceling orders
             response = requests.delete(url, headers=headers)
             _logger.debug(
-                "LMEXExchange cancelOrder response statusCode: {response.status_code}")
+                "LMEXExchange cancelOrder response statusCode: %s", response.status_code)
 
             response_str = response.text
             _logger.debug(
-                "LMEXExchange cancelOrder raw response: {response_str}")
+                "LMEXExchange cancelOrder raw response: %s", response_str)
 
             if response.status_code == 200:
                 json_data = json.loads(response_str) if response_str else {}
@@ -1702,7 +1701,7 @@ class LMEXExchange(ExchangeProtocol):
                         f"HTTP {response.status_code}: {response_str}")))
 
         except Exception as e:
-            _logger.debug("LMEXExchange cancelOrder error: {str(e)}")
+            _logger.debug("LMEXExchange cancelOrder error: %s", e)
             if completion:
                 completion(("failure", e))
 
@@ -1740,14 +1739,11 @@ class LMEXExchange(ExchangeProtocol):
             # Calculate mid price
             mid_price = (upper_price + lower_price) / 2.0
 
-            # Get price precision for the symbol
-            price_precision = self.precision_manager.get_price_precision(
-                symbol)
-
-            # Format prices with correct precision
-            mid_price_str = f"{mid_price:.{price_precision}f}"
-            upper_price_str = f"{upper_price:.{price_precision}f}"
-            lower_price_str = f"{lower_price:.{price_precision}f}"
+            # Format prices with the symbol's precompiled price formatter
+            price_fmt = self.precision_manager.get_order_formatters(symbol)[0]
+            mid_price_str = price_fmt(mid_price)
+            upper_price_str = price_fmt(upper_price)
+            lower_price_str = price_fmt(lower_price)
 
             # Build request body according to LMEX API format
             body = {
@@ -1785,7 +1781,7 @@ class LMEXExchange(ExchangeProtocol):
 
             response = requests.post(url, json=body, headers=headers)
 
-            _logger.debug("createGridBot response => {response.text}")
+            _logger.debug("createGridBot response => %s", response.text)
 
             # Parse response
             try:
@@ -1831,7 +1827,7 @@ class LMEXExchange(ExchangeProtocol):
                 headers["authorization"] = f"Bearer {bearer_token}"
             elif api_key and secret_key:
                 # Use standard LMEX API key authentication
-                nonce = str(int(time.time() * 1000))
+                nonce = str(time.time_ns() // 1_000_000)
                 signature = self._generate_signature(path, nonce, "")
 
                 headers["request-api"] = api_key
@@ -1844,7 +1840,7 @@ class LMEXExchange(ExchangeProtocol):
 
             response = requests.get(url, headers=headers)
 
-            _logger.debug("fetchGridBots raw => {response.text}")
+            _logger.debug("fetchGridBots raw => %s", response.text)
 
             try:
                 data = response.json()
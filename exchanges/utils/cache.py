@@ -0,0 +1,59 @@
+"""TTL cache for slow-changing exchange API responses"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe key/value cache whose entries expire after `ttl` seconds.
+
+    Hit and miss counts are kept so callers can monitor the hit rate.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.ttl = float(ttl)
+        self._ttl_ns = int(ttl * 1_000_000_000)
+        self.hits = 0
+        self.misses = 0
+        self._store: Dict[Hashable, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (True, value) for a fresh entry, otherwise (False, None)"""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None:
+                expires, value = entry
+                if time.monotonic_ns() < expires:
+                    self.hits += 1
+                    return True, value
+                del self._store[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, replacing any existing entry"""
+        with self._lock:
+            self._store[key] = (time.monotonic_ns() + self._ttl_ns, value)
+
+    def pop(self, key: Hashable):
+        """Drop a single entry if present"""
+        with self._lock:
+            self._store.pop(key, None)
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._store.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,27 @@
+"""JSON encoding helpers - uses orjson when it is installed"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+
+if orjson is not None:
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode a JSON payload (bytes or str)"""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode an object as compact JSON text"""
+        return orjson.dumps(obj).decode()
+else:
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode a JSON payload (bytes or str)"""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode an object as compact JSON text"""
+        return json.dumps(obj, separators=(",", ":"))
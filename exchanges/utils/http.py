@@ -0,0 +1,44 @@
+"""Pooled HTTP sessions shared by exchange clients"""
+
+from typing import Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds applied when a call does not pass its own timeout
+DEFAULT_TIMEOUT: Tuple[float, float] = (3, 10)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to every request"""
+
+    def __init__(self, *args, timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+                 **kwargs):
+        self._timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=timeout or self._timeout, **kwargs)
+
+
+def create_session(pool_size: int = 32,
+                   timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT
+                   ) -> requests.Session:
+    """
+    Create a requests.Session that keeps connections alive.
+
+    Reusing the session skips the TCP and TLS handshake on every call
+    after the first; pool_size bounds the idle connections kept per host
+    so concurrent requests (e.g. a gathered dashboard refresh) each get
+    their own socket. Requests without an explicit timeout use `timeout`,
+    and idempotent requests are retried twice on connection errors -
+    order placement (POST) is never retried.
+    """
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.1, status_forcelist=(), raise_on_status=False)
+    adapter = _TimeoutHTTPAdapter(pool_connections=4, pool_maxsize=pool_size,
+                                  max_retries=retries, timeout=timeout)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
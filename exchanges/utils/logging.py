@@ -4,6 +4,7 @@ Exchange-specific logging configuration for the abstraction layer
 
 import logging
 import os
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Optional
 
@@ -133,13 +134,13 @@ class ExchangeLogger:
         """Log order placement with consistent format"""
         if success:
             order_id = None
-            if response and isinstance(response, dict):
+            if response and isinstance(response, Mapping):
                 # Try different response formats
                 if 'data' in response:
                     order_id = response['data'].get('orderId') or response['data'].get('orderID')
                 elif 'orderID' in response:
                     order_id = response['orderID']
-                elif isinstance(response.get('rawResponse'), dict):
+                elif isinstance(response.get('rawResponse'), Mapping):
                     raw = response['rawResponse']
                     if 'data' in raw:
                         order_id = raw['data'].get('orderId')
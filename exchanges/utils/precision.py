@@ -1,15 +1,35 @@
 """Symbol Precision Manager for Exchange Clients"""
 
+import functools
 import json
 import os
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional, Tuple
 from datetime import datetime
 
+from .codec import loads
+
 # Module logger
 _logger = logging.getLogger("exchange.precision")
 
 
+def _per_symbol(method):
+    """Memoize a symbol getter until that symbol's precision info changes"""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, symbol: str):
+        derived = self._derived.get(symbol)
+        if derived is not None and name in derived:
+            return derived[name]
+        value = method(self, symbol)
+        # Unknown symbols fall back to defaults; don't pin those
+        if symbol in self.precision_cache:
+            self._derived.setdefault(symbol, {})[name] = value
+        return value
+    return wrapper
+
+
 class SymbolPrecisionManager:
     """
     Manages symbol precision data for exchanges to ensure accurate order formatting
@@ -18,7 +38,9 @@ class SymbolPrecisionManager:
 
     def __init__(self, exchange_name: str):
         self.exchange_name = exchange_name
-        self.precision_cache: Dict[str, Dict[str, Any]] = {}
+        # symbol -> {getter name: value} for _per_symbol getters
+        self._derived: Dict[str, Dict[str, Any]] = {}
+        self.precision_cache = {}
         self.last_update: Optional[datetime] = None
         self.cache_duration_hours = 24
         self.cache_file = f"{exchange_name.lower()}_precision_cache.json"
@@ -35,12 +57,28 @@ class SymbolPrecisionManager:
             cls._instances[exchange_name] = cls(exchange_name)
         return cls._instances[exchange_name]
 
+    @property
+    def precision_cache(self) -> Dict[str, Dict[str, Any]]:
+        """symbol -> precision info, from the cache file or the exchange"""
+        return self._precision_cache
+
+    @precision_cache.setter
+    def precision_cache(self, value: Dict[str, Dict[str, Any]]):
+        # A replacement table (reload or full fetch) stales every memoized getter
+        self._precision_cache = value
+        self._derived.clear()
+
     def get_symbol_info(self, symbol: str) -> Dict[str, Any]:
         """Get all precision info for a symbol"""
-        if self._needs_refresh():
-            self._fetch_all_symbols()
-        return self.precision_cache.get(symbol, {})
-
+        info = self.precision_cache.get(symbol)
+        if info is None:
+            # Only an empty cache is worth a refresh; unknown symbols fall through
+            if self._needs_refresh():
+                self._fetch_all_symbols()
+            info = self.precision_cache.get(symbol, {})
+        return info
+
+    @_per_symbol
     def get_price_precision(self, symbol: str) -> int:
         """Get price decimal precision for a symbol"""
         info = self.get_symbol_info(symbol)
@@ -65,6 +103,7 @@ class SymbolPrecisionManager:
             return len(tick_str.split('.')[1])
         return 0
 
+    @_per_symbol
     def get_quantity_precision(self, symbol: str) -> int:
         """Get quantity decimal precision for a symbol"""
         info = self.get_symbol_info(symbol)
@@ -97,6 +136,19 @@ class SymbolPrecisionManager:
             return len(qty_str.split('.')[1])
         return 0
 
+    @_per_symbol
+    def get_order_formatters(self, symbol: str
+                             ) -> Tuple[Callable[[float], str], Callable[[float], str], float]:
+        """
+        Get (price_fmt, qty_fmt, min_trade_volume) for a symbol.
+
+        Built once per symbol so order placement does one lookup instead of
+        three precision queries; rebuilt after update_symbol_info().
+        """
+        price_fmt = f"{{:.{self.get_price_precision(symbol)}f}}".format
+        qty_fmt = f"{{:.{self.get_quantity_precision(symbol)}f}}".format
+        return price_fmt, qty_fmt, self.get_min_trade_volume(symbol)
+
     def get_min_quantity(self, symbol: str) -> float:
         """Get minimum order quantity for a symbol"""
         info = self.get_symbol_info(symbol)
@@ -109,6 +161,7 @@ class SymbolPrecisionManager:
                         "min_order_size",
                         1))))
 
+    @_per_symbol
     def get_min_trade_volume(self, symbol: str) -> float:
         """Get minimum trade volume/quantity for a symbol"""
         info = self.get_symbol_info(symbol)
@@ -133,6 +186,8 @@ class SymbolPrecisionManager:
 
     def is_symbol_supported(self, symbol: str) -> bool:
         """Check if a symbol is supported"""
+        if symbol in self.precision_cache:
+            return True
         if self._needs_refresh():
             self._fetch_all_symbols()
         return symbol in self.precision_cache
@@ -168,8 +223,8 @@ class SymbolPrecisionManager:
         """Load precision data from cache file"""
         try:
             if os.path.exists(self.cache_path):
-                with open(self.cache_path, 'r') as f:
-                    data = json.load(f)
+                with open(self.cache_path, 'rb') as f:
+                    data = loads(f.read())
                     # Support both formats: 'symbols' and 'precision_cache'
                     # (BitUnix format)
                     self.precision_cache = data.get(
@@ -210,4 +265,15 @@ class SymbolPrecisionManager:
     def update_symbol_info(self, symbol: str, info: Dict[str, Any]):
         """Update precision info for a specific symbol"""
         self.precision_cache[symbol] = info
+        self.invalidate_symbol(symbol)
         self.last_update = datetime.now()
+
+    def invalidate_symbol(self, symbol: Optional[str] = None):
+        """
+        Drop memoized precision values for a symbol (all symbols if None).
+        Call after editing a precision_cache entry in place.
+        """
+        if symbol is None:
+            self._derived.clear()
+        else:
+            self._derived.pop(symbol, None)
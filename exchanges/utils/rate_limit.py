@@ -0,0 +1,59 @@
+"""Token bucket rate limiter shared by exchange clients"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Callers
+    block in acquire() only for as long as the bucket needs to refill -
+    there is no fixed-interval polling.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket can hold
+        """
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens accrued since the last update"""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """Take tokens if available without blocking"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= min(tokens, self.capacity):
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: int = 1):
+        """
+        Block until `tokens` can be taken from the bucket.
+
+        Requests larger than the burst size wait for a full bucket and then
+        leave it in debt, so a single batch call is charged its full cost.
+        """
+        needed = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= needed:
+                    self._tokens -= tokens
+                    return
+                wait = (needed - self._tokens) / self.rate
+            time.sleep(wait)
@@ -11,6 +11,7 @@ from queue import Queue, Empty
 from dataclasses import dataclass
 
 from .base import WebSocketState, WebSocketMessage, WebSocketProtocol
+from .utils.codec import dumps, loads
 
 
 logger = logging.getLogger(__name__)
@@ -106,9 +107,9 @@ class BaseWebSocketManager(WebSocketProtocol):
             True if connection initiated successfully
         """
         with self._lock:
-            if self._state not in [
+            if self._state not in (
                     WebSocketState.DISCONNECTED,
-                    WebSocketState.ERROR]:
+                    WebSocketState.ERROR):
                 logger.warning(
                     f"{self.exchange_name}: Already connected or connecting")
                 return False
@@ -212,7 +213,7 @@ class BaseWebSocketManager(WebSocketProtocol):
             return False
 
         try:
-            message_str = json.dumps(message)
+            message_str = dumps(message)
             self._ws.send(message_str)
             logger.debug(f"{self.exchange_name}: Sent message: {message_str}")
             return True
@@ -236,6 +237,16 @@ class BaseWebSocketManager(WebSocketProtocol):
 
         # Add to subscription tracking (with limit check)
         with self._lock:
+            # Channels already tracked are neither re-sent nor counted again;
+            # _on_open replays them whenever the socket (re)connects
+            new = []
+            for channel in channels:
+                if channel not in self._subscriptions and channel not in new:
+                    new.append(channel)
+            if not new:
+                return True
+            channels = new
+
             # Check if we're approaching the subscription limit
             max_subscriptions = 250  # Safe limit for BitUnix
             current_count = len(self._subscriptions)
@@ -278,6 +289,25 @@ class BaseWebSocketManager(WebSocketProtocol):
         # Send subscription request
         return self._send_subscription_request(channels, True)
 
+    def resubscribe(self, channels: List[Dict[str, Any]]) -> bool:
+        """
+        Re-send tracked subscriptions whose feed has gone quiet.
+
+        Channels that are not tracked are ignored, and tracking is left
+        unchanged. Nothing is sent while disconnected.
+
+        Returns:
+            True if the resubscription request was sent
+        """
+        if not self.is_connected():
+            return False
+        with self._lock:
+            channels = [c for c in channels if c in self._subscriptions]
+        if not channels:
+            return False
+        self._send_subscription_request(channels, False)
+        return self._send_subscription_request(channels, True)
+
     def unsubscribe(self, channels: List[Dict[str, Any]]) -> bool:
         """
         Unsubscribe from channels.
@@ -302,11 +332,11 @@ class BaseWebSocketManager(WebSocketProtocol):
 
     def is_connected(self) -> bool:
         """Check if connected"""
-        return self._state in [
+        return self._state in (
             WebSocketState.CONNECTED,
-            WebSocketState.AUTHENTICATED]
+            WebSocketState.AUTHENTICATED)
 
-    def get_state(self) -> str:
+    def get_state(self) -> WebSocketState:
         """Get connection state"""
         return self._state
 
@@ -352,30 +382,26 @@ class BaseWebSocketManager(WebSocketProtocol):
         self._reconnect_attempts = 0
         self._reconnect_delay = self.reconnect_config.initial_delay
 
-        # Send pending subscriptions in batches (BitUnix has a limit of 300
-        # channels)
+        # Replay every tracked subscription (queued ones included) in
+        # batches; after a reconnect nothing is live on the new socket.
+        # BitUnix has a limit of 300 channels per request.
         with self._lock:
-            if self._pending_subscriptions:
-                # Batch subscriptions to avoid exceeding limits
-                batch_size = 250  # Safe margin under 300 limit
-                total_subs = len(self._pending_subscriptions)
-
-                for i in range(0, total_subs, batch_size):
-                    batch = self._pending_subscriptions[i:i + batch_size]
-                    logger.info(
-                        f"{
-                            self.exchange_name}: Sending batch {
-                            i //
-                            batch_size +
-                            1} with {
-                            len(batch)} subscriptions")
-                    self._send_subscription_request(batch, True)
-                    # Small delay between batches to avoid overwhelming the
-                    # server
-                    if i + batch_size < total_subs:
-                        time.sleep(0.1)
-
-                self._pending_subscriptions.clear()
+            channels = list(self._subscriptions)
+            batch_size = 250  # Safe margin under 300 limit
+            total_subs = len(channels)
+
+            for i in range(0, total_subs, batch_size):
+                batch = channels[i:i + batch_size]
+                logger.info(
+                    f"{self.exchange_name}: Sending batch {i // batch_size + 1} "
+                    f"with {len(batch)} subscriptions")
+                self._send_subscription_request(batch, True)
+                # Small delay between batches to avoid overwhelming the
+                # server
+                if i + batch_size < total_subs:
+                    time.sleep(0.1)
+
+            self._pending_subscriptions.clear()
 
         # Custom callback
         if custom_callback:
@@ -403,7 +429,7 @@ class BaseWebSocketManager(WebSocketProtocol):
         """Handle raw WebSocket message"""
         try:
             # Parse JSON message
-            data = json.loads(message)
+            data = loads(message)
 
             # Log all messages for debugging
             logger.debug(f"{self.exchange_name}: Received message: {data}")
@@ -553,7 +579,158 @@ class BaseWebSocketManager(WebSocketProtocol):
         return WebSocketMessage(
             channel=channel,
             symbol=symbol,
-            timestamp=int(time.time() * 1000),
+            timestamp=time.time_ns() // 1_000_000,
             data=data,
             raw=data if isinstance(data, dict) else None
         )
+
+
+class WebSocketPool:
+    """
+    Pool of pre-warmed WebSocket managers for a single endpoint.
+
+    Connections are opened eagerly when the pool starts so that the
+    TCP + TLS + WebSocket handshake (and authentication, if any) is paid
+    up-front instead of on the critical path of the first subscribe.
+
+    Idle connections that drop are discarded and replaced in the background
+    so the pool keeps its configured size. Connections handed out with
+    acquire() use the manager's own reconnection logic until released.
+    """
+
+    def __init__(self,
+                 url: str,
+                 factory: Callable[[], BaseWebSocketManager],
+                 size: int = 2,
+                 auth_fn: Optional[Callable[[BaseWebSocketManager, Any], None]] = None):
+        """
+        Initialize WebSocket pool.
+
+        Args:
+            url: WebSocket URL every pooled connection connects to
+            factory: Callable creating a new exchange-specific manager
+            size: Number of connections to keep warm
+            auth_fn: Optional callback run on open as auth_fn(manager, ws)
+        """
+        self.url = url
+        self.size = size
+        self._factory = factory
+        self._auth_fn = auth_fn
+
+        self._idle: List[BaseWebSocketManager] = []
+        self._in_use: List[BaseWebSocketManager] = []
+        self._closed = False
+
+        self._cond = threading.Condition()
+
+    def start(self):
+        """Open all pooled connections concurrently"""
+        for _ in range(self.size):
+            self._spawn()
+
+    def acquire(self, timeout: float = 10.0) -> Optional[BaseWebSocketManager]:
+        """
+        Take a connected manager out of the pool.
+
+        Args:
+            timeout: Seconds to wait for a warm connection
+
+        Returns:
+            A connected manager, or None if none became ready in time
+        """
+        deadline = time.time() + timeout
+        with self._cond:
+            while not self._closed:
+                for manager in self._idle:
+                    if manager.is_connected():
+                        self._idle.remove(manager)
+                        self._in_use.append(manager)
+                        manager.reconnect_config.enabled = True
+                        return manager
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._cond.wait(timeout=min(remaining, 0.1))
+
+        logger.warning(f"WebSocketPool: No warm connection for {self.url}")
+        return None
+
+    def release(self, manager: BaseWebSocketManager):
+        """
+        Return a manager to the pool.
+
+        Subscriptions and callbacks are dropped; a dead connection is
+        replaced instead of being returned.
+        """
+        with self._cond:
+            if manager in self._in_use:
+                self._in_use.remove(manager)
+
+            manager.on_message = None
+            manager.on_error = None
+            manager.on_state_change = None
+            manager.reconnect_config.enabled = False
+
+            if manager.is_connected() and not self._closed:
+                manager.unsubscribe(list(manager._subscriptions))
+                self._idle.append(manager)
+                self._cond.notify_all()
+                return
+
+        manager.disconnect()
+        self._spawn()
+
+    def close(self):
+        """Disconnect every pooled connection"""
+        with self._cond:
+            self._closed = True
+            managers = self._idle + self._in_use
+            self._idle = []
+            self._in_use = []
+            self._cond.notify_all()
+
+        for manager in managers:
+            manager.disconnect()
+
+    def _spawn(self):
+        """Create a new pooled connection in the background"""
+        if self._closed:
+            return
+
+        manager = self._factory()
+        manager.reconnect_config.enabled = False
+
+        def on_open(ws):
+            if self._auth_fn:
+                self._auth_fn(manager, ws)
+            with self._cond:
+                self._cond.notify_all()
+
+        def on_close(ws, code, message):
+            self._on_pooled_close(manager)
+
+        with self._cond:
+            self._idle.append(manager)
+
+        manager.connect(self.url, on_open=on_open, on_close=on_close)
+
+    def _on_pooled_close(self, manager: BaseWebSocketManager):
+        """Replace an idle connection that dropped"""
+        with self._cond:
+            if manager not in self._idle:
+                return
+            self._idle.remove(manager)
+
+        logger.info(f"WebSocketPool: Replacing dropped connection to {self.url}")
+        threading.Thread(
+            target=self._replace,
+            args=(manager,),
+            name="WebSocketPool-Replace",
+            daemon=True
+        ).start()
+
+    def _replace(self, manager: BaseWebSocketManager):
+        """Tear down a dead connection and open a fresh one"""
+        manager.disconnect()
+        self._spawn()
@@ -514,7 +514,7 @@ class GridBot:
                 # Show WebSocket status
                 if self.use_websocket and int(time.time()) % 10 == 0:
                     ws_state = self.exchange.getWebSocketState()
-                    print(f"\r📡 WebSocket: {ws_state} | Price: ${current_price:.2f} | Orders: {len(self.order_manager.active_orders)} active", end="", flush=True)
+                    print(f"\r📡 WebSocket: {ws_state.name.lower()} | Price: ${current_price:.2f} | Orders: {len(self.order_manager.active_orders)} active", end="", flush=True)
                 
             except Exception as e:
                 print(f"\nMonitor error: {e}")
@@ -36,6 +36,10 @@ setup(
         "python-dotenv>=0.19.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.18.0",
@@ -1,9 +1,20 @@
 """Basic tests for the exchange library"""
 
+import asyncio
+import json
+import threading
+import time
 from unittest.mock import Mock, patch
+
+import pytest
 from exchanges.lmex import LMEXExchange
-from exchanges.bitunix import BitUnixExchange
-from exchanges.base import ExchangeOrderRequest, ExchangeTicker
+from exchanges.bitunix import BitUnixExchange, BitUnixWebSocketManager
+from exchanges.utils.precision import SymbolPrecisionManager
+from exchanges.utils.rate_limit import TokenBucket
+from exchanges.base import (
+    ExchangeOrderRequest, ExchangeTicker, ExchangeProtocol, PositionSide, WebSocketState, RawView,
+    TickerArray, ExchangeInterface,
+)
 
 
 class TestLMEXExchange:
@@ -14,6 +25,7 @@ class TestLMEXExchange:
         exchange = LMEXExchange()
         assert exchange.base_url == "https://api.lmex.io/futures"
         assert exchange.precision_manager is not None
+        assert isinstance(exchange, ExchangeProtocol)
     
     @patch('requests.get')
     def test_fetch_tickers(self, mock_get):
@@ -101,8 +113,579 @@ class TestBitUnixExchange:
         exchange = BitUnixExchange()
         assert exchange.base_url == "https://api.bitunix.com"
         assert exchange.precision_manager is not None
+
+    def test_side_and_symbol_translation(self):
+        """Test side lookups and memoized symbol formatting"""
+        exchange = BitUnixExchange()
+        assert exchange.translate_side_to_exchange(PositionSide.LONG) == "BUY"
+        assert exchange.translate_side_to_exchange("SHORT") == "SELL"
+        assert exchange.translate_side_to_exchange("BUY") == "BUY"
+        assert exchange.translate_side_from_exchange("SELL") == PositionSide.SHORT
+        assert exchange.translate_side_from_exchange("Buy") == PositionSide.LONG
+        assert exchange.translate_side_from_exchange("sell") == PositionSide.SHORT
+        assert exchange.translate_side_from_exchange("HOLD") == "HOLD"
+
+        assert exchange.get_symbol_format("BTCUSDT") == "BTCUSDT"
+        assert exchange._symbol_format_cache == {"BTCUSDT": "BTCUSDT"}
+
+        exchange.SYMBOL_FORMAT_CACHE_SIZE = 1
+        assert exchange.get_symbol_format("ETHUSDT") == "ETHUSDT"
+        assert "ETHUSDT" not in exchange._symbol_format_cache
+
+    def test_async_facade(self):
+        """Test coroutine wrappers return payloads and raise failures"""
+        exchange = BitUnixExchange()
+        exchange.fetchBalance = lambda completion: completion(("success", ["USDT"]))
+        exchange.fetchOrders = lambda completion: completion(("failure", ValueError("boom")))
+
+        assert asyncio.run(exchange.fetchBalanceAsync()) == ["USDT"]
+        with pytest.raises(ValueError):
+            asyncio.run(exchange.fetchOrdersAsync())
+
+    def test_class_logger(self):
+        """Test the exchange logger is bound once per class"""
+        from exchanges.adapters import BitUnixAdapter
+        from exchanges.utils.logging import ExchangeLogger
+
+        logger = ExchangeLogger.get_logger("BitUnix")
+        assert BitUnixExchange.logger is logger
+        assert BitUnixAdapter.logger is logger
+        assert BitUnixExchange().logger is logger
+
+    def test_batch_price_and_quantity(self):
+        """Test batch helpers apply the scalar methods element-wise"""
+        exchange = BitUnixExchange()
+        exchange.validateAndAdjustPrice = lambda symbol, price, side: round(price, 1)
+        exchange.normalizeQuantity = lambda symbol, qty, price: round(qty, 3)
+
+        assert exchange.validateAndAdjustPrices(
+            ["BTCUSDT", "ETHUSDT"], [50000.04, 3000.06], ["BUY", "SELL"]) == [50000.0, 3000.1]
+        assert exchange.normalizeQuantities(
+            ["BTCUSDT", "ETHUSDT"], [0.12345, 1.5], [50000.0, 3000.0]) == [0.123, 1.5]
+
+    def test_sign_matches_double_sha256(self):
+        """Test request signing follows the documented double SHA-256 scheme"""
+        exchange = BitUnixExchange()
+        digest = exchange.sha256Hex("abc12345" + "1700000000000" + "key" + "a1b2" + "{}")
+        expected = exchange.sha256Hex(digest + "secret")
+
+        assert exchange._sign("abc12345", "1700000000000", "key", "a1b2", "{}", "secret") == expected
+
+    def test_http_session_reused(self):
+        """Test REST calls share one pooled session until close()"""
+        exchange = BitUnixExchange()
+        session = exchange._http
+        assert exchange._http is session
+
+        exchange.close()
+        assert exchange._session is None
+
+    def test_subscribe_tickers_single_frame(self):
+        """Test batched ticker subscription sends one frame"""
+        manager = BitUnixWebSocketManager()
+        manager.is_connected = lambda: True
+        sent = []
+        manager.send = lambda request: sent.append(request) or True
+
+        assert manager.subscribe_tickers(["BTCUSDT", "ETHUSDT"])
+        assert len(sent) == 1
+        assert sent[0]["args"] == [{"symbol": "BTCUSDT", "ch": "ticker"},
+                                   {"symbol": "ETHUSDT", "ch": "ticker"}]
+
+    def test_streamed_price_cache(self):
+        """Test lastTradePrice reads streamed prices and refreshes stale ones"""
+        exchange = BitUnixExchange()
+        refreshed = []
+        exchange._refresh_price = refreshed.append
+
+        exchange._update_price("BTCUSDT", 50000.0)
+        assert exchange.lastTradePrice("BTCUSDT") == 50000.0
+        assert exchange.getCurrentPrice("BTCUSDT") == 50000.0
+        assert refreshed == []
+
+        exchange._price_cache_ts["BTCUSDT"] -= int((exchange.PRICE_STALE_AFTER + 1) * 1e9)
+        assert ExchangeInterface.lastTradePrice(exchange, "BTCUSDT") == 50000.0
+        assert refreshed == ["BTCUSDT"]
+
+    @patch('requests.Session.get')
+    def test_last_trade_price_expires_after_ttl(self, mock_get):
+        """Test an expired cached price is re-fetched once and then served"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"code": 0, "data": {"lastPrice": "51000"}}'
+        mock_get.return_value = mock_response
+
+        exchange = BitUnixExchange()
+        exchange._update_price("BTCUSDT", 50000.0)
+        exchange._price_cache_ts["BTCUSDT"] -= int(3600 * 1e9)
+
+        assert [exchange.lastTradePrice("BTCUSDT") for _ in range(3)] == [51000.0] * 3
+        assert mock_get.call_count == 1
+
+    def test_stale_price_refresh_throttled_and_rest_only(self):
+        """Test concurrent stale reads of an unsubscribed symbol start one REST refresh"""
+        exchange = BitUnixExchange()
+        fetched = []
+        resubscribed = []
+        exchange._fetch_price = fetched.append
+        exchange._resubscribe_ticker = resubscribed.append
+
+        exchange._update_price("BTCUSDT", 50000.0)
+        exchange._price_cache_ts["BTCUSDT"] -= int((exchange.PRICE_STALE_AFTER + 1) * 1e9)
+        barrier = threading.Barrier(8)
+        prices = []
+
+        def read():
+            barrier.wait()
+            for _ in range(50):
+                prices.append(ExchangeInterface.lastTradePrice(exchange, "BTCUSDT"))
+
+        readers = [threading.Thread(target=read) for _ in range(8)]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        assert prices == [50000.0] * 400
+
+        deadline = time.time() + 2
+        while exchange._price_refreshing and time.time() < deadline:
+            time.sleep(0.01)
+        assert fetched == ["BTCUSDT"]
+        assert resubscribed == []
+
+    def test_subscribe_skips_tracked_channels(self):
+        """Test repeated subscribes send one frame and leave room for new symbols"""
+        manager = BitUnixWebSocketManager()
+        manager.is_connected = lambda: True
+        sent = []
+        manager.send = lambda request: sent.append(request) or True
+
+        for _ in range(300):
+            assert manager.subscribe_ticker("BTCUSDT")
+        assert len(sent) == 1
+        assert manager._subscriptions == [{"symbol": "BTCUSDT", "ch": "ticker"}]
+        assert manager.subscribe([{"symbol": "ETHUSDT", "ch": "ticker"}])
+
+        assert manager.resubscribe([{"symbol": "BTCUSDT", "ch": "ticker"}])
+        assert [frame["op"] for frame in sent[-2:]] == ["unsubscribe", "subscribe"]
+        assert len(manager._subscriptions) == 2
+
+    def test_reconnect_replays_tracked_subscriptions(self):
+        """Test a dropped socket resends every tracked channel once it reopens"""
+        manager = BitUnixWebSocketManager()
+        manager.is_connected = lambda: True
+        sent = []
+        manager.send = lambda request: sent.append(request) or True
+        manager.subscribe_tickers(["BTCUSDT", "ETHUSDT"])
+
+        manager._on_close(None, 1006, "dropped")
+        assert manager.subscribe_ticker("BTCUSDT")
+        assert len(sent) == 1
+
+        manager._on_open(None)
+        assert sent[-1] == {"op": "subscribe", "args": [
+            {"symbol": "BTCUSDT", "ch": "ticker"}, {"symbol": "ETHUSDT", "ch": "ticker"}]}
+
+    def test_history_query_sorted_for_signature(self):
+        """Test history params are signed in lexical key order"""
+        query, sign_params = BitUnixExchange._historyQuery(
+            {"symbol": "BTCUSDT", "limit": "50", "skip": "100"})
+
+        assert query == "?limit=50&skip=100&symbol=BTCUSDT"
+        assert sign_params == "limit50skip100symbolBTCUSDT"
+        assert BitUnixExchange._historyQuery({}) == ("", "")
+
+        query, sign_params = BitUnixExchange._historyQuery({"orderId": "a&b=c"})
+        assert query == "?orderId=a%26b%3Dc"
+        assert sign_params == "orderIda&b=c"
+
+    def test_iter_history_orders_pages(self):
+        """Test history paging advances skip until a short page"""
+        exchange = BitUnixExchange()
+        calls = []
+
+        def fetch(skip=0, limit=50, completion=None, **kwargs):
+            calls.append(skip)
+            rows = list(range(5))[skip:skip + limit]
+            completion(("success", rows))
+
+        exchange.fetchHistoryOrders = fetch
+
+        async def collect():
+            return [row async for row in exchange.iterHistoryOrders(page_size=2)]
+
+        assert asyncio.run(collect()) == [0, 1, 2, 3, 4]
+        assert calls == [0, 2, 4]
+
+    @patch('requests.Session.post')
+    def test_cancel_orders_single_request(self, mock_post):
+        """Test batch cancel sends every ID in one orderList"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"code": 0, "data": {"successList": []}}'
+        mock_post.return_value = mock_response
+
+        exchange = BitUnixExchange()
+        results = []
+        with patch('exchanges.bitunix.APIKeyStorage') as storage:
+            storage.shared.return_value.getKeys.return_value = {
+                "apiKey": "key", "secretKey": "secret"}
+            exchange.cancelOrders("BTCUSDT", orderIDs=["1", "2"], clOrderIDs=["c3"],
+                                  completion=results.append)
+
+        assert results[0][0] == "success"
+        assert mock_post.call_count == 1
+        body = json.loads(mock_post.call_args.kwargs["data"])
+        assert body["orderList"] == [{"orderId": "1"}, {"orderId": "2"}, {"clientId": "c3"}]
+
+    @patch('requests.Session.get')
+    def test_last_trade_prices_single_fetch(self, mock_get):
+        """Test uncached prices are filled from one tickers request"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"code": 0, "data": [
+            {"symbol": "BTCUSDT", "lastPrice": "50000"},
+            {"symbol": "ETHUSDT", "lastPrice": "3000"},
+        ]}).encode()
+        mock_get.return_value = mock_response
+
+        exchange = BitUnixExchange()
+        exchange._update_price("SOLUSDT", 150.0)
+        prices = exchange.lastTradePrices(["BTCUSDT", "ETHUSDT", "SOLUSDT"])
+
+        assert prices == {"BTCUSDT": 50000.0, "ETHUSDT": 3000.0, "SOLUSDT": 150.0}
+        assert mock_get.call_count == 1
+        assert exchange.lastTradePrice("ETHUSDT") == 3000.0
+
+    @patch('requests.Session.get')
+    def test_fetch_tickers_warms_price_cache(self, mock_get):
+        """Test a tickers download serves lastTradePrice locally until the TTL expires"""
+        tickers = Mock()
+        tickers.status_code = 200
+        tickers.content = b'{"code": 0, "data": [{"symbol": "BTCUSDT", "lastPrice": "50000"}]}'
+        ticker = Mock()
+        ticker.status_code = 200
+        ticker.content = b'{"code": 0, "data": {"lastPrice": "51000"}}'
+        mock_get.side_effect = [tickers, ticker]
+
+        exchange = BitUnixExchange()
+        exchange.fetchTickers(lambda result: None)
+
+        assert exchange.lastTradePrice("BTCUSDT") == 50000.0
+        assert mock_get.call_count == 1
+
+        exchange._price_cache_ts["BTCUSDT"] -= int((exchange.PRICE_TTL + 1) * 1e9)
+        assert exchange.lastTradePrice("BTCUSDT") == 51000.0
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_last_trade_price_cold_start_fetches_once(self, mock_get):
+        """Test concurrent cold-start callers share one ticker request"""
+        def respond(url):
+            time.sleep(0.05)
+            response = Mock()
+            response.status_code = 200
+            response.content = b'{"code": 0, "data": {"lastPrice": "50000"}}'
+            return response
+
+        mock_get.side_effect = respond
+        exchange = BitUnixExchange()
+        exchange.webSocketManager._ticker_cache.pop("BTCUSDT", None)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            exchange.lastTradePrice("BTCUSDT"))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [50000.0] * 4
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
+    def test_fetch_positions_parsing(self, mock_get):
+        """Test positions are signed by side and malformed rows are skipped"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"code": 0, "data": [
+            {"symbol": "BTCUSDT", "side": "SHORT", "qty": "2", "entryValue": "100000",
+             "unrealizedPNL": "500"},
+            {"symbol": "ETHUSDT", "side": "LONG", "qty": "abc", "entryValue": "3000"},
+        ]}).encode()
+        mock_get.return_value = mock_response
+
+        results = []
+        with patch('exchanges.bitunix.APIKeyStorage') as storage:
+            storage.shared.return_value.getKeys.return_value = {
+                "apiKey": "key", "secretKey": "secret"}
+            BitUnixExchange().fetchPositions(results.append)
+
+        status, positions = results[0]
+        assert status == "success"
+        assert len(positions) == 1
+        assert positions[0].size == -2.0
+        assert positions[0].entryPrice == 50000.0
+        assert positions[0].pnlPercentage == 0.5
+
+    @patch('requests.Session.get')
+    def test_last_trade_price_full_scan_only_on_failure(self, mock_get):
+        """Test the tickers list is only fetched when opted in and the ticker call fails"""
+        def respond(url):
+            response = Mock()
+            response.status_code = 500 if "symbol=" in url else 200
+            response.content = b'{"code": 0, "data": [{"symbol": "BTCUSDT", "lastPrice": "50000"}]}'
+            return response
+
+        mock_get.side_effect = respond
+        exchange = BitUnixExchange()
+        exchange.webSocketManager._ticker_cache.pop("BTCUSDT", None)
+
+        assert exchange.lastTradePrice("BTCUSDT") == 0.0
+        assert mock_get.call_count == 1
+        assert exchange.lastTradePrice("BTCUSDT", allow_full_scan=True) == 50000.0
+        assert mock_get.call_count == 3
+
+    @patch('requests.Session.get')
+    def test_fetch_balance_remembers_working_method(self, mock_get):
+        """Test cold-start probes run together and the winner is tried first next time"""
+        def respond(url, headers=None):
+            response = Mock()
+            response.status_code = 200 if url.endswith("?marginCoin=USDT") else 404
+            response.content = b'{"code": 0, "data": [{"marginCoin": "USDT", "available": "100"}]}'
+            return response
+
+        mock_get.side_effect = respond
+        exchange = BitUnixExchange()
+        results = []
+        with patch('exchanges.bitunix.APIKeyStorage') as storage:
+            storage.shared.return_value.getKeys.return_value = {
+                "apiKey": "key", "secretKey": "secret"}
+            exchange.fetchBalance(results.append)
+            assert mock_get.call_count == 4  # account probes sent together
+            exchange.fetchBalance(results.append)
+
+        assert mock_get.call_count == 5
+        assert [r[1][0].balance for r in results] == [100.0, 100.0]
+
+    @patch('requests.Session.get')
+    def test_fetch_orders_skips_incomplete_rows(self, mock_get):
+        """Test open orders missing required fields are skipped"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"code": 0, "data": {"orderList": [
+            {"orderId": "1", "symbol": "BTCUSDT", "side": "BUY", "orderType": "LIMIT",
+             "qty": "0.5", "price": "50000", "status": "NEW"},
+            {"orderId": "2", "symbol": "BTCUSDT", "side": "BUY", "orderType": "LIMIT",
+             "status": "NEW"},
+        ]}}).encode()
+        mock_get.return_value = mock_response
+
+        results = []
+        with patch('exchanges.bitunix.APIKeyStorage') as storage:
+            storage.shared.return_value.getKeys.return_value = {
+                "apiKey": "key", "secretKey": "secret"}
+            BitUnixExchange().fetchOrders(results.append)
+
+        status, orders = results[0]
+        assert status == "success"
+        assert [(o.orderId, o.qty, o.price, o.executedQty) for o in orders] == [
+            ("1", 0.5, 50000.0, 0.0)]
+
+    @patch('requests.Session.get')
+    def test_fetch_account_risk_limit_without_position(self, mock_get):
+        """Test the leverage lookup is used when the symbol has no open position"""
+        def respond(url, headers=None):
+            response = Mock()
+            response.status_code = 200
+            if "get_leverage_margin_mode" in url:
+                response.content = b'{"code": 0, "data": {"leverage": 20, "marginMode": "CROSS"}}'
+            else:
+                response.content = b'{"code": 0, "data": []}'
+            return response
+
+        mock_get.side_effect = respond
+        results = []
+        with patch('exchanges.bitunix.APIKeyStorage') as storage:
+            storage.shared.return_value.getKeys.return_value = {
+                "apiKey": "key", "secretKey": "secret"}
+            BitUnixExchange().fetchAccountRiskLimit("BTCUSDT", results.append)
+
+        status, info = results[0]
+        assert status == "success"
+        assert (info["leverage"], info["marginMode"]) == (20, "CROSS")
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get')
+    def test_fetch_account_risk_limit_with_position_skips_leverage_lookup(self, mock_get):
+        """Test an open position answers the risk limit query without a leverage lookup"""
+        response = Mock()
+        response.status_code = 200
+        response.content = b'{"code": 0, "data": [{"symbol": "BTCUSDT", "leverage": 25}]}'
+        mock_get.return_value = response
+        results = []
+        with patch('exchanges.bitunix.APIKeyStorage') as storage:
+            storage.shared.return_value.getKeys.return_value = {
+                "apiKey": "key", "secretKey": "secret"}
+            BitUnixExchange().fetchAccountRiskLimit("BTCUSDT", results.append)
+
+        status, info = results[0]
+        assert status == "success"
+        assert info["leverage"] == 25
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.put')
+    @patch('requests.Session.post')
+    def test_set_leverage_remembers_discovered_endpoint(self, mock_post, mock_put):
+        """Test leverage discovery stops at the first accepted endpoint and reuses it"""
+        def respond(url, headers=None, data=None):
+            response = Mock()
+            response.status_code = 404
+            if url.endswith("/set_leverage") and '"side"' in data:
+                response.status_code = 200
+                response.content = b'{"code": 0, "data": {"leverage": 10}}'
+            return response
+
+        mock_post.side_effect = respond
+        mock_put.side_effect = respond
+        exchange = BitUnixExchange()
+        results = []
+        with patch('exchanges.bitunix.APIKeyStorage') as storage:
+            storage.shared.return_value.getKeys.return_value = {
+                "apiKey": "key", "secretKey": "secret"}
+            exchange.setLeverage("BTCUSDT", 10, completion=results.append)
+
+            # Candidates are tried in order and probing stops at the winner
+            winner = BitUnixExchange._LEVERAGE_ENDPOINTS.index(
+                ("https://fapi.bitunix.com/api/v1/futures/account/set_leverage", "POST", True))
+            calls = winner + 1
+            assert mock_post.call_count + mock_put.call_count == calls
+
+            exchange.setLeverage("BTCUSDT", 10, completion=results.append)
+
+        assert mock_post.call_count + mock_put.call_count == calls + 1
+        assert results == [("success", {"leverage": 10})] * 2
+
+    @patch('requests.Session.post')
+    def test_place_orders_batches_per_symbol(self, mock_post):
+        """Test batch placement sends one request per symbol and keeps input order"""
+        def respond(url, headers=None, data=None):
+            body = json.loads(data)
+            orders = body["orderList"]
+            response = Mock()
+            response.status_code = 200
+            response.content = json.dumps({"code": 0, "data": {
+                "successList": [{"orderId": f"id-{o['clientId']}", "clientId": o["clientId"]}
+                                for o in orders[1:]],
+                "failureList": [{"clientId": orders[0]["clientId"], "errorCode": "1",
+                                 "errorMsg": "rejected"}],
+            }}).encode()
+            return response
+
+        mock_post.side_effect = respond
+        requests = [
+            ExchangeOrderRequest(symbol="BTCUSDT", side="BUY", orderType="LIMIT", qty=1.0,
+                                 price=50000.0, orderLinkId="a"),
+            ExchangeOrderRequest(symbol="ETHUSDT", side="BUY", orderType="LIMIT", qty=1.0,
+                                 price=3000.0, orderLinkId="b"),
+            ExchangeOrderRequest(symbol="BTCUSDT", side="SELL", orderType="LIMIT", qty=1.0,
+                                 price=51000.0, orderLinkId="c"),
+        ]
+
+        exchange = BitUnixExchange()
+        results = []
+        with patch('exchanges.bitunix.APIKeyStorage') as storage:
+            storage.shared.return_value.getKeys.return_value = {
+                "apiKey": "key", "secretKey": "secret"}
+            exchange.placeOrders(requests, results.append)
+
+        assert mock_post.call_count == 2
+        status, orders = results[0]
+        assert status == "success"
+        assert isinstance(orders[0], Exception)
+        assert isinstance(orders[1], Exception)
+        assert orders[2].orderId == "id-c"
+
+    @patch('requests.Session.post')
+    def test_place_orders_rejects_duplicate_link_ids(self, mock_post):
+        """Test a repeated orderLinkId is rejected before sending instead of overwriting"""
+        def respond(url, headers=None, data=None):
+            orders = json.loads(data)["orderList"]
+            response = Mock()
+            response.status_code = 200
+            response.content = json.dumps({"code": 0, "data": {"successList": [
+                {"orderId": f"id-{o['clientId']}", "clientId": o["clientId"]} for o in orders]}}
+            ).encode()
+            return response
+
+        mock_post.side_effect = respond
+        requests = [
+            ExchangeOrderRequest(symbol="BTCUSDT", side="BUY", orderType="LIMIT", qty=1.0,
+                                 price=50000.0, orderLinkId="a"),
+            ExchangeOrderRequest(symbol="BTCUSDT", side="SELL", orderType="LIMIT", qty=1.0,
+                                 price=51000.0, orderLinkId="a"),
+            ExchangeOrderRequest(symbol="BTCUSDT", side="SELL", orderType="LIMIT", qty=1.0,
+                                 price=52000.0),
+        ]
+
+        results = []
+        with patch('exchanges.bitunix.APIKeyStorage') as storage:
+            storage.shared.return_value.getKeys.return_value = {
+                "apiKey": "key", "secretKey": "secret"}
+            BitUnixExchange().placeOrders(requests, results.append)
+
+        assert len(json.loads(mock_post.call_args.kwargs["data"])["orderList"]) == 2
+        status, orders = results[0]
+        assert status == "success"
+        assert (orders[0].orderId, orders[0].price) == ("id-a", 50000.0)
+        assert "Duplicate" in str(orders[1])
+        assert orders[2].price == 52000.0 and orders[2].clientId
+
+    def test_default_cancel_orders_aggregates(self):
+        """Test the interface default cancels one by one and reports the first failure"""
+        exchange = BitUnixExchange()
+        calls = []
+
+        def cancel(orderID=None, clOrderID=None, symbol=None, completion=None):
+            calls.append(orderID or clOrderID)
+            ok = orderID != "bad"
+            completion(("success", orderID) if ok else ("failure", Exception("bad")))
+
+        exchange.cancelOrder = cancel
+        results = []
+        ExchangeInterface.cancelOrders(exchange, "BTCUSDT", orderIDs=["1"], clOrderIDs=["c2"],
+                                       completion=results.append)
+        assert calls == ["1", "c2"]
+        assert results == [("success", ["1", None])]
+
+        results.clear()
+        ExchangeInterface.cancelOrders(exchange, "BTCUSDT", orderIDs=["bad", "2"],
+                                       completion=results.append)
+        assert results[0][0] == "failure"
+
+    def test_run_coroutine(self):
+        """Test run() executes a coroutine with or without uvloop installed"""
+        exchange = BitUnixExchange()
+        exchange.fetchBalance = lambda completion: completion(("success", ["USDT"]))
+
+        try:
+            assert ExchangeInterface.run(exchange.fetchBalanceAsync()) == ["USDT"]
+        finally:
+            asyncio.set_event_loop_policy(None)
+
+    def test_dashboard_snapshot(self):
+        """Test the dashboard snapshot gathers all four requests"""
+        exchange = BitUnixExchange()
+        exchange.fetchTickers = lambda completion: completion(("success", ["T"]))
+        exchange.fetchPositions = lambda completion: completion(("success", ["P"]))
+        exchange.fetchBalance = lambda completion: completion(("success", ["B"]))
+        exchange.fetchOrders = lambda completion: completion(("success", ["O"]))
+
+        snapshot = asyncio.run(exchange.fetchDashboardSnapshotAsync())
+        assert (snapshot.tickers, snapshot.positions, snapshot.balances,
+                snapshot.orders) == (["T"], ["P"], ["B"], ["O"])
+        assert snapshot.ts > 0
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_tickers(self, mock_get):
         """Test fetching tickers"""
         # Mock response
@@ -122,6 +705,7 @@ class TestBitUnixExchange:
                 }
             ]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
         
         exchange = BitUnixExchange()
@@ -166,5 +750,213 @@ class TestExchangeOrderRequest:
         assert order.orderLinkId is None
 
 
+class TestRawView:
+    """Test lazily decoded raw responses"""
+
+    def test_decodes_on_first_access(self):
+        """Test the payload is only decoded when a key is read"""
+        raw = RawView(b'{"code": 0, "data": {"orderId": "42"}}')
+        assert raw._decoded is None
+        assert raw["data"]["orderId"] == "42"
+        assert raw.get("missing", "default") == "default"
+        assert dict(raw) == {"code": 0, "data": {"orderId": "42"}}
+
+
+class TestTickerArray:
+    """Test slotted data structures and the columnar ticker view"""
+
+    def test_structures_are_slotted(self):
+        """Test hot-path structures carry no per-instance __dict__"""
+        request = ExchangeOrderRequest(symbol="BTCUSDT", side="BUY", orderType="LIMIT", qty=1.0)
+        assert not hasattr(request, "__dict__")
+        assert not hasattr(ExchangeTicker("BTCUSDT"), "__dict__")
+        assert request.timeInForce == "GTC"
+
+    def test_from_tickers(self):
+        """Test columns line up with the source tickers"""
+        tickers = []
+        for symbol, price in (("BTCUSDT", 50000.0), ("ETHUSDT", 3000.0)):
+            ticker = ExchangeTicker(symbol)
+            ticker.lastPrice = price
+            ticker.bidPrice = price - 1
+            ticker.askPrice = price + 1
+            tickers.append(ticker)
+
+        columns = TickerArray.from_tickers(tickers)
+        assert len(columns) == 2
+        assert columns.symbols == ["BTCUSDT", "ETHUSDT"]
+        assert list(columns.last) == [50000.0, 3000.0]
+        assert columns.ask[1] - columns.bid[1] == 2.0
+
+
+class TestTTLCache:
+    """Test cached fetch helpers on ExchangeInterface"""
+
+    def test_fee_info_cached_until_ttl(self):
+        """Test repeated calls hit the cache and count hits"""
+        exchange = BitUnixExchange()
+        calls = []
+
+        def fetch(completion):
+            calls.append(1)
+            completion(("success", {"vipLevel": 0}))
+
+        exchange.fetchAccountFeeInfo = fetch
+        results = []
+        exchange.fetchAccountFeeInfoCached(results.append)
+        exchange.fetchAccountFeeInfoCached(results.append)
+
+        assert len(calls) == 1
+        assert results == [("success", {"vipLevel": 0})] * 2
+        assert exchange.cache_stats()["fetchAccountFeeInfo"]["hits"] == 1
+
+    def test_prefetch_metadata_warms_caches(self):
+        """Test prefetch fills the caches so later lookups make no calls"""
+        exchange = BitUnixExchange()
+        calls = []
+
+        def fetch(name, data):
+            def method(*args):
+                calls.append((name,) + args[:-1])
+                args[-1](("success", data))
+            return method
+
+        exchange.fetchAccountFeeInfo = fetch("fee", {"makerFee": 0.0002})
+        exchange.fetchPositionTiers = fetch("tiers", [])
+        exchange.fetchLeverageAndMarginMode = fetch("leverage", {"leverage": 5})
+
+        with patch.object(exchange.precision_manager, 'get_order_formatters') as formatters:
+            asyncio.run(exchange.prefetch_metadata(["BTCUSDT", "ETHUSDT"]))
+        assert len(calls) == 5
+        assert [c.args for c in formatters.call_args_list] == [("BTCUSDT",), ("ETHUSDT",)]
+        assert set(exchange._symbol_format_cache) == {"BTCUSDT", "ETHUSDT"}
+
+        results = []
+        exchange.fetchPositionTiersCached("BTCUSDT", results.append)
+        exchange.fetchLeverageAndMarginModeCached("ETHUSDT", "USDT", results.append)
+        assert len(calls) == 5
+        assert results == [("success", []), ("success", {"leverage": 5})]
+
+    def test_entries_expire(self):
+        """Test entries are dropped once their TTL has passed"""
+        from exchanges.utils.cache import TTLCache
+
+        cache = TTLCache(ttl=0.05)
+        cache.set("k", 1)
+        assert cache.get("k") == (True, 1)
+        time.sleep(0.06)
+        assert cache.get("k") == (False, None)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_failures_not_cached_and_invalidate(self):
+        """Test failures are refetched and invalidation drops entries"""
+        exchange = BitUnixExchange()
+        results = iter([("failure", Exception("x")), ("success", {"leverage": 5}),
+                        ("success", {"leverage": 10})])
+        exchange.fetchLeverageAndMarginMode = (
+            lambda symbol, marginCoin, completion: completion(next(results)))
+        out = []
+
+        exchange.fetchLeverageAndMarginModeCached("BTCUSDT", "USDT", out.append)
+        exchange.fetchLeverageAndMarginModeCached("BTCUSDT", "USDT", out.append)
+        exchange.fetchLeverageAndMarginModeCached("BTCUSDT", "USDT", out.append)
+        assert out[1:] == [("success", {"leverage": 5})] * 2
+
+        exchange._invalidate_on_success(
+            None, "fetchLeverageAndMarginMode", ("BTCUSDT", "USDT"))(("success", {}))
+        exchange.fetchLeverageAndMarginModeCached("BTCUSDT", "USDT", out.append)
+        assert out[-1] == ("success", {"leverage": 10})
+
+
+class TestSymbolPrecisionManager:
+    """Test precompiled order formatters"""
+
+    def test_order_formatters_rebuilt_on_update(self):
+        """Test formatters follow the symbol's precision info"""
+        manager = SymbolPrecisionManager("Test")
+        manager.update_symbol_info("BTCUSDT", {"quotePrecision": 1, "basePrecision": 3,
+                                               "minTradeVolume": "0.001"})
+        price_fmt, qty_fmt, min_volume = manager.get_order_formatters("BTCUSDT")
+        assert (price_fmt(50000.25), qty_fmt(0.5), min_volume) == ("50000.2", "0.500", 0.001)
+        assert manager.get_order_formatters("BTCUSDT")[0] is price_fmt
+
+        manager.update_symbol_info("BTCUSDT", {"quotePrecision": 2, "basePrecision": 3})
+        assert manager.get_order_formatters("BTCUSDT")[0](50000.25) == "50000.25"
+
+        manager.precision_cache["BTCUSDT"]["quotePrecision"] = 0
+        assert manager.get_price_precision("BTCUSDT") == 2
+        manager.invalidate_symbol("BTCUSDT")
+        assert manager.get_price_precision("BTCUSDT") == 0
+
+    def test_reloaded_cache_replaces_memoized_precision(self, tmp_path):
+        """Test reloading the cache file drops precision memoized from the old table"""
+        manager = SymbolPrecisionManager("Test")
+        manager.update_symbol_info("BTCUSDT", {"quotePrecision": 1, "basePrecision": 3})
+        assert manager.get_price_precision("BTCUSDT") == 1
+
+        manager.cache_path = str(tmp_path / "test_precision_cache.json")
+        with open(manager.cache_path, "w") as f:
+            json.dump({"symbols": {"BTCUSDT": {"quotePrecision": 4, "basePrecision": 3}}}, f)
+        manager._load_cache()
+        assert manager.get_price_precision("BTCUSDT") == 4
+
+
+class TestFeeMath:
+    """Test integer fee helpers"""
+
+    def test_fee_ppm_and_amount(self):
+        """Test fee rates convert to ppm and fee math is exact"""
+        assert ExchangeInterface.fee_rate_to_ppm(0.00016) == 160
+        assert ExchangeInterface.fee_rate_to_ppm(-0.00002) == -20
+        assert ExchangeInterface.fee_amount(1_000_000_000, 200) == 200_000
+
+    def test_fee_info_includes_ppm(self):
+        """Test fee info results carry integer ppm alongside decimals"""
+        exchange = BitUnixExchange()
+        results = []
+        exchange._with_fee_ppm(results.append)(
+            ("success", {"makerFee": 0.0002, "takerFee": 0.0006}))
+        assert results[0][1]["makerFeePpm"] == 200
+        assert results[0][1]["takerFeePpm"] == 600
+
+
+class TestTokenBucket:
+    """Test the order-entry rate limiter"""
+
+    def test_burst_then_refill(self):
+        """Test the bucket allows a burst and then refills over time"""
+        bucket = TokenBucket(rate=100, burst=2)
+        assert bucket.try_acquire()
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start < 0.5
+
+    def test_batch_larger_than_burst(self):
+        """Test a batch larger than the burst size is charged in full"""
+        bucket = TokenBucket(rate=100, burst=2)
+        bucket.acquire(5)
+        assert not bucket.try_acquire()
+
+
+class TestConstants:
+    """Test shared enum constants"""
+
+    def test_position_side_compares_to_strings(self):
+        """Test PositionSide members still equal their string values"""
+        assert PositionSide.LONG == "LONG"
+        assert "SHORT" == PositionSide.SHORT
+        assert "LONG" in [PositionSide.LONG, PositionSide.SHORT]
+        assert f"{PositionSide.LONG}" == "LONG"
+
+    def test_websocket_state_is_int(self):
+        """Test WebSocketState members are plain ints with readable names"""
+        assert WebSocketState.DISCONNECTED == 0
+        assert WebSocketState.CONNECTED < WebSocketState.AUTHENTICATED
+        assert WebSocketState.ERROR.name == "ERROR"
+
+
 if __name__ == "__main__":
     print("Run with pytest or use run_tests.py")
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""Tests for the pre-warmed WebSocket pool"""
+
+import time
+
+from exchanges.base import WebSocketState
+from exchanges.websocket_manager import BaseWebSocketManager, WebSocketPool
+
+
+class FakeWebSocketManager(BaseWebSocketManager):
+    """Manager that 'connects' instantly without touching the network"""
+
+    def __init__(self):
+        super().__init__(exchange_name="Fake")
+        self.sent = []
+
+    def connect(self, url, on_open=None, on_close=None) -> bool:
+        self._url = url
+        self._on_close_cb = on_close
+        self._set_state(WebSocketState.CONNECTED)
+        if on_open:
+            on_open(None)
+        return True
+
+    def disconnect(self):
+        self._set_state(WebSocketState.DISCONNECTED)
+
+    def drop(self):
+        """Simulate the server closing the connection"""
+        self._set_state(WebSocketState.DISCONNECTED)
+        self._on_close_cb(None, 1006, "dropped")
+
+    def _send_subscription_request(self, channels, subscribe) -> bool:
+        self.sent.append((channels, subscribe))
+        return True
+
+    def _process_message(self, message):
+        pass
+
+    def _send_heartbeat(self):
+        pass
+
+
+class TestWebSocketPool:
+    """Test WebSocketPool acquire/release and replacement"""
+
+    def test_start_prewarms_connections(self):
+        """Test all connections are opened and authenticated on start"""
+        authed = []
+        pool = WebSocketPool("wss://example", FakeWebSocketManager, size=3,
+                             auth_fn=lambda manager, ws: authed.append(manager))
+        pool.start()
+
+        assert len(pool._idle) == 3
+        assert len(authed) == 3
+        assert all(m.is_connected() for m in pool._idle)
+
+    def test_acquire_and_release(self):
+        """Test acquired connections are returned to the idle set"""
+        pool = WebSocketPool("wss://example", FakeWebSocketManager, size=1)
+        pool.start()
+
+        manager = pool.acquire(timeout=0.1)
+        assert manager is not None
+        assert manager.reconnect_config.enabled
+        assert pool.acquire(timeout=0.1) is None
+
+        manager.on_message = lambda msg: None
+        pool.release(manager)
+
+        assert manager.on_message is None
+        assert not manager.reconnect_config.enabled
+        assert pool.acquire(timeout=0.1) is manager
+
+    def test_dropped_idle_connection_is_replaced(self):
+        """Test the pool keeps its size when an idle connection drops"""
+        pool = WebSocketPool("wss://example", FakeWebSocketManager, size=2)
+        pool.start()
+
+        dropped = pool._idle[0]
+        dropped.drop()
+
+        deadline = time.time() + 2
+        while len(pool._idle) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert dropped not in pool._idle
+        assert len(pool._idle) == 2